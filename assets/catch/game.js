@@ -0,0 +1,443 @@
+(() => {
+  const cvs = document.getElementById("lcd");
+  const scoreEl = document.getElementById("score");
+  const livesEl = document.getElementById("lives");
+  const effectEl = document.getElementById("effect");
+  const themeEl = document.getElementById("themeName");
+  const fragEl = document.getElementById("fragments");
+  const missionEl = document.getElementById("missionText");
+  const comboFloatEl = document.getElementById("comboFloat");
+  const restartBtn = document.getElementById("restart");
+  const themeSelect = document.getElementById("themeSelect");
+  const CONFIG = window.GAME_CONFIG;
+  const WORKER_TIMEOUT = 3000; // ms to wait for the render worker before drawing on the page instead
+
+  // The simulation and canvas drawing live in sim.js. They run here on the page, or (renderWorker
+  // mode) in worker.js on an OffscreenCanvas, so host-page work cannot stall the game; the page
+  // then only forwards input and applies the view changes the worker syncs back.
+  const useWorker = Boolean(
+    CONFIG.renderWorker && window.GAME_WORKER && window.Worker && cvs.transferControlToOffscreen
+  );
+
+  const hud = {
+    score: bindText(scoreEl),
+    lives: bindText(livesEl),
+    effect: bindText(effectEl),
+    theme: bindText(themeEl),
+    fragments: bindText(fragEl, v => `${v}/${FRAGMENT_GOAL}`),
+    mission: bindText(missionEl, text => text || "---"),
+    combo: bindText(comboFloatEl),
+  };
+
+  // last view values synced from the simulation (BGM, input and reports read these)
+  const state = { score: 0, lives: 3, running: true, rainbow: false, theme: 0, selected: 0, unlocked: [0], quality: null, soak: null, replay: null, profile: null };
+
+  let unlocked = [0];
+  let selectedTheme = 0;
+  try {
+    const saved = JSON.parse(localStorage.getItem("gwUnlocked") || "[]");
+    unlocked = [...new Set([0, ...saved])];
+    const savedSel = Number(localStorage.getItem("gwThemeIdx"));
+    if (!Number.isNaN(savedSel) && unlocked.includes(savedSel)) selectedTheme = savedSel;
+  } catch (_) {}
+
+  // stored ghost as packed by encodeGhost(); old {t, x} JSON ghosts are converted once
+  function loadGhost() {
+    try {
+      const packed = localStorage.getItem("gwGhostBin");
+      if (packed) return packed;
+      const legacy = JSON.parse(localStorage.getItem("gwGhost") || "null");
+      if (legacy && legacy.samples && legacy.samples.length) {
+        const converted = encodeGhost(resampleLegacyGhost(legacy.samples), 0);
+        persist("gwGhostBin", converted);
+        persist("gwGhost", null);
+        return converted;
+      }
+    } catch (_) {}
+    return null;
+  }
+
+  function applyThemeStyle(theme) {
+    const root = document.documentElement;
+    root.style.setProperty("--bg", theme.bg);
+    root.style.setProperty("--frame", theme.frame);
+    root.style.setProperty("--lcd1", theme.lcd1);
+    root.style.setProperty("--lcd2", theme.lcd2);
+    root.style.setProperty("--pill-bg", theme.pillBg);
+    root.style.setProperty("--pill-border", theme.pillBorder);
+    root.style.setProperty("--pill-text", theme.pillText);
+    root.style.setProperty("--btn1", theme.btn1);
+    root.style.setProperty("--btn2", theme.btn2);
+    setText(hud.theme, theme.name);
+  }
+
+  function renderThemeSelect() {
+    themeSelect.innerHTML = "";
+    CATCH_THEMES.forEach((t, idx) => {
+      const opt = document.createElement("option");
+      const open = state.unlocked.includes(idx);
+      opt.value = idx;
+      opt.textContent = open ? t.name : `${t.name} (Locked)`;
+      opt.disabled = !open;
+      if (idx === state.selected) opt.selected = true;
+      themeSelect.appendChild(opt);
+    });
+  }
+
+  // state sent back to Python (GameBridge only exists inside the Streamlit component)
+  function reportState() {
+    if (!window.GameBridge) return;
+    const { score, lives, running, quality, soak, replay, profile } = state;
+    const daily = CONFIG.daily ? CONFIG.daily.date : null;
+    GameBridge.report({ score, lives, running, theme: CATCH_THEMES[state.theme].name, quality, daily, soak, replay, profile });
+  }
+
+  // view changes from the simulation, in-process or posted by the worker
+  function applySync(changes) {
+    Object.assign(state, changes);
+    // the BGM scheduler runs on the page: its timings join each profile the simulation sends
+    if (changes.profile && profiler) Object.assign(state.profile.phases, profiler.take().phases);
+    if ("score" in changes) setText(hud.score, changes.score);
+    if ("lives" in changes) setText(hud.lives, changes.lives);
+    if ("fragments" in changes) setText(hud.fragments, changes.fragments);
+    if ("mission" in changes) setText(hud.mission, changes.mission);
+    if ("combo" in changes) setText(hud.combo, changes.combo);
+    if ("effect" in changes) setText(hud.effect, changes.effect);
+    if ("theme" in changes) applyThemeStyle(CATCH_THEMES[changes.theme]);
+    if ("unlocked" in changes || "selected" in changes) renderThemeSelect();
+    if (changes.report) reportState();
+  }
+
+  function simOptions() {
+    return {
+      config: CONFIG,
+      theme: selectedTheme,
+      unlocked,
+      ghost: loadGhost(),
+      pixelRatio: window.devicePixelRatio || 1,
+    };
+  }
+
+  // game: the input surface of whichever side runs the simulation
+  let game = null;
+
+  function startOnPage() {
+    let sim = null;
+    const loop = createLoop(seconds => sim.frame(seconds), { target: cvs, onPause: pauseAudio, onResume: resumeAudio });
+    sim = createCatchSim(cvs, simOptions(), { sync: applySync, persist });
+    game = {
+      reset() { sim.reset(); loop.wake(); },
+      selectTheme(idx) { sim.selectTheme(idx); loop.wake(); }, // redraws a game-over screen too
+      setVelocity: vx => sim.setVelocity(vx),
+      dragStart: () => sim.dragStart(),
+      dragMove: dx => sim.dragMove(dx),
+      setPixelRatio(ratio) { sim.setPixelRatio(ratio); loop.wake(); },
+    };
+    loop.wake();
+  }
+
+  // The canvas is only transferred once the worker script has loaded, so a worker that fails to
+  // start (blocked, missing, slow) leaves an untouched canvas for startOnPage().
+  function startWorker() {
+    const worker = new Worker(window.GAME_WORKER);
+    const send = (type, data) => worker.postMessage(Object.assign({ type }, data));
+    let started = false;
+    const fallback = () => {
+      if (started) return;
+      started = true;
+      worker.terminate();
+      startOnPage();
+    };
+    const timer = setTimeout(fallback, WORKER_TIMEOUT);
+    worker.addEventListener("error", fallback);
+    worker.addEventListener("message", ({ data }) => {
+      if (data.type === "ready" && !started) {
+        started = true;
+        clearTimeout(timer);
+        const canvas = cvs.transferControlToOffscreen();
+        worker.postMessage({ type: "init", canvas, options: simOptions() }, [canvas]);
+      } else if (data.type === "sync") {
+        applySync(data.changes);
+      } else if (data.type === "persist") {
+        persist(data.key, data.value);
+      }
+    });
+    watchActive(cvs, active => {
+      send(active ? "resume" : "pause");
+      if (active) resumeAudio();
+      else pauseAudio();
+    });
+    game = {
+      reset: () => send("reset"),
+      selectTheme: index => send("theme", { index }),
+      setVelocity: vx => send("velocity", { vx }),
+      dragStart: () => send("dragStart"),
+      dragMove: dx => send("dragMove", { dx }),
+      setPixelRatio: ratio => send("pixelRatio", { ratio }),
+    };
+  }
+
+  // re-rasterise when the page moves to a screen with a different devicePixelRatio
+  function watchPixelRatio() {
+    if (!window.matchMedia) return;
+    const query = matchMedia(`(resolution: ${window.devicePixelRatio || 1}dppx)`);
+    query.addEventListener("change", () => {
+      game.setPixelRatio(window.devicePixelRatio || 1);
+      watchPixelRatio();
+    }, { once: true });
+  }
+
+  let audioCtx = null;
+  let bgmInterval = null;
+  let bgmSchedule = null;
+  const profiler = CONFIG.profile ? createProfiler() : null;
+
+  const LOOKAHEAD = 0.2; // seconds of notes queued ahead of audioCtx.currentTime
+  const SCHEDULE_EVERY = 50; // ms between scheduler wake-ups
+  const BEAT = 0.52; // seconds per step at base tempo
+
+  // Fixed voice pool: each voice is one oscillator + envelope that runs for the page's lifetime;
+  // notes only automate its frequency and gain, so playing music creates no audio nodes.
+  function createVoices(types, bus) {
+    const voices = types.map(type => {
+      const osc = audioCtx.createOscillator();
+      const env = audioCtx.createGain();
+      osc.type = type;
+      env.gain.value = 0;
+      osc.connect(env);
+      env.connect(bus);
+      osc.start();
+      return { osc, env };
+    });
+    return { voices, next: 0 };
+  }
+
+  function playVoice(voice, freq, at, length, volume) {
+    const g = voice.env.gain;
+    voice.osc.frequency.setValueAtTime(freq, at);
+    g.cancelScheduledValues(at);
+    g.setValueAtTime(0, at);
+    g.linearRampToValueAtTime(volume, at + 0.02);
+    g.exponentialRampToValueAtTime(0.001, at + length);
+    g.setValueAtTime(0, at + length + 0.02);
+  }
+
+  // round-robin so a note's release tail is never cut by the next note on the same layer
+  function play(bank, freq, at, length, volume) {
+    playVoice(bank.voices[bank.next], freq, at, length, volume);
+    bank.next = (bank.next + 1) % bank.voices.length;
+  }
+
+  function startBGM() {
+    if (audioCtx) {
+      if (!bgmInterval) resumeAudio();
+      else if (audioCtx.state === "suspended") audioCtx.resume();
+      return;
+    }
+    audioCtx = new AudioContext();
+    const master = audioCtx.createGain();
+    master.gain.value = 0.07;
+    master.connect(audioCtx.destination);
+    const leadGain = audioCtx.createGain(); leadGain.gain.value = 1.0; leadGain.connect(master);
+    const bassGain = audioCtx.createGain(); bassGain.gain.value = 0.6; bassGain.connect(master);
+    const hatGain = audioCtx.createGain(); hatGain.gain.value = 0.35; hatGain.connect(master);
+    const padGain = audioCtx.createGain(); padGain.gain.value = 0.3; padGain.connect(master);
+
+    const lead = createVoices(["square", "square"], leadGain);
+    const sparkle = createVoices(["triangle", "triangle"], leadGain);
+    const bass = createVoices(["triangle", "triangle"], bassGain);
+    const hat = createVoices(["sawtooth", "sawtooth"], hatGain);
+    const pad = createVoices(["triangle", "sine", "triangle"], padGain);
+
+    const chords = [
+      [196, 247, 294], // Gm-ish
+      [220, 262, 330], // A sus
+      [174, 220, 262], // F-ish
+      [247, 311, 370], // Bdim-ish
+    ];
+    const leadLines = chords.map(chord => [...chord, chord[0] * 2]);
+
+    let step = 0;
+    let beat = BEAT;
+    let nextNoteTime = audioCtx.currentTime + 0.05;
+
+    function scheduleStep(at) {
+      if (step % 4 === 0) {
+        // tempo follows the score, but only changes on a bar boundary
+        const bpmAdjust = state.score >= 300 ? 0.75 : state.score >= 150 ? 0.85 : 1.0;
+        beat = BEAT * bpmAdjust;
+      }
+      const chord = chords[step % chords.length];
+      const leadNotes = leadLines[step % chords.length];
+      play(lead, leadNotes[(step * 2) % leadNotes.length], at, 0.35, 0.32);
+      if (step % 2 === 0) play(bass, chord[0] / 2, at, 0.6, 0.28);
+      play(hat, 820 + Math.random() * 120, at, 0.08, 0.15);
+      if (step % 4 === 0) chord.forEach((f, i) => playVoice(pad.voices[i], f, at, 0.9, 0.15));
+      if (state.rainbow) play(sparkle, 1200 + Math.random() * 200, at, 0.18, 0.22);
+      step++;
+    }
+
+    function scheduleAhead() {
+      const now = audioCtx.currentTime;
+      if (nextNoteTime < now) nextNoteTime = now + 0.05; // timer was throttled: skip, don't burst
+      while (nextNoteTime < now + LOOKAHEAD) {
+        scheduleStep(nextNoteTime);
+        nextNoteTime += beat;
+      }
+    }
+
+    bgmSchedule = profiler ? profiler.wrap("bgm", scheduleAhead) : scheduleAhead;
+    bgmInterval = setInterval(bgmSchedule, SCHEDULE_EVERY);
+    bgmSchedule();
+  }
+
+  // hidden / scrolled-away page: stop the scheduler timer and the audio clock together
+  function pauseAudio() {
+    if (!audioCtx) return;
+    clearInterval(bgmInterval);
+    bgmInterval = null;
+    audioCtx.suspend();
+  }
+
+  function resumeAudio() {
+    if (!audioCtx || bgmInterval) return;
+    audioCtx.resume();
+    bgmInterval = setInterval(bgmSchedule, SCHEDULE_EVERY);
+  }
+
+  function ensureAudio() {
+    startBGM();
+  }
+
+  const pressed = new Set();
+  function updateVel() {
+    if (pressed.has("L") && !pressed.has("R")) game.setVelocity(-120);
+    else if (pressed.has("R") && !pressed.has("L")) game.setVelocity(120);
+    else game.setVelocity(0);
+  }
+
+  document.addEventListener("keydown", e => {
+    if (e.code === "ArrowLeft" || e.code === "KeyA") pressed.add("L");
+    if (e.code === "ArrowRight" || e.code === "KeyD") pressed.add("R");
+    if (!state.running && (e.code === "Enter" || e.code === "Space")) game.reset();
+    ensureAudio();
+    updateVel();
+  });
+  document.addEventListener("keyup", e => {
+    if (e.code === "ArrowLeft" || e.code === "KeyA") pressed.delete("L");
+    if (e.code === "ArrowRight" || e.code === "KeyD") pressed.delete("R");
+    updateVel();
+  });
+
+  themeSelect.addEventListener("change", e => {
+    const idx = Number(e.target.value);
+    if (state.unlocked.includes(idx)) game.selectTheme(idx);
+  });
+
+  const leftBtn = document.createElement("button");
+  const rightBtn = document.createElement("button");
+  leftBtn.textContent = "Left";
+  rightBtn.textContent = "Right";
+  [leftBtn, rightBtn].forEach(btn => {
+    btn.className = "btn";
+    btn.style.width = "86px";
+    btn.style.margin = "4px";
+  });
+  const mobileBar = document.createElement("div");
+  mobileBar.style.display = "flex";
+  mobileBar.style.flexDirection = "column";
+  mobileBar.style.alignItems = "center";
+  mobileBar.style.gap = "10px";
+  mobileBar.style.marginTop = "8px";
+  mobileBar.style.marginBottom = "16px";
+  mobileBar.style.width = "100%";
+  mobileBar.style.maxWidth = "480px";
+  const btnRow = document.createElement("div");
+  btnRow.style.display = "flex";
+  btnRow.style.gap = "10px";
+  btnRow.style.justifyContent = "center";
+  btnRow.appendChild(leftBtn);
+  btnRow.appendChild(rightBtn);
+  mobileBar.appendChild(btnRow);
+  document.getElementById("wrap").appendChild(mobileBar);
+
+  leftBtn.addEventListener("pointerdown", () => { pressed.add("L"); ensureAudio(); updateVel(); });
+  rightBtn.addEventListener("pointerdown", () => { pressed.add("R"); ensureAudio(); updateVel(); });
+  leftBtn.addEventListener("pointerup", () => { pressed.delete("L"); updateVel(); });
+  rightBtn.addEventListener("pointerup", () => { pressed.delete("R"); updateVel(); });
+
+  // mobile: swipe to move (tap alone does not move)
+  let dragActive = false;
+  let dragStartX = 0;
+  cvs.addEventListener("pointerdown", e => {
+    dragActive = true;
+    dragStartX = e.clientX;
+    game.dragStart();
+    ensureAudio();
+  });
+  cvs.addEventListener("pointermove", e => {
+    if (!dragActive) return;
+    game.dragMove(e.clientX - dragStartX);
+  });
+  cvs.addEventListener("pointerup", () => { dragActive = false; });
+  cvs.addEventListener("pointerleave", () => { dragActive = false; });
+
+  // pseudo joystick (mobile friendly)
+  const joyWrap = document.createElement("div");
+  joyWrap.className = "joy-wrap";
+  const joyKnob = document.createElement("div");
+  joyKnob.className = "joy-knob";
+  joyWrap.appendChild(joyKnob);
+  const joyLabel = document.createElement("div");
+  joyLabel.textContent = "Joystick";
+  joyLabel.style.color = "#e5e7eb";
+  joyLabel.style.fontSize = "12px";
+  joyLabel.style.textAlign = "center";
+  joyLabel.style.width = "110px";
+  joyLabel.style.marginBottom = "4px";
+  const joyColumn = document.createElement("div");
+  joyColumn.style.display = "flex";
+  joyColumn.style.flexDirection = "column";
+  joyColumn.style.alignItems = "center";
+  joyColumn.appendChild(joyLabel);
+  joyColumn.appendChild(joyWrap);
+  mobileBar.appendChild(joyColumn);
+  let joyActive = false;
+  let joyCenter = { x: 0, y: 0 };
+  function setJoyPos(dx, dy) {
+    const radius = 35;
+    const len = Math.hypot(dx, dy);
+    const scale = len > radius ? radius / len : 1;
+    joyKnob.style.left = `${34 + dx * scale}px`;
+    joyKnob.style.top = `${34 + dy * scale}px`;
+  }
+  function joyStart(e) {
+    joyActive = true;
+    const rect = joyWrap.getBoundingClientRect();
+    joyCenter = { x: rect.left + rect.width / 2, y: rect.top + rect.height / 2 };
+    joyMove(e);
+  }
+  function joyMove(e) {
+    if (!joyActive) return;
+    const dx = e.clientX - joyCenter.x;
+    const dy = e.clientY - joyCenter.y;
+    setJoyPos(dx, dy);
+    const normX = Math.max(-1, Math.min(1, dx / 35));
+    game.setVelocity(normX * 140);
+  }
+  function joyEnd() {
+    joyActive = false;
+    setJoyPos(0, 0);
+    game.setVelocity(0);
+  }
+  joyWrap.addEventListener("pointerdown", e => { ensureAudio(); joyStart(e); });
+  joyWrap.addEventListener("pointermove", joyMove);
+  joyWrap.addEventListener("pointerup", joyEnd);
+  joyWrap.addEventListener("pointerleave", joyEnd);
+
+  restartBtn.addEventListener("click", () => { ensureAudio(); game.reset(); });
+
+  if (useWorker) startWorker();
+  else startOnPage();
+  watchPixelRatio();
+})();
@@ -0,0 +1,962 @@
+// Catch-game simulation and renderer. Nothing in here touches the DOM, so the same code runs on
+// the page (game.js) or in the render worker (worker.js) against an OffscreenCanvas.
+// createCatchSim(canvas, options, host) talks back only through the host:
+//   host.sync(changes)       view fields that changed since the last call (HUD values, theme,
+//                            unlocked themes, running, quality, soak; report: true asks for a
+//                            state report)
+//   host.persist(key, value) queue a storage write (null removes the key)
+// and returns the input / frame API used by the page or the worker.
+
+const CATCH_THEMES = [
+  {
+    name: "Classic Mint",
+    bg: "#0f172a", frame: "#0a1a30", lcd1: "#eefbe4", lcd2: "#cfe6bc",
+    grid: "#b9d7a0", ground: "#a6c48a",
+    gemEdge: "#0f3c5c", gemTop: "#33bef2", gemBottom: "#0d74c4",
+    playerDark: "#0b4f1f", playerLight: "#0e6f2b",
+    pillBg: "#1f2937", pillBorder: "#233044", pillText: "#cbd5e1",
+    btn1: "#2bc0ff", btn2: "#178adf", spark: "#fbbf24",
+  },
+  {
+    name: "Sunset Amber",
+    bg: "#1f0f1c", frame: "#3f1f33", lcd1: "#fef3c7", lcd2: "#fcd34d",
+    grid: "#f59e0b", ground: "#f97316",
+    gemEdge: "#7c2d12", gemTop: "#fb923c", gemBottom: "#ea580c",
+    playerDark: "#7c3aed", playerLight: "#a855f7",
+    pillBg: "#2b1b29", pillBorder: "#4b2e3f", pillText: "#fde68a",
+    btn1: "#fb7185", btn2: "#ec4899", spark: "#fcd34d",
+  },
+  {
+    name: "Deep Ocean",
+    bg: "#0b1222", frame: "#0f1f3a", lcd1: "#dbeafe", lcd2: "#93c5fd",
+    grid: "#60a5fa", ground: "#3b82f6",
+    gemEdge: "#0f172a", gemTop: "#38bdf8", gemBottom: "#0ea5e9",
+    playerDark: "#0b4f1f", playerLight: "#34d399",
+    pillBg: "#0f172a", pillBorder: "#1e293b", pillText: "#c7d2fe",
+    btn1: "#22d3ee", btn2: "#0ea5e9", spark: "#a5b4fc",
+  },
+];
+
+const FRAGMENT_GOAL = 3;
+
+// Ghost format v1 (little-endian, base64 in localStorage "gwGhostBin"; mirrored by ghost_codec.py):
+// u8 version, u8 scale, u16 count, f32 interval (s), u32 score, then count Int16 deltas of
+// round(x * scale). Sample i is the paddle x at t = i * interval.
+const GHOST_VERSION = 1;
+const GHOST_SCALE = 16;
+const GHOST_HEADER = 12;
+const GHOST_INTERVAL = 0.1;
+const GHOST_MAX_SAMPLES = 2048;
+
+
+function encodeGhost(ghost, runScore) {
+  const view = new DataView(new ArrayBuffer(GHOST_HEADER + ghost.count * 2));
+  view.setUint8(0, GHOST_VERSION);
+  view.setUint8(1, GHOST_SCALE);
+  view.setUint16(2, ghost.count, true);
+  view.setFloat32(4, ghost.interval, true);
+  view.setUint32(8, runScore, true);
+  let prev = 0;
+  for (let i = 0; i < ghost.count; i++) {
+    const q = Math.round(ghost.xs[i] * GHOST_SCALE);
+    view.setInt16(GHOST_HEADER + i * 2, q - prev, true);
+    prev = q;
+  }
+  const bytes = new Uint8Array(view.buffer);
+  let bin = "";
+  for (let i = 0; i < bytes.length; i++) bin += String.fromCharCode(bytes[i]);
+  return btoa(bin);
+}
+
+function decodeGhost(packed) {
+  const bin = atob(packed);
+  if (bin.length < GHOST_HEADER) return null;
+  const bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  const view = new DataView(bytes.buffer);
+  if (view.getUint8(0) !== GHOST_VERSION) return null;
+  const scale = view.getUint8(1);
+  const count = view.getUint16(2, true);
+  if (count === 0 || bytes.length < GHOST_HEADER + count * 2) return null;
+  const xs = new Float32Array(count);
+  let q = 0;
+  for (let i = 0; i < count; i++) {
+    q += view.getInt16(GHOST_HEADER + i * 2, true);
+    xs[i] = q / scale;
+  }
+  return { xs, count, interval: view.getFloat32(4, true), score: view.getUint32(8, true) };
+}
+
+// one pass over the old {t, x} JSON samples onto the fixed-interval grid
+function resampleLegacyGhost(samples) {
+  let interval = GHOST_INTERVAL;
+  let count = Math.floor(samples[samples.length - 1].t / interval) + 1;
+  while (count > GHOST_MAX_SAMPLES) {
+    interval *= 2;
+    count = Math.floor(samples[samples.length - 1].t / interval) + 1;
+  }
+  const xs = new Float32Array(count);
+  let cursor = 0;
+  for (let i = 0; i < count; i++) {
+    while (cursor < samples.length - 1 && samples[cursor].t < i * interval) cursor++;
+    xs[i] = samples[cursor].x;
+  }
+  return { xs, count, interval, score: 0 };
+}
+
+// Daily challenge schedule (GAME_CONFIG.daily, built by daily_challenge.py), base64 fields:
+//   spawns   u16 LE per drop: x * 8 + kind (x in whole px, kind as in KINDS)
+//   gusts    2 bytes per gust: i8 wind, u8 tenths of a second until the next gust
+//   missions u8 per mission: index into the mission types
+function decodeDailyCatch(daily) {
+  const spawns = base64Bytes(daily.spawns);
+  const gusts = base64Bytes(daily.gusts);
+  const n = spawns.length >> 1;
+  const spawnX = new Float64Array(n);
+  const spawnKind = new Uint8Array(n);
+  for (let i = 0; i < n; i++) {
+    const v = spawns[2 * i] | (spawns[2 * i + 1] << 8);
+    spawnX[i] = v >> 3;
+    spawnKind[i] = v & 7;
+  }
+  const windAt = new Float64Array(gusts.length >> 1);
+  const gapAt = new Float64Array(gusts.length >> 1);
+  for (let i = 0; i < windAt.length; i++) {
+    windAt[i] = (gusts[2 * i] << 24) >> 24;
+    gapAt[i] = gusts[2 * i + 1] / 10;
+  }
+  return { date: daily.date, seed: daily.seed, spawnX, spawnKind, windAt, gapAt, missions: base64Bytes(daily.missions) };
+}
+
+function createCatchSim(canvas, options, host) {
+  const ctx = canvas.getContext("2d");
+  const CONFIG = options.config;
+  const TICK = 1 / CONFIG.tickRate;
+  const MAX_FRAME = 0.25; // longest wall-clock gap fed to the accumulator
+  const HUD_INTERVAL = 1000 / CONFIG.hudRate;
+  // logical playfield size; the backing store is this times the quality level's pixel scale
+  const WIDTH = canvas.width;
+  const HEIGHT = canvas.height;
+  const themes = CATCH_THEMES;
+
+  const unlocked = new Set([0, ...options.unlocked]);
+  let selectedTheme = options.theme;
+  let themeIndex = selectedTheme;
+  let themeColors = null;
+  let fragments = 0;
+  let comboCount = 0;
+  let pixelRatio = options.pixelRatio;
+
+  // Every gameplay draw comes from mulberry32(runSeed), a fresh seed per run, so a run is a pure
+  // function of its seed and the input log (replay_verifier.py re-simulates it with catch_engine).
+  // Daily challenge: drops, gusts and missions are taken in order from the day's schedule and the
+  // run seed is the day's, so every run of the day is the same for the same inputs. A list that
+  // runs out falls back to the seeded draws.
+  // Sparks (and the page's hi-hat) stay on Math.random: they never affect play.
+  const daily = CONFIG.daily ? decodeDailyCatch(CONFIG.daily) : null;
+  let random = Math.random;
+  let runSeed = 0;
+  let runTicks = 0;
+  const inputLog = createInputLog();
+  let nextSpawn = 0;
+  let nextGust = 0;
+  let nextMission = 0;
+
+  const DROP_SIZE = 12;
+  const DROP_CAPACITY = 256; // initial size: drops grow past it, as catch_engine's list has no cap
+  const SPARK_CAPACITY = 384; // hard cap: sparks never affect play
+  const KINDS = ["normal", "slow", "fever", "magnet", "reflector", "rainbow"];
+  const KIND_NORMAL = 0;
+
+  // Struct-of-arrays entity pool: preallocated typed arrays, swap-remove. A growable pool doubles
+  // when full; otherwise adds past capacity are dropped.
+  const POOL_FIELDS = ["x", "y", "vx", "vy", "px", "py", "life", "kind"];
+
+  function createPool(capacity, growable = false) {
+    return {
+      capacity,
+      growable,
+      count: 0,
+      x: new Float64Array(capacity),
+      y: new Float64Array(capacity),
+      vx: new Float64Array(capacity),
+      vy: new Float64Array(capacity),
+      px: new Float64Array(capacity),
+      py: new Float64Array(capacity),
+      life: new Float64Array(capacity),
+      kind: new Uint8Array(capacity),
+    };
+  }
+
+  function growPool(pool) {
+    pool.capacity *= 2;
+    for (const f of POOL_FIELDS) {
+      const grown = new pool[f].constructor(pool.capacity);
+      grown.set(pool[f]);
+      pool[f] = grown;
+    }
+  }
+
+  function poolAdd(pool, x, y, vx, vy, kind, life) {
+    if (pool.count === pool.capacity) {
+      if (!pool.growable) return -1;
+      growPool(pool);
+    }
+    const i = pool.count++;
+    pool.x[i] = x; pool.y[i] = y;
+    pool.px[i] = x; pool.py[i] = y;
+    pool.vx[i] = vx; pool.vy[i] = vy;
+    pool.kind[i] = kind; pool.life[i] = life;
+    return i;
+  }
+
+  // O(1) removal: the last live slot is moved into i (order is not preserved)
+  function poolRemove(pool, i) {
+    const j = --pool.count;
+    if (i === j) return;
+    pool.x[i] = pool.x[j]; pool.y[i] = pool.y[j];
+    pool.px[i] = pool.px[j]; pool.py[i] = pool.py[j];
+    pool.vx[i] = pool.vx[j]; pool.vy[i] = pool.vy[j];
+    pool.kind[i] = pool.kind[j]; pool.life[i] = pool.life[j];
+  }
+
+  const drops = createPool(DROP_CAPACITY, true); // a dropped spawn would break replay verification
+  const sparks = createPool(SPARK_CAPACITY);
+  let player, score, lives, running, speedBase, spawnBase, spawnTimer;
+  let simTime = 0; // seconds of simulated play, advanced only by step()
+  let accumulator = 0;
+  let effects = { slow: 0, fever: 0, rainbow: 0, magnet: 0, reflector: 0, shield: 0 };
+  let chainStage = 0; // 0 none, 1 slow, chain to fever -> rainbow
+  let wind = 0;
+  let windTimer = 0;
+  const windLockout = 15.0; // first 15s no wind
+  let floorPhase = 0;
+
+  let mission = null;
+  let lastMissTime = 0;
+  let missionTimer = 0;
+
+  let ghostData = null;
+  try {
+    if (options.ghost) ghostData = decodeGhost(options.ghost);
+  } catch (_) {}
+  const ghostRec = { xs: new Float32Array(GHOST_MAX_SAMPLES), count: 0, interval: GHOST_INTERVAL };
+
+  // View state mirrored to the host: show() records a field when its value changed, and the
+  // collected changes go out in one host.sync() per frame (or per input that changes them).
+  const view = {};
+  let changes = null;
+  let effectMask = -1;
+  let effectShownAt = 0;
+
+  function show(field, value) {
+    if (view[field] === value) return;
+    view[field] = value;
+    (changes || (changes = {}))[field] = value;
+  }
+
+  function push(field, value) {
+    (changes || (changes = {}))[field] = value;
+  }
+
+  function flushView() {
+    if (!changes) return;
+    const batch = changes;
+    changes = null;
+    host.sync(batch);
+  }
+
+  function ghostBeats(runScore, duration, best) {
+    if (!best) return true;
+    if (CONFIG.ghostCriterion === "always") return true;
+    if (CONFIG.ghostCriterion === "duration") return duration > best.count * best.interval;
+    return runScore > best.score;
+  }
+
+  // called once on the running -> game over transition
+  function finishRun() {
+    if (soak) {
+      push("soak", soak.runEnded());
+      restartIn = AUTOPLAY_RESTART;
+    }
+    push("quality", qualityStats());
+    push("replay", inputLog.encode(0, CONFIG.tickRate, runSeed, runTicks, score, daily && daily.date));
+    push("report", true);
+    if (ghostRec.count <= 10) return;
+    if (!ghostBeats(score, ghostRec.count * ghostRec.interval, ghostData)) return;
+    ghostData = { xs: ghostRec.xs.slice(0, ghostRec.count), count: ghostRec.count, interval: ghostRec.interval, score };
+    host.persist("gwGhostBin", encodeGhost(ghostRec, score));
+  }
+
+  function recordGhost() {
+    if (simTime < ghostRec.count * ghostRec.interval) return;
+    if (ghostRec.count === GHOST_MAX_SAMPLES) {
+      // long run: keep every other sample at twice the interval, in place
+      const half = GHOST_MAX_SAMPLES >> 1;
+      for (let i = 0; i < half; i++) ghostRec.xs[i] = ghostRec.xs[i * 2];
+      ghostRec.count = half;
+      ghostRec.interval *= 2;
+    }
+    ghostRec.xs[ghostRec.count++] = player.x;
+  }
+
+  // O(1): the fixed sample grid turns the playback cursor into a direct index
+  function ghostX(ghost, t) {
+    const f = t / ghost.interval;
+    const i = Math.floor(f);
+    if (i >= ghost.count - 1) return ghost.xs[ghost.count - 1];
+    return lerp(ghost.xs[i], ghost.xs[i + 1], f - i);
+  }
+
+  // Adaptive quality: each level gives up one more detail, cheapest losses first. pixelScale is
+  // the backing-store resolution (devicePixelRatio, capped by the level's maxScale).
+  const QUALITY_LEVELS = [
+    { name: "high", sparks: true, shading: true, grid: true, maxScale: 2 },
+    { name: "no-sparks", sparks: false, shading: true, grid: true, maxScale: 2 },
+    { name: "flat", sparks: false, shading: false, grid: true, maxScale: 2 },
+    { name: "no-grid", sparks: false, shading: false, grid: false, maxScale: 2 },
+    { name: "low-res", sparks: false, shading: false, grid: false, maxScale: 1 },
+  ];
+  const FRAME_BUDGET = CONFIG.frameBudgetMs; // rolling mean frame cost above this steps quality down
+  const QUALITY_WINDOW = 60; // frames per evaluation
+  const RECOVER_WINDOWS = 4; // consecutive windows under RECOVER_RATIO * budget before stepping up
+  const RECOVER_RATIO = 0.7;
+  const frameTimes = new Float64Array(QUALITY_WINDOW);
+  const sortedTimes = new Float64Array(QUALITY_WINDOW);
+  let frameCount = 0;
+  let fastWindows = 0;
+  let qualityLevel = 0;
+  let quality = QUALITY_LEVELS[0];
+  let pixelScale = 1;
+  const frameStats = { mean: 0, p95: 0, worst: 0 };
+
+  function applyQuality(level) {
+    qualityLevel = level;
+    quality = QUALITY_LEVELS[level];
+    pixelScale = Math.min(pixelRatio, quality.maxScale);
+    const w = Math.round(WIDTH * pixelScale), h = Math.round(HEIGHT * pixelScale);
+    if (canvas.width !== w || canvas.height !== h) {
+      canvas.width = w; // resizing clears the canvas; the next draw() restores the transform
+      canvas.height = h;
+    }
+    applyTheme(themeIndex);
+  }
+
+  // ms of work per display frame (simulate + HUD + draw), fed by frame(); not the rAF interval, which a
+  // 30 Hz display or a throttled tab stretches whatever the quality. Summarised every QUALITY_WINDOW frames.
+  function sampleFrame(ms) {
+    frameTimes[frameCount++] = ms;
+    if (frameCount < QUALITY_WINDOW) return;
+    frameCount = 0;
+    const sorted = sortedTimes;
+    sorted.set(frameTimes);
+    sorted.sort();
+    let sum = 0;
+    for (let i = 0; i < QUALITY_WINDOW; i++) sum += sorted[i];
+    frameStats.mean = sum / QUALITY_WINDOW;
+    frameStats.p95 = sorted[Math.floor(QUALITY_WINDOW * 0.95)];
+    frameStats.worst = sorted[QUALITY_WINDOW - 1];
+    if (frameStats.mean > FRAME_BUDGET && qualityLevel < QUALITY_LEVELS.length - 1) {
+      fastWindows = 0;
+      applyQuality(qualityLevel + 1);
+      push("quality", qualityStats());
+      push("report", true);
+    } else if (frameStats.mean < FRAME_BUDGET * RECOVER_RATIO && qualityLevel > 0) {
+      if (++fastWindows < RECOVER_WINDOWS) return;
+      fastWindows = 0;
+      applyQuality(qualityLevel - 1);
+      push("quality", qualityStats());
+      push("report", true);
+    } else {
+      fastWindows = 0;
+    }
+  }
+
+  function qualityStats() {
+    return {
+      level: qualityLevel,
+      name: quality.name,
+      pixelScale,
+      frameMs: Math.round(frameStats.mean * 10) / 10,
+      p95Ms: Math.round(frameStats.p95 * 10) / 10,
+      worstMs: Math.round(frameStats.worst * 10) / 10,
+    };
+  }
+
+  function makeLayer(w, h) {
+    if (typeof OffscreenCanvas !== "undefined") return new OffscreenCanvas(w, h);
+    const layer = canvas.ownerDocument.createElement("canvas"); // page without OffscreenCanvas
+    layer.width = w;
+    layer.height = h;
+    return layer;
+  }
+
+  // Layers rasterised once per theme and quality: the static gradient, the grid + ground that
+  // only ever slide sideways by the floor drift, and the gem atlas (one cell per drop kind).
+  // They are drawn at the backing-store scale and blitted at logical size.
+  const layerCache = new Map();
+  let layers = null;
+  const GEM_CELL = 14; // 12 px gem plus its 1 px edge on each side
+  const GEM_TAILS = { slow: "#38bdf8", fever: "#f59e0b", magnet: "#f43f5e", reflector: "#a3e635" };
+  const RAINBOW_STOPS = ["#f87171", "#facc15", "#4ade80", "#60a5fa", "#c084fc"];
+
+  function buildBackground(theme, scale) {
+    const base = makeLayer(WIDTH * scale, HEIGHT * scale);
+    const bctx = base.getContext("2d");
+    bctx.scale(scale, scale);
+    const g = bctx.createLinearGradient(0, 0, 0, HEIGHT);
+    g.addColorStop(0, theme.lcd1);
+    g.addColorStop(1, theme.lcd2);
+    bctx.fillStyle = g;
+    bctx.fillRect(0, 0, WIDTH, HEIGHT);
+
+    const floor = makeLayer(WIDTH * scale, HEIGHT * scale);
+    const fctx = floor.getContext("2d");
+    fctx.scale(scale, scale);
+    if (quality.grid) {
+      fctx.fillStyle = theme.grid;
+      for (let y = 0; y < HEIGHT; y += 24) {
+        fctx.fillRect(0, y, WIDTH, 1);
+      }
+    }
+    fctx.fillStyle = theme.ground;
+    fctx.fillRect(0, HEIGHT - 38, WIDTH, 38);
+    return { base, floor };
+  }
+
+  function buildGemAtlas(theme, scale) {
+    const atlas = makeLayer(GEM_CELL * KINDS.length * scale, GEM_CELL * scale);
+    const actx = atlas.getContext("2d");
+    actx.scale(scale, scale);
+    KINDS.forEach((kind, i) => {
+      const ox = i * GEM_CELL + 1;
+      const isSpecial = kind !== "normal";
+      actx.fillStyle = isSpecial ? "#6b21a8" : theme.gemEdge;
+      actx.fillRect(ox - 1, 0, DROP_SIZE + 2, DROP_SIZE + 2);
+      if (!quality.shading) {
+        actx.fillStyle = kind === "rainbow" ? RAINBOW_STOPS[0] : isSpecial ? GEM_TAILS[kind] : theme.gemTop;
+        actx.fillRect(ox, 1, DROP_SIZE, DROP_SIZE);
+        return;
+      }
+      const gem = actx.createLinearGradient(ox, 1, ox + DROP_SIZE, 1 + DROP_SIZE);
+      if (kind === "rainbow") {
+        RAINBOW_STOPS.forEach((c, j) => gem.addColorStop(j / (RAINBOW_STOPS.length - 1), c));
+      } else if (isSpecial) {
+        gem.addColorStop(0, "#e879f9");
+        gem.addColorStop(1, GEM_TAILS[kind]);
+      } else {
+        gem.addColorStop(0, theme.gemTop);
+        gem.addColorStop(1, theme.gemBottom);
+      }
+      actx.fillStyle = gem;
+      actx.fillRect(ox, 1, DROP_SIZE, DROP_SIZE);
+      actx.fillStyle = "rgba(255,255,255,0.35)";
+      actx.fillRect(ox + 2, 3, DROP_SIZE / 2, DROP_SIZE / 2);
+    });
+    return atlas;
+  }
+
+  function applyTheme(index) {
+    themeIndex = index;
+    themeColors = themes[index];
+    const key = `${themeColors.name}/${quality.name}/${pixelScale}`;
+    if (!layerCache.has(key)) {
+      layerCache.set(key, {
+        ...buildBackground(themeColors, pixelScale),
+        gems: buildGemAtlas(themeColors, pixelScale),
+        scale: pixelScale,
+      });
+    }
+    layers = layerCache.get(key);
+    show("theme", index);
+  }
+
+  function unlockTheme(idx) {
+    unlocked.add(idx);
+    host.persist("gwUnlocked", JSON.stringify([...unlocked]));
+    push("unlocked", [...unlocked]);
+  }
+
+  function reset() {
+    runSeed = daily ? daily.seed : Math.floor(Math.random() * 4294967296);
+    random = mulberry32(runSeed);
+    nextSpawn = nextGust = nextMission = 0;
+    runTicks = 0;
+    inputLog.clear();
+    player = { x: WIDTH / 2 - 18, y: HEIGHT - 54, w: 36, h: 16, vx: 0, px: WIDTH / 2 - 18 };
+    drops.count = 0;
+    sparks.count = 0;
+    score = 0;
+    lives = 3;
+    speedBase = 28;
+    spawnBase = 3.0;
+    spawnTimer = 0.2;
+    running = true;
+    simTime = 0;
+    accumulator = 0;
+    effects = { slow: 0, fever: 0, rainbow: 0, magnet: 0, reflector: 0, shield: 0 };
+    chainStage = 0;
+    fragments = 0;
+    comboCount = 0;
+    applyTheme(selectedTheme);
+    wind = 0;
+    windTimer = 4;
+    floorPhase = 0;
+    mission = null;
+    missionTimer = 0;
+    lastMissTime = 0;
+    ghostRec.count = 0;
+    ghostRec.interval = GHOST_INTERVAL;
+    initMission();
+    updateHUD();
+    show("selected", selectedTheme);
+    show("running", running);
+    push("replay", null);
+    push("report", true);
+    flushView();
+  }
+
+  function effectText() {
+    let text = "";
+    for (const k in effects) {
+      if (effects[k] > 0) text += `${text ? "," : ""}${k}:${effects[k].toFixed(1)}s`;
+    }
+    return text || "None";
+  }
+
+  function updateHUD() {
+    show("score", score);
+    show("lives", lives);
+    show("fragments", fragments);
+    show("mission", mission ? mission.text : null);
+    show("combo", comboCount);
+    show("rainbow", effects.rainbow > 0);
+    // effects starting or ending show up immediately; running countdowns at most hudRate times a second
+    let mask = 0;
+    let bit = 1;
+    for (const k in effects) {
+      if (effects[k] > 0) mask |= bit;
+      bit <<= 1;
+    }
+    if (mask === effectMask && (mask === 0 || performance.now() - effectShownAt < HUD_INTERVAL)) return;
+    effectMask = mask;
+    effectShownAt = performance.now();
+    show("effect", effectText());
+  }
+
+  function difficultyFactor() {
+    return 1 + Math.min(simTime / 100, 1.8);
+  }
+
+  function speedMultiplier() {
+    let m = 1;
+    if (effects.slow > 0) m *= 0.55;
+    if (effects.fever > 0) m *= 1.25;
+    if (effects.rainbow > 0) m *= 0.05;
+    return m;
+  }
+
+  function scoreMultiplier() {
+    let m = 1;
+    if (effects.fever > 0) m *= 2;
+    if (effects.rainbow > 0) m *= 3;
+    return m;
+  }
+
+  function spawnDrop() {
+    let x, kind;
+    if (daily && nextSpawn < daily.spawnX.length) {
+      x = daily.spawnX[nextSpawn];
+      kind = daily.spawnKind[nextSpawn++];
+    } else {
+      x = 18 + random() * (WIDTH - 36);
+      const special = random() < 0.18;
+      kind = special ? 1 + Math.floor(random() * (KINDS.length - 1)) : KIND_NORMAL;
+    }
+    const vy = (speedBase * difficultyFactor() * speedMultiplier()) / 70;
+    poolAdd(drops, x, -12, 0, vy, kind, 0);
+  }
+
+  function spawnSparks(x, y) {
+    if (!quality.sparks) return;
+    for (let i = 0; i < 6; i++) {
+      poolAdd(sparks, x, y, (Math.random() - 0.5) * 90, -20 - Math.random() * 30, 0, 0.4);
+    }
+  }
+
+  function applyEffect(kind) {
+    if (kind === "slow") effects.slow = 6.0;
+    if (kind === "fever") effects.fever = 7.0;
+    if (kind === "rainbow") effects.rainbow = 3.0;
+    if (kind === "magnet") effects.magnet = 6.0;
+    if (kind === "reflector") effects.reflector = 7.0;
+  }
+
+  function handleCombo(kind) {
+    if (kind === "slow") {
+      chainStage = 1;
+      applyEffect("slow");
+      return;
+    }
+    if (kind === "fever") {
+      if (chainStage === 1) {
+        chainStage = 0;
+        applyEffect("rainbow");
+      } else {
+        chainStage = 0;
+        applyEffect("fever");
+      }
+      return;
+    }
+    if (kind === "rainbow") {
+      chainStage = 0;
+      applyEffect("rainbow");
+      return;
+    }
+    chainStage = 0;
+    applyEffect(kind);
+  }
+
+  function initMission() {
+    const types = ["right", "left", "specials", "no_miss"];
+    const t = daily && nextMission < daily.missions.length
+      ? types[daily.missions[nextMission++]]
+      : types[Math.floor(random() * types.length)];
+    missionTimer = simTime + 30;
+    if (t === "right") mission = { type: t, target: 3, progress: 0, text: "Catch 3 on right (30s)" };
+    if (t === "left") mission = { type: t, target: 3, progress: 0, text: "Catch 3 on left (30s)" };
+    if (t === "specials") mission = { type: t, target: 2, progress: 0, text: "Catch 2 special gems (30s)" };
+    if (t === "no_miss") mission = { type: t, target: 15, progress: 0, text: "15s no miss (30s)" };
+  }
+
+  function completeMission() {
+    fragments += 1;
+    effects.shield = 5.0;
+    maybeAdvanceTheme();
+    initMission();
+  }
+
+  function updateMission(onCatch, x, kind) {
+    if (!mission) return;
+    if (mission.type === "right" && onCatch && x > WIDTH / 2) mission.progress++;
+    if (mission.type === "left" && onCatch && x < WIDTH / 2) mission.progress++;
+    if (mission.type === "specials" && onCatch && kind !== KIND_NORMAL) mission.progress++;
+    if (mission.type === "no_miss") {
+      const sinceMiss = simTime - lastMissTime;
+      mission.progress = Math.max(mission.progress, Math.min(mission.target, sinceMiss));
+    }
+    if (mission.progress >= mission.target) completeMission();
+    if (simTime > missionTimer) initMission();
+  }
+
+  function maybeAdvanceTheme() {
+    if (fragments >= FRAGMENT_GOAL) {
+      fragments = 0;
+      const next = (themeIndex + 1) % themes.length;
+      unlockTheme(next);
+      selectedTheme = next;
+      host.persist("gwThemeIdx", String(selectedTheme));
+      applyTheme(next);
+      show("selected", selectedTheme);
+      push("report", true);
+    }
+  }
+
+  function step(dt) {
+    simTime += dt;
+    for (const k in effects) { if (effects[k] > 0) effects[k] = Math.max(0, effects[k] - dt); }
+
+    player.x += player.vx * dt;
+    player.x = Math.max(6, Math.min(WIDTH - player.w - 6, player.x));
+
+    windTimer -= dt;
+    if (simTime >= windLockout) {
+      if (windTimer <= 0) {
+        if (daily && nextGust < daily.windAt.length) {
+          wind = daily.windAt[nextGust];
+          windTimer = daily.gapAt[nextGust++];
+        } else {
+          wind = (random() - 0.5) * 60;
+          windTimer = 6 + random() * 6;
+        }
+      }
+    } else {
+      wind = 0;
+      windTimer = 1; // keep simple countdown until unlock
+    }
+    floorPhase += dt;
+
+    spawnTimer -= dt;
+    if (spawnTimer <= 0) {
+      spawnDrop();
+      const df = difficultyFactor();
+      const eff = effects.slow > 0 ? 1.25 : effects.fever > 0 ? 0.85 : 1.0;
+      spawnTimer = Math.max(0.36, (spawnBase * eff) / df);
+    }
+
+    const timeScale = speedMultiplier();
+    const reflect = effects.reflector > 0;
+    const pull = effects.magnet > 0;
+    const target = player.x + player.w / 2;
+    const dx = drops.x, dy = drops.y, dvx = drops.vx, dvy = drops.vy;
+    for (let i = 0; i < drops.count; i++) {
+      if (reflect) {
+        if (dvx[i] === 0) dvx[i] = (random() - 0.5) * 50;
+        dx[i] += dvx[i] * dt;
+        if (dx[i] < 2 || dx[i] > WIDTH - DROP_SIZE - 2) dvx[i] *= -1;
+      }
+      dx[i] += wind * dt * 0.25;
+      dy[i] += dvy[i] * 60 * dt * timeScale;
+      if (pull) dx[i] += (target - dx[i]) * 0.6 * dt;
+    }
+
+    // backwards so a swap-removed slot is always refilled from an already visited index
+    for (let i = drops.count - 1; i >= 0; i--) {
+      const x = dx[i], y = dy[i], kind = drops.kind[i];
+      const hitX = x + DROP_SIZE >= player.x && x <= player.x + player.w;
+      const hitY = y + DROP_SIZE >= player.y && y <= player.y + player.h;
+      if (hitX && hitY) {
+        poolRemove(drops, i);
+        const gain = 10 * scoreMultiplier();
+        score += gain;
+        comboCount += 1;
+        speedBase = Math.min(speedBase + 1.2, 150);
+        if (kind !== KIND_NORMAL) {
+          handleCombo(KINDS[kind]);
+          if (random() < 0.35) {
+            fragments += 1;
+            maybeAdvanceTheme();
+          }
+        }
+        spawnSparks(player.x + player.w / 2, player.y);
+        updateMission(true, x, kind);
+        continue;
+      }
+      if (y > HEIGHT + 10) {
+        poolRemove(drops, i);
+        const insideX = x + DROP_SIZE > 0 && x < WIDTH;
+        if (insideX && effects.shield <= 0) {
+          lives -= 1;
+          lastMissTime = simTime;
+          comboCount = 0; // reset combo on missed catch inside view
+          if (lives <= 0) running = false;
+        }
+        // screen-out misses (outside X range) are ignored
+      }
+    }
+
+    for (let i = sparks.count - 1; i >= 0; i--) {
+      sparks.life[i] -= dt;
+      sparks.x[i] += sparks.vx[i] * dt;
+      sparks.y[i] += sparks.vy[i] * dt;
+      sparks.vy[i] += 160 * dt;
+      if (sparks.life[i] <= 0) poolRemove(sparks, i);
+    }
+
+    updateMission(false, 0, KIND_NORMAL);
+  }
+
+  function drawBackground() {
+    const drift = Math.sin(floorPhase * 0.4) * 8;
+    ctx.drawImage(layers.base, 0, 0, WIDTH, HEIGHT);
+    ctx.drawImage(layers.floor, drift, 0, WIDTH, HEIGHT);
+  }
+
+  function drawPlayer(alpha) {
+    ctx.save();
+    ctx.translate(Math.round(lerp(player.px, player.x, alpha)), Math.round(player.y));
+    if (quality.shading) {
+      ctx.fillStyle = "rgba(0,0,0,0.2)";
+      ctx.fillRect(2, 6, player.w, 8);
+    }
+    ctx.fillStyle = themeColors.playerDark;
+    ctx.fillRect(0, 0, player.w, player.h);
+    ctx.fillStyle = themeColors.playerLight;
+    ctx.fillRect(4, 3, player.w - 8, player.h - 6);
+    ctx.restore();
+  }
+
+  function drawDrops(alpha) {
+    const gems = layers.gems;
+    const cell = GEM_CELL * layers.scale;
+    for (let i = 0; i < drops.count; i++) {
+      const x = Math.round(lerp(drops.px[i], drops.x[i], alpha));
+      const y = Math.round(lerp(drops.py[i], drops.y[i], alpha));
+      ctx.drawImage(gems, drops.kind[i] * cell, 0, cell, cell, x - 1, y - 1, GEM_CELL, GEM_CELL);
+    }
+  }
+
+  function drawSparks() {
+    ctx.fillStyle = themeColors.spark;
+    for (let i = 0; i < sparks.count; i++) {
+      ctx.globalAlpha = Math.max(sparks.life[i] * 2.2, 0);
+      ctx.fillRect(sparks.x[i], sparks.y[i], 3, 3);
+    }
+    ctx.globalAlpha = 1;
+  }
+
+  function drawGhost(elapsed) {
+    if (!ghostData) return;
+    const gx = ghostX(ghostData, elapsed);
+    ctx.save();
+    ctx.globalAlpha = 0.35;
+    ctx.fillStyle = "#e5e7eb";
+    ctx.fillRect(gx, player.y, player.w, player.h);
+    ctx.restore();
+  }
+
+  function drawOverlay() {
+    if (!running) {
+      ctx.fillStyle = "rgba(0,0,0,0.5)";
+      ctx.fillRect(0, 0, WIDTH, HEIGHT);
+      ctx.fillStyle = "#f87171";
+      ctx.font = "bold 22px 'Segoe UI'";
+      ctx.textAlign = "center";
+      ctx.fillText("GAME OVER", WIDTH / 2, HEIGHT / 2 - 10);
+      ctx.fillStyle = "#e2e8f0";
+      ctx.font = "16px 'Segoe UI'";
+      ctx.fillText("Press Restart / Enter / Space", WIDTH / 2, HEIGHT / 2 + 14);
+    }
+  }
+
+  // alpha: how far the display is between the previous tick and the current one (0..1)
+  function draw(alpha) {
+    ctx.setTransform(pixelScale, 0, 0, pixelScale, 0, 0);
+    ctx.clearRect(0, 0, WIDTH, HEIGHT);
+    drawBackground();
+    drawDrops(alpha);
+    drawGhost(simTime);
+    drawPlayer(alpha);
+    drawSparks();
+    drawOverlay();
+  }
+
+  function snapshot() {
+    player.px = player.x;
+    for (let i = 0; i < drops.count; i++) {
+      drops.px[i] = drops.x[i];
+      drops.py[i] = drops.y[i];
+    }
+  }
+
+  // Autoplay (CONFIG.autoplay, for soak runs; bots.py plays the same policies headless): the
+  // policy sets the paddle velocity before every tick and a finished run restarts after
+  // AUTOPLAY_RESTART seconds. Soak stats go out with each game-over report.
+  const AUTOPLAY_RESTART = 1;
+  const policies = {
+    idle: () => 0,
+    // chase the lowest drop that can still be caught
+    greedy() {
+      let best = -1;
+      for (let i = 0; i < drops.count; i++) {
+        if (drops.y[i] <= player.y + player.h && (best < 0 || drops.y[i] > drops.y[best])) best = i;
+      }
+      if (best < 0) return 0;
+      const centre = player.x + player.w / 2;
+      const tx = drops.x[best] + DROP_SIZE / 2;
+      return tx > centre + 4 ? 120 : tx < centre - 4 ? -120 : 0;
+    },
+  };
+  const autoplay = policies[CONFIG.autoplay] || null;
+  const soak = autoplay ? createSoakStats() : null;
+  let restartIn = 0;
+
+  // one display frame; returns whether another is needed (nothing moves after game over)
+  function frame(seconds) {
+    const started = performance.now();
+    if (autoplay && !running) {
+      restartIn -= seconds;
+      if (restartIn <= 0) reset();
+    }
+    // 0 means the clock was just restarted: that frame rebuilds caches, so it is not sampled
+    const sampled = running && seconds > 0;
+    if (running) {
+      accumulator += Math.min(seconds, MAX_FRAME);
+      while (running && accumulator >= TICK) {
+        if (autoplay) setVelocity(autoplay());
+        snapshot();
+        step(TICK);
+        runTicks++;
+        recordGhost();
+        accumulator -= TICK;
+        if (!running) finishRun();
+      }
+    }
+    updateHUD();
+    show("running", running);
+    draw(running ? accumulator / TICK : 1);
+    if (soak) soak.frame(performance.now(), { drops: drops.count, sparks: sparks.count, ghostSamples: ghostRec.count });
+    flushView();
+    if (sampled) sampleFrame(performance.now() - started);
+    return running || autoplay !== null;
+  }
+
+  // Input. dragStart / dragMove: swipe to move, dx in CSS px from where the drag began.
+  // Changes during a run go into the replay log, stamped with the ticks played so far.
+  let dragStartPlayer = 0;
+
+  function setVelocity(vx) {
+    vx = Math.fround(vx);
+    if (vx === player.vx) return;
+    player.vx = vx;
+    if (running) inputLog.add(runTicks, REPLAY_VELOCITY, vx);
+  }
+
+  function dragMove(dx) {
+    player.x = Math.fround(Math.max(6, Math.min(WIDTH - player.w - 6, dragStartPlayer + dx)));
+    if (running) inputLog.add(runTicks, REPLAY_POSITION, player.x);
+  }
+
+  function selectTheme(idx) {
+    if (!unlocked.has(idx)) return;
+    selectedTheme = idx;
+    host.persist("gwThemeIdx", String(selectedTheme));
+    applyTheme(idx);
+    show("selected", selectedTheme);
+    push("report", true);
+    flushView();
+  }
+
+  // Profiler (CONFIG.profile): the phases are swapped for timed copies, the overlay is drawn over
+  // every frame and the aggregate goes out with a report every PROFILE_REPORT_MS.
+  const profiler = CONFIG.profile ? createProfiler() : null;
+  if (profiler) {
+    step = profiler.wrap("step", step);
+    updateHUD = profiler.wrap("updateHUD", updateHUD);
+    drawBackground = profiler.wrap("drawBackground", drawBackground);
+    drawDrops = profiler.wrap("drawDrops", drawDrops);
+    drawGhost = profiler.wrap("drawGhost", drawGhost);
+    drawPlayer = profiler.wrap("drawPlayer", drawPlayer);
+    drawSparks = profiler.wrap("drawSparks", drawSparks);
+    const timedFrame = profiler.wrap("frame", frame);
+    frame = seconds => {
+      if (seconds > 0) profiler.frame(seconds * 1000);
+      const more = timedFrame(seconds);
+      profiler.drawOverlay(ctx, WIDTH - 196, 6, 190, 64);
+      if (profiler.due()) {
+        push("profile", profiler.take());
+        push("report", true);
+        flushView();
+      }
+      return more;
+    };
+  }
+
+  applyQuality(0); // sizes the backing store and builds the selected theme's layers
+  push("unlocked", [...unlocked]);
+  push("quality", qualityStats());
+  reset();
+
+  return {
+    frame,
+    reset,
+    selectTheme,
+    setVelocity,
+    dragStart() { dragStartPlayer = player.x; },
+    dragMove,
+    setPixelRatio(ratio) {
+      pixelRatio = ratio;
+      applyQuality(qualityLevel);
+    },
+  };
+}
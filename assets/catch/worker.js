@@ -0,0 +1,33 @@
+// Render worker for the catch game (renderWorker mode): owns the page's canvas as an
+// OffscreenCanvas and runs sim.js plus the frame loop off the page's main thread. The page sends
+// input and visibility; view changes and storage writes are posted back for the page to apply.
+(() => {
+  let sim = null;
+  const loop = createFrameLoop(seconds => sim.frame(seconds));
+
+  const host = {
+    sync: changes => self.postMessage({ type: "sync", changes }),
+    persist: (key, value) => self.postMessage({ type: "persist", key, value }),
+  };
+
+  self.addEventListener("message", ({ data }) => {
+    if (data.type === "init") {
+      sim = createCatchSim(data.canvas, data.options, host);
+      loop.wake();
+      return;
+    }
+    if (!sim) return;
+    switch (data.type) {
+      case "reset": sim.reset(); loop.wake(); break;
+      case "theme": sim.selectTheme(data.index); loop.wake(); break;
+      case "velocity": sim.setVelocity(data.vx); break;
+      case "dragStart": sim.dragStart(); break;
+      case "dragMove": sim.dragMove(data.dx); break;
+      case "pixelRatio": sim.setPixelRatio(data.ratio); loop.wake(); break;
+      case "pause": loop.setPaused(true); break;
+      case "resume": loop.setPaused(false); break;
+    }
+  });
+
+  self.postMessage({ type: "ready" });
+})();
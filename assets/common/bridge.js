@@ -0,0 +1,29 @@
+// Minimal Streamlit component protocol (what streamlit-component-lib does) without a bundler.
+// report() only posts when the state actually changed, since every new value reruns the script.
+window.GameBridge = (() => {
+  let args = {};
+  let lastValue = null;
+  const renderListeners = [];
+  function send(type, data) {
+    if (window.parent === window) return; // standalone (static export): no host to talk to
+    window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type }, data), "*");
+  }
+  window.addEventListener("message", event => {
+    const msg = event.data;
+    if (!msg || msg.type !== "streamlit:render") return;
+    args = msg.args || {};
+    if (args.height) send("streamlit:setFrameHeight", { height: args.height });
+    renderListeners.forEach(cb => cb(args));
+  });
+  send("streamlit:componentReady", { apiVersion: 1 });
+  return {
+    args: () => args,
+    onRender(cb) { renderListeners.push(cb); },
+    report(state) {
+      const value = JSON.stringify(state);
+      if (value === lastValue) return;
+      lastValue = value;
+      send("streamlit:setComponentValue", { value: state, dataType: "json" });
+    },
+  };
+})();
@@ -0,0 +1,301 @@
+// Helpers with no DOM access, shared by the page bundles and the render worker (kit.js builds
+// the page-only helpers on top of these).
+
+function lerp(a, b, t) {
+  return a + (b - a) * t;
+}
+
+// Frame loop that only runs while there is something to show. frame(seconds) renders one frame
+// (seconds since the previous one, 0 after a restart) and returns true to get another; once it
+// returns false (game over, nothing moving) no frames are requested until wake(). While paused
+// no frames run, and the frame clock restarts on resume so the game does not catch up on the
+// time it was away. Uses requestAnimationFrame where the global scope has it (pages, and workers
+// in most browsers), else a 60 Hz timer.
+function createFrameLoop(frame) {
+  const request = typeof requestAnimationFrame === "function"
+    ? cb => requestAnimationFrame(cb)
+    : cb => setTimeout(() => cb(performance.now()), 1000 / 60);
+  const cancel = typeof cancelAnimationFrame === "function"
+    ? id => cancelAnimationFrame(id)
+    : id => clearTimeout(id);
+  let wanted = false;
+  let paused = false;
+  let pending = 0;
+  let last = null;
+
+  function tick(ts) {
+    pending = 0;
+    const seconds = last === null ? 0 : (ts - last) / 1000;
+    last = ts;
+    wanted = frame(seconds) === true;
+    if (!wanted) last = null;
+    schedule();
+  }
+
+  function schedule() {
+    if (wanted && !paused && !pending) pending = request(tick);
+  }
+
+  return {
+    wake() {
+      wanted = true;
+      schedule();
+    },
+    setPaused(value) {
+      if (value === paused) return;
+      paused = value;
+      if (paused) {
+        if (pending) cancel(pending);
+        pending = 0;
+        last = null;
+      } else {
+        schedule();
+      }
+    },
+  };
+}
+
+// Seedable PRNG (same floats as catch_engine.Mulberry32); returns a Math.random-style function.
+function mulberry32(seed) {
+  let a = seed >>> 0;
+  return () => {
+    a = (a + 0x6D2B79F5) | 0;
+    let t = Math.imul(a ^ (a >>> 15), 1 | a);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+function base64Bytes(text) {
+  const raw = atob(text || "");
+  const bytes = new Uint8Array(raw.length);
+  for (let i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+  return bytes;
+}
+
+// Autoplay soak statistics (GAME_CONFIG.autoplay, see bots.py): display frames per second over
+// the last second, peak entity counts, and the JS heap at each run's end against the first run
+// (performance.memory: Chromium pages only, null elsewhere and in workers).
+function createSoakStats() {
+  const peak = {};
+  let runs = 0;
+  let frames = 0;
+  let windowStart = null;
+  let fps = 0;
+  let heapStart = null;
+  let heapMB = null;
+
+  return {
+    frame(now, counts) {
+      frames++;
+      if (windowStart === null) windowStart = now;
+      if (now - windowStart >= 1000) {
+        fps = Math.round((frames * 1000) / (now - windowStart));
+        frames = 0;
+        windowStart = now;
+      }
+      for (const k in counts) if (!(counts[k] <= peak[k])) peak[k] = counts[k];
+    },
+    runEnded() {
+      runs++;
+      const memory = typeof performance !== "undefined" && performance.memory;
+      if (memory) {
+        heapMB = memory.usedJSHeapSize / 1048576;
+        if (heapStart === null) heapStart = heapMB;
+      }
+      return {
+        runs,
+        fps,
+        peak: { ...peak },
+        heapMB: heapMB === null ? null : Number(heapMB.toFixed(1)),
+        heapGrowthPerRunMB: runs > 1 && heapMB !== null ? Number(((heapMB - heapStart) / (runs - 1)).toFixed(3)) : null,
+      };
+    },
+  };
+}
+
+// Replay input log, one per run, sent with the game-over report and re-simulated by
+// replay_verifier.py. Format v1 (little-endian, base64; mirrored by replay_codec.py):
+//   u8 version, u8 game (0 catch, 1 side_scroller), u16 tick rate, u32 seed, u32 ticks, u32 score,
+//   u16 daily-challenge day (days since 1970-01-01, 0 = not a daily run), u32 event count,
+//   then per event a LEB128 varint of (ticks since the previous event << 2 | kind) followed, for
+//   kinds 0 (paddle velocity, px/s) and 1 (paddle x after a drag), by an f32 value; kind 2 is a jump.
+// An event stamped t was applied before the run's (t + 1)-th tick. Values are Math.fround()ed by the
+// games before use, so the f32 in the log is exactly what the simulation saw.
+const REPLAY_VERSION = 1;
+const REPLAY_HEADER = 22;
+const REPLAY_VELOCITY = 0;
+const REPLAY_POSITION = 1;
+const REPLAY_JUMP = 2;
+
+function createInputLog() {
+  let ticks = new Uint32Array(256);
+  let kinds = new Uint8Array(256);
+  let values = new Float32Array(256);
+  let count = 0;
+
+  function grow() {
+    const t = new Uint32Array(ticks.length * 2), k = new Uint8Array(ticks.length * 2), v = new Float32Array(ticks.length * 2);
+    t.set(ticks); k.set(kinds); v.set(values);
+    ticks = t; kinds = k; values = v;
+  }
+
+  return {
+    clear() {
+      count = 0;
+    },
+    add(tick, kind, value = 0) {
+      // a later value within the same tick replaces the earlier one (several pointer moves per frame)
+      if (kind !== REPLAY_JUMP && count > 0 && ticks[count - 1] === tick && kinds[count - 1] === kind) {
+        values[count - 1] = value;
+        return;
+      }
+      if (count === ticks.length) grow();
+      ticks[count] = tick; kinds[count] = kind; values[count] = value;
+      count++;
+    },
+    encode(game, tickRate, seed, runTicks, score, dailyDate) {
+      const bytes = new Uint8Array(REPLAY_HEADER + count * 9);
+      const view = new DataView(bytes.buffer);
+      view.setUint8(0, REPLAY_VERSION);
+      view.setUint8(1, game);
+      view.setUint16(2, tickRate, true);
+      view.setUint32(4, seed, true);
+      view.setUint32(8, runTicks, true);
+      view.setUint32(12, score, true);
+      view.setUint16(16, dailyDate ? Date.parse(dailyDate) / 86400000 : 0, true);
+      view.setUint32(18, count, true);
+      let at = REPLAY_HEADER;
+      let prev = 0;
+      for (let i = 0; i < count; i++) {
+        let v = (ticks[i] - prev) * 4 + kinds[i];
+        prev = ticks[i];
+        while (v >= 0x80) {
+          bytes[at++] = (v % 0x80) | 0x80;
+          v = Math.floor(v / 0x80);
+        }
+        bytes[at++] = v;
+        if (kinds[i] !== REPLAY_JUMP) {
+          view.setFloat32(at, values[i], true);
+          at += 4;
+        }
+      }
+      let bin = "";
+      for (let i = 0; i < at; i++) bin += String.fromCharCode(bytes[i]);
+      return btoa(bin);
+    },
+  };
+}
+
+// Opt-in phase profiler (GAME_CONFIG.profile, the pages' sidebar toggle). wrap() returns a timed
+// copy of a function, and the games only swap their functions for timed copies when the profiler
+// is on, so with it off nothing is measured and nothing is added to the hot path. Each call's
+// duration goes into a per-phase histogram (PROFILE_BUCKETS_MS upper bounds, plus one overflow
+// bucket) and, where available, a User Timing measure for the browser's performance panel.
+// frame(ms) keeps the last PROFILE_FRAMES frame intervals for the overlay's graph and percentiles.
+// take() returns the aggregate since the previous take() (due() every PROFILE_REPORT_MS).
+const PROFILE_BUCKETS_MS = [0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33];
+const PROFILE_FRAMES = 240;
+const PROFILE_REPORT_MS = 2000;
+
+function createProfiler() {
+  const measure = typeof performance.measure === "function";
+  const frames = new Float64Array(PROFILE_FRAMES);
+  let frameCount = 0;
+  let phases = {};
+  let frameStats = newPhase();
+  let seq = 0;
+  let takenAt = performance.now();
+
+  function newPhase() {
+    return { count: 0, totalMs: 0, maxMs: 0, hist: new Array(PROFILE_BUCKETS_MS.length + 1).fill(0) };
+  }
+
+  function add(phase, ms) {
+    phase.count++;
+    phase.totalMs += ms;
+    if (ms > phase.maxMs) phase.maxMs = ms;
+    let b = 0;
+    while (b < PROFILE_BUCKETS_MS.length && ms > PROFILE_BUCKETS_MS[b]) b++;
+    phase.hist[b]++;
+  }
+
+  function percentiles() {
+    const n = Math.min(frameCount, PROFILE_FRAMES);
+    const sorted = Array.from(frames.subarray(0, n)).sort((a, b) => a - b);
+    const at = q => (n ? sorted[Math.min(n - 1, Math.floor(q * n))] : 0);
+    return { p50: at(0.5), p95: at(0.95), p99: at(0.99) };
+  }
+
+  return {
+    wrap(name, fn) {
+      return function () {
+        const start = performance.now();
+        const result = fn.apply(this, arguments);
+        const end = performance.now();
+        add(phases[name] || (phases[name] = newPhase()), end - start);
+        if (measure) performance.measure(name, { start, end });
+        return result;
+      };
+    },
+    frame(ms) {
+      frames[frameCount % PROFILE_FRAMES] = ms;
+      frameCount++;
+      add(frameStats, ms);
+    },
+    due() {
+      return performance.now() - takenAt >= PROFILE_REPORT_MS;
+    },
+    take() {
+      const now = performance.now();
+      const round = ms => Number(ms.toFixed(3));
+      const summary = phase => ({ count: phase.count, meanMs: round(phase.count ? phase.totalMs / phase.count : 0), maxMs: round(phase.maxMs), hist: phase.hist });
+      const out = {
+        seq: ++seq,
+        seconds: round((now - takenAt) / 1000),
+        bucketsMs: PROFILE_BUCKETS_MS,
+        frames: { ...summary(frameStats), ...Object.fromEntries(Object.entries(percentiles()).map(([k, v]) => [k, round(v)])) },
+        phases: {},
+      };
+      for (const name in phases) {
+        out.phases[name] = summary(phases[name]);
+        if (measure) performance.clearMeasures(name);
+      }
+      phases = {};
+      frameStats = newPhase();
+      takenAt = now;
+      return out;
+    },
+    // frame-time graph (last PROFILE_FRAMES intervals, 50 ms full scale, a line at 60 fps),
+    // frame percentiles and the costliest phases by mean, in a w x h box at (x, y)
+    drawOverlay(ctx, x, y, w, h) {
+      ctx.save();
+      ctx.globalAlpha = 1;
+      ctx.fillStyle = "rgba(15,23,42,0.78)";
+      ctx.fillRect(x, y, w, h);
+      const graphH = h - 30;
+      const n = Math.min(frameCount, PROFILE_FRAMES, w - 8);
+      for (let k = 0; k < n; k++) {
+        const ms = frames[(frameCount - n + k) % PROFILE_FRAMES];
+        ctx.fillStyle = ms <= 17.5 ? "#4ade80" : ms <= 34 ? "#fbbf24" : "#f87171";
+        const barH = Math.max(1, Math.min(ms / 50, 1) * graphH);
+        ctx.fillRect(x + 4 + k, y + 4 + graphH - barH, 1, barH);
+      }
+      ctx.fillStyle = "rgba(226,232,240,0.5)";
+      ctx.fillRect(x + 4, y + 4 + graphH - (1000 / 60 / 50) * graphH, w - 8, 1);
+      const p = percentiles();
+      ctx.fillStyle = "#e2e8f0";
+      ctx.font = "10px monospace";
+      ctx.textAlign = "left";
+      ctx.fillText(`p50 ${p.p50.toFixed(1)} p95 ${p.p95.toFixed(1)} p99 ${p.p99.toFixed(1)} ms`, x + 4, y + h - 16);
+      const top = Object.entries(phases)
+        .filter(([name]) => name !== "frame")
+        .map(([name, s]) => [name, s.count ? s.totalMs / s.count : 0])
+        .sort((a, b) => b[1] - a[1])
+        .slice(0, 3)
+        .map(([name, ms]) => `${name} ${ms.toFixed(2)}`);
+      ctx.fillText(top.join(" "), x + 4, y + h - 4);
+      ctx.restore();
+    },
+  };
+}
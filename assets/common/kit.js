@@ -0,0 +1,81 @@
+// Page-side helpers shared by both games (DOM, storage, visibility); loaded after core.js and
+// before each game's script in the same bundle.
+
+// HUD bindings remember the last value they rendered and only touch the DOM when it changes.
+function bindText(el, format) {
+  return { el, format, value: undefined };
+}
+
+function setText(binding, value) {
+  if (binding.value === value) return;
+  binding.value = value;
+  binding.el.textContent = binding.format ? binding.format(value) : value;
+}
+
+// Persistence: localStorage writes are queued per key (last value wins, null removes) and flushed
+// together from an idle callback, never from the animation frame. Pending writes are also
+// flushed when the page is hidden or unloaded.
+const pendingWrites = new Map();
+let flushScheduled = false;
+const whenIdle = window.requestIdleCallback
+  ? cb => requestIdleCallback(cb, { timeout: 2000 })
+  : cb => setTimeout(cb, 250);
+
+function persist(key, value) {
+  pendingWrites.set(key, value);
+  if (flushScheduled) return;
+  flushScheduled = true;
+  whenIdle(flushWrites);
+}
+
+function flushWrites() {
+  flushScheduled = false;
+  pendingWrites.forEach((value, key) => {
+    try {
+      if (value === null) localStorage.removeItem(key);
+      else localStorage.setItem(key, value);
+    } catch (_) {}
+  });
+  pendingWrites.clear();
+}
+
+window.addEventListener("pagehide", flushWrites);
+document.addEventListener("visibilitychange", () => { if (document.hidden) flushWrites(); });
+
+// Calls onChange(active) whenever the page becomes hidden / visible or `target` scrolls out of /
+// into view (IntersectionObserver), i.e. whenever there is no longer / again any point in running.
+function watchActive(target, onChange) {
+  let visible = !document.hidden;
+  let inView = true;
+  let active = true;
+
+  function update() {
+    const next = visible && inView;
+    if (next === active) return;
+    active = next;
+    onChange(active);
+  }
+
+  document.addEventListener("visibilitychange", () => {
+    visible = !document.hidden;
+    update();
+  });
+  if (target && window.IntersectionObserver) {
+    new IntersectionObserver(entries => {
+      inView = entries[entries.length - 1].isIntersecting;
+      update();
+    }).observe(target);
+  }
+}
+
+// createFrameLoop (core.js) that also halts while the page is hidden or `target` is out of view,
+// calling onPause / onResume around it.
+function createLoop(frame, { target, onPause, onResume } = {}) {
+  const loop = createFrameLoop(frame);
+  watchActive(target, active => {
+    loop.setPaused(!active);
+    const cb = active ? onResume : onPause;
+    if (cb) cb();
+  });
+  return loop;
+}
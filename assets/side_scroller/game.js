@@ -0,0 +1,351 @@
+(() => {
+  const canvas = document.getElementById("game");
+  const ctx = canvas.getContext("2d");
+  const scoreEl = document.getElementById("score");
+  const bestEl = document.getElementById("best");
+  const restartBtn = document.getElementById("restart");
+  const groundY = canvas.height - 60;
+  const CONFIG = window.GAME_CONFIG;
+  const TICK = 1 / CONFIG.tickRate;
+  const MAX_FRAME = 0.25; // longest wall-clock gap fed to the accumulator
+  const HUD_INTERVAL = 1000 / CONFIG.hudRate;
+  let player, running, spawnTimer, score, best, speedBase;
+  let accumulator = 0;
+  let hudShownAt = 0;
+  let savedBest = 0;
+  let bestSavedAt = 0;
+  const BEST_SAVE_INTERVAL = 5000; // ms between crash-guard saves while a run keeps beating the best
+
+  // Obstacle ring buffer: obstacles always leave from the front in spawn order, so a head index
+  // and a count over preallocated typed arrays replace the per-frame filter and per-spawn objects.
+  // The k-th live obstacle sits in slot (head + k) & OBSTACLE_MASK.
+  const OBSTACLE_CAPACITY = 32; // power of two; about 10 are ever on screen at top spawn rate
+  const OBSTACLE_MASK = OBSTACLE_CAPACITY - 1;
+  const obstacles = {
+    head: 0,
+    count: 0,
+    x: new Float64Array(OBSTACLE_CAPACITY),
+    px: new Float64Array(OBSTACLE_CAPACITY),
+    y: new Float64Array(OBSTACLE_CAPACITY),
+    w: new Float64Array(OBSTACLE_CAPACITY),
+    h: new Float64Array(OBSTACLE_CAPACITY),
+    speed: new Float64Array(OBSTACLE_CAPACITY),
+  };
+
+  function obstaclePush(x, y, w, h, speed) {
+    if (obstacles.count === OBSTACLE_CAPACITY) obstacleShift(); // full: drop the oldest (leftmost)
+    const i = (obstacles.head + obstacles.count++) & OBSTACLE_MASK;
+    obstacles.x[i] = x; obstacles.px[i] = x;
+    obstacles.y[i] = y; obstacles.w[i] = w; obstacles.h[i] = h;
+    obstacles.speed[i] = speed;
+  }
+
+  function obstacleShift() {
+    obstacles.head = (obstacles.head + 1) & OBSTACLE_MASK;
+    obstacles.count--;
+  }
+
+  // Obstacle sizes come from mulberry32(runSeed), a fresh seed per run, and jumps go into the
+  // replay log (createInputLog), so replay_verifier.py can re-simulate the run with scroller_engine.
+  // Daily challenge (CONFIG.daily, built by daily_challenge.py): the run seed is the day's and sizes
+  // come in order from daily.obstacles, base64 bytes in pairs (height - 20, width - 20), first.
+  const daily = CONFIG.daily ? { date: CONFIG.daily.date, seed: CONFIG.daily.seed, sizes: base64Bytes(CONFIG.daily.obstacles) } : null;
+  let random = Math.random;
+  let runSeed = 0;
+  let runTicks = 0;
+  let replay = null;
+  const inputLog = createInputLog();
+  let nextObstacle = 0;
+
+  // Autoplay (CONFIG.autoplay, for soak runs; bots.py plays the same policies headless): the policy
+  // decides before every tick whether to jump, and a finished run restarts after AUTOPLAY_RESTART
+  // seconds. Soak stats go out with each game-over report.
+  const AUTOPLAY_RESTART = 1;
+  // height above the ground on each tick after a jump, until landing
+  const JUMP_ARC = [];
+  for (let vy = -11, y = 0; ; ) {
+    vy += 28 / 60;
+    y += vy;
+    if (y > 0) break;
+    JUMP_ARC.push(-y);
+  }
+  const policies = {
+    idle: () => false,
+    // jump as soon as the arc clears the next obstacle for every tick it overlaps the player
+    jumper() {
+      if (!player.onGround) return false;
+      for (let k = 0; k < obstacles.count; k++) {
+        const i = (obstacles.head + k) & OBSTACLE_MASK;
+        const x = obstacles.x[i], w = obstacles.w[i], speed = obstacles.speed[i];
+        if (x + w <= player.x) continue;
+        const tIn = (x - (player.x + player.w)) / speed;
+        const tOut = (x + w - player.x) / speed;
+        for (let n = Math.max(0, Math.floor(tIn)); n <= Math.ceil(tOut); n++) {
+          if (n >= JUMP_ARC.length || JUMP_ARC[n] < obstacles.h[i] + 2) return false;
+        }
+        return true;
+      }
+      return false;
+    },
+  };
+  const autoplay = policies[CONFIG.autoplay] || null;
+  const soak = autoplay ? createSoakStats() : null;
+  let soakStats = null;
+  let restartIn = 0;
+
+  const hud = {
+    score: bindText(scoreEl),
+    best: bindText(bestEl),
+  };
+
+  function reset() {
+    runSeed = daily ? daily.seed : Math.floor(Math.random() * 4294967296);
+    random = mulberry32(runSeed);
+    nextObstacle = 0;
+    runTicks = 0;
+    replay = null;
+    inputLog.clear();
+    player = { x: 100, y: groundY, w: 30, h: 30, vy: 0, onGround: true, py: groundY };
+    obstacles.head = 0;
+    obstacles.count = 0;
+    running = true;
+    accumulator = 0;
+    spawnTimer = 0;
+    score = 0;
+    speedBase = 4;
+    renderHUD(true);
+    reportState();
+    frameLoop.wake();
+  }
+
+  // state sent back to Python (GameBridge only exists inside the Streamlit component)
+  function reportState() {
+    if (!window.GameBridge) return;
+    GameBridge.report({ score: Math.round(score), best: Math.round(best), running, daily: daily ? daily.date : null, soak: soakStats, replay, profile });
+  }
+
+  function loadBest() {
+    const stored = localStorage.getItem("sideScrollerBest");
+    best = stored ? Number(stored) : 0;
+    savedBest = best;
+    setText(hud.best, best.toFixed(0));
+  }
+
+  // The best score is tracked in memory during a run and queued for storage (written off-frame by
+  // persist) at game over, when the page is hidden, and every BEST_SAVE_INTERVAL meanwhile.
+  function saveBest() {
+    if (best <= savedBest) return;
+    savedBest = best;
+    bestSavedAt = performance.now();
+    persist("sideScrollerBest", String(best));
+  }
+
+  function saveBestNow() {
+    saveBest();
+    flushWrites();
+  }
+
+  function jump() {
+    if (!running) return;
+    if (player.onGround) {
+      player.vy = -11;
+      player.onGround = false;
+      inputLog.add(runTicks, REPLAY_JUMP);
+    }
+  }
+
+  function spawnObstacle() {
+    let h, w;
+    if (daily && 2 * nextObstacle < daily.sizes.length) {
+      h = 20 + daily.sizes[2 * nextObstacle];
+      w = 20 + daily.sizes[2 * nextObstacle + 1];
+      nextObstacle++;
+    } else {
+      h = 20 + random() * 50;
+      w = 20 + random() * 40;
+    }
+    const speed = speedBase + Math.min(score / 300, 6);
+    obstaclePush(canvas.width + 10, groundY + (30 - h), w, h, speed);
+  }
+
+  function update(dt) {
+    // gravity (vy is in px per 60 Hz frame, so scale the move to stay tick-rate independent)
+    player.vy += 28 * dt;
+    player.y += player.vy * 60 * dt;
+    if (player.y > groundY) {
+      player.y = groundY;
+      player.vy = 0;
+      player.onGround = true;
+    }
+    // obstacles
+    spawnTimer -= dt;
+    if (spawnTimer <= 0) {
+      spawnObstacle();
+      spawnTimer = 1.1 - Math.min(score / 500, 0.7);
+    }
+    const { x, w, speed } = obstacles;
+    for (let k = 0; k < obstacles.count; k++) {
+      const i = (obstacles.head + k) & OBSTACLE_MASK;
+      x[i] -= speed[i] * 60 * dt;
+    }
+    // the front obstacle is always the leftmost, so eviction only ever looks at the head
+    while (obstacles.count > 0 && x[obstacles.head] + w[obstacles.head] <= -20) obstacleShift();
+    // scoring
+    score += dt * 100;
+    if (score > best) {
+      best = score;
+      if (performance.now() - bestSavedAt >= BEST_SAVE_INTERVAL) saveBest();
+    }
+    // collisions: obstacles stay in spawn order, which is also x order (a later obstacle is at most
+    // score/300 px per frame faster, far too little to overtake within one screen width), so only
+    // the few whose swept x-range reaches the player are tested
+    const left = player.x, right = player.x + player.w;
+    for (let k = 0; k < obstacles.count; k++) {
+      const i = (obstacles.head + k) & OBSTACLE_MASK;
+      if (obstacles.px[i] + w[i] <= left) continue; // already behind the player for the whole tick
+      if (x[i] >= right) break; // this one and every later one is still ahead
+      if (sweptHit(i)) { running = false; break; }
+    }
+    renderHUD(!running);
+    if (!running) {
+      saveBest();
+      replay = inputLog.encode(1, CONFIG.tickRate, runSeed, runTicks, Math.round(score), daily && daily.date);
+      if (soak) {
+        soakStats = soak.runEnded();
+        restartIn = AUTOPLAY_RESTART;
+      }
+      reportState();
+    }
+  }
+
+  // continuous test over the tick's motion (player from py to y, obstacle from px to x), so fast
+  // obstacles cannot step over the player between ticks. In the obstacle's frame the player's corner
+  // moves along a segment; it hits when the segment enters the obstacle grown by the player's size.
+  function sweptHit(i) {
+    const o = obstacles;
+    const ow = o.w[i], oh = o.h[i];
+    const sx = player.x - o.px[i], sy = player.py - o.y[i];
+    const dx = o.px[i] - o.x[i], dy = player.y - player.py;
+    let enter = 0, exit = 1;
+    // x slab: corner strictly inside (-player.w, o.w)
+    if (dx === 0) {
+      if (sx <= -player.w || sx >= ow) return false;
+    } else {
+      let t0 = (-player.w - sx) / dx, t1 = (ow - sx) / dx;
+      if (t0 > t1) { const t = t0; t0 = t1; t1 = t; }
+      enter = Math.max(enter, t0);
+      exit = Math.min(exit, t1);
+    }
+    // y slab: corner strictly inside (-player.h, o.h)
+    if (dy === 0) {
+      if (sy <= -player.h || sy >= oh) return false;
+    } else {
+      let t0 = (-player.h - sy) / dy, t1 = (oh - sy) / dy;
+      if (t0 > t1) { const t = t0; t0 = t1; t1 = t; }
+      enter = Math.max(enter, t0);
+      exit = Math.min(exit, t1);
+    }
+    return enter < exit;
+  }
+
+  // the score changes every tick, so it is shown at most hudRate times a second (force: show now)
+  function renderHUD(force) {
+    const now = performance.now();
+    if (!force && now - hudShownAt < HUD_INTERVAL) return;
+    hudShownAt = now;
+    setText(hud.score, score.toFixed(0));
+    setText(hud.best, best.toFixed(0));
+  }
+
+  // alpha: how far the display is between the previous tick and the current one (0..1)
+  function draw(alpha) {
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    // ground
+    ctx.fillStyle = "#1f2937";
+    ctx.fillRect(0, groundY + 30, canvas.width, 60);
+    ctx.fillStyle = "#374151";
+    ctx.fillRect(0, groundY + 25, canvas.width, 5);
+    // player
+    ctx.fillStyle = running ? "#22d3ee" : "#ef4444";
+    ctx.fillRect(player.x, lerp(player.py, player.y, alpha) - player.h, player.w, player.h);
+    // obstacles
+    ctx.fillStyle = "#f97316";
+    for (let k = 0; k < obstacles.count; k++) {
+      const i = (obstacles.head + k) & OBSTACLE_MASK;
+      ctx.fillRect(lerp(obstacles.px[i], obstacles.x[i], alpha), obstacles.y[i] - obstacles.h[i], obstacles.w[i], obstacles.h[i]);
+    }
+    // text on game over
+    if (!running) {
+      ctx.fillStyle = "rgba(0,0,0,0.45)";
+      ctx.fillRect(0, 0, canvas.width, canvas.height);
+      ctx.fillStyle = "#e5e7eb";
+      ctx.font = "bold 28px 'Segoe UI'";
+      ctx.textAlign = "center";
+      ctx.fillText("Game Over - Enter で再開", canvas.width / 2, canvas.height / 2);
+    }
+  }
+
+  function snapshot() {
+    player.py = player.y;
+    for (let k = 0; k < obstacles.count; k++) {
+      const i = (obstacles.head + k) & OBSTACLE_MASK;
+      obstacles.px[i] = obstacles.x[i];
+    }
+  }
+
+  // one display frame; returns whether another is needed (the game-over screen is static)
+  function frame(seconds) {
+    if (autoplay && !running) {
+      restartIn -= seconds;
+      if (restartIn <= 0) reset();
+    }
+    if (running) {
+      accumulator += Math.min(seconds, MAX_FRAME);
+      while (running && accumulator >= TICK) {
+        if (autoplay && autoplay()) jump();
+        snapshot();
+        runTicks++;
+        update(TICK);
+        accumulator -= TICK;
+      }
+    }
+    draw(running ? accumulator / TICK : 1);
+    if (soak) soak.frame(performance.now(), { obstacles: obstacles.count });
+    return running || autoplay !== null;
+  }
+
+  // Profiler (CONFIG.profile): update / draw / renderHUD / frame are swapped for timed copies, the
+  // overlay is drawn over every frame and the aggregate is reported every PROFILE_REPORT_MS.
+  const profiler = CONFIG.profile ? createProfiler() : null;
+  let profile = null;
+  if (profiler) {
+    update = profiler.wrap("update", update);
+    draw = profiler.wrap("draw", draw);
+    renderHUD = profiler.wrap("renderHUD", renderHUD);
+    const timedFrame = profiler.wrap("frame", frame);
+    frame = seconds => {
+      if (seconds > 0) profiler.frame(seconds * 1000);
+      const more = timedFrame(seconds);
+      profiler.drawOverlay(ctx, canvas.width - 196, 6, 190, 64);
+      if (profiler.due()) {
+        profile = profiler.take();
+        reportState();
+      }
+      return more;
+    };
+  }
+
+  const frameLoop = createLoop(frame, { target: canvas });
+
+  document.addEventListener("keydown", (e) => {
+    if (e.code === "Space" || e.code === "ArrowUp") jump();
+    if (e.code === "Enter" && !running) reset();
+  });
+  restartBtn.addEventListener("click", reset);
+  document.addEventListener("visibilitychange", () => { if (document.hidden) saveBestNow(); });
+  window.addEventListener("pagehide", saveBestNow);
+  canvas.addEventListener("pointerdown", () => jump());
+
+  loadBest();
+  reset();
+})();
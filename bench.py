@@ -0,0 +1,276 @@
+"""
+Benchmark suite for the headless engines and the Python side of the pages; writes JSON to compare across commits.
+- engine: CatchGame / ScrollerGame ticks per second with 10 .. 10 000 drops / obstacles on the
+  field (the scroller's 32-slot ring buffer is lifted for the larger counts), and catch_batch game-ticks per
+  second with 10 .. 10 000 games in one vectorised batch
+- markup: build_bundle() (read + minify + hash, once per process), the per-rerun render_index() +
+  digest that game_component() does, and write_bundle() into an empty directory (first mount)
+- codec: ghost_codec and replay_codec encode / decode of full-size payloads
+- leaderboard: indexed top-N queries on a seeded database, uncached and cached, and submit()
+  enqueue cost plus the write-behind flush
+- Every case reports the best and median of --repeat timed rounds; --compare prints the change
+  against an earlier results file (value ratio per case, > 1 is faster)
+- Example: python bench.py --out bench.json; python bench.py --only engine --compare bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+import catch_engine
+import ghost_codec
+import replay_codec
+from catch_batch import POLICIES, CatchBatch
+from catch_engine import KEY_SPEED, CatchGame, Drop
+from game_assets import build_bundle, render_index, write_bundle
+from game_component import source_digest
+from leaderboard import Leaderboard
+from replay_verifier import bot_replay
+from scroller_engine import WIDTH as SCROLLER_WIDTH, Obstacle, ScrollerGame
+
+ENTITY_COUNTS = (10, 100, 1_000, 10_000)
+SUITES: dict[str, Callable[["Runner"], None]] = {}
+
+
+def suite(fn: Callable[["Runner"], None]) -> Callable[["Runner"], None]:
+    SUITES[fn.__name__] = fn
+    return fn
+
+
+class Runner:
+    """Times cases and collects their results."""
+
+    def __init__(self, repeat: int = 5, min_time: float = 0.2) -> None:
+        self.repeat = repeat
+        self.min_time = min_time
+        self.results: list[dict[str, Any]] = []
+
+    def time(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        *,
+        per: int = 1,
+        unit: str = "ops/s",
+        setup: Optional[Callable[[], Any]] = None,
+        **params: Any,
+    ) -> None:
+        """Record ``per / seconds`` of ``fn()`` (``fn(state)`` with ``setup``) as a rate in ``unit``.
+
+        Each round calls ``fn`` until ``min_time`` has passed; ``setup`` runs untimed before every call.
+        """
+        rates = []
+        for _ in range(self.repeat):
+            spent, calls = 0.0, 0
+            while spent < self.min_time or calls == 0:
+                state = setup() if setup is not None else None
+                started = time.perf_counter()
+                fn(state) if setup is not None else fn()
+                spent += time.perf_counter() - started
+                calls += 1
+            rates.append(per * calls / spent)
+        self.record(name, rates, unit, **params)
+
+    def record(self, name: str, rates: list[float], unit: str, **params: Any) -> None:
+        row = {
+            "name": name,
+            "params": params,
+            "unit": unit,
+            "value": max(rates),
+            "median": statistics.median(rates),
+            "rounds": len(rates),
+        }
+        self.results.append(row)
+        label = " ".join([name, *(f"{k}={v}" for k, v in params.items())])
+        print(f"{label:<48} {row['value']:>14,.1f} {unit}  (median {row['median']:,.1f})", flush=True)
+
+
+# -- engines ---------------------------------------------------------------
+
+TICKS = 60  # one simulated second per timed call
+
+
+def _catch_field(n: int) -> CatchGame:
+    """A catch game that cannot end, with ``n`` drops spread over the top of the field."""
+    game = CatchGame(seed=1)
+    game.lives = 1 << 30
+    game.player_vx = KEY_SPEED
+    rng = np.random.default_rng(n)
+    vy = game.speed_base * game.difficulty_factor() / 70
+    for x, y in zip(rng.uniform(6, catch_engine.WIDTH - 18, n), rng.uniform(-12, 120, n)):
+        drop = Drop(float(x), vy, "normal")
+        drop.y = float(y)
+        game.drops.append(drop)
+    return game
+
+
+def _scroller_field(n: int) -> ScrollerGame:
+    """A side-scroller run with ``n`` obstacles queued past the right edge (none reach the player)."""
+    game = ScrollerGame(seed=1)
+    game.obstacles = deque(maxlen=max(n + 64, 32))
+    for k in range(n):
+        game.obstacles.append(Obstacle(SCROLLER_WIDTH + 1000 + 60 * k, 350.0, 30.0, 40.0, 4.0))
+    return game
+
+
+def _steps(game: Any) -> None:
+    step = game.step
+    for _ in range(TICKS):
+        step()
+
+
+@suite
+def engine(run: Runner) -> None:
+    for n in ENTITY_COUNTS:
+        run.time("catch_engine.step", _steps, setup=lambda n=n: _catch_field(n), per=TICKS, unit="ticks/s", drops=n)
+    for n in ENTITY_COUNTS:
+        run.time("scroller_engine.step", _steps, setup=lambda n=n: _scroller_field(n), per=TICKS, unit="ticks/s", obstacles=n)
+    tracker = POLICIES["tracker"]
+
+    def batch_steps(batch: CatchBatch) -> None:
+        for _ in range(TICKS):
+            batch.player_vx = np.asarray(tracker(batch), dtype=float)
+            batch.step()
+
+    for n in ENTITY_COUNTS:
+        run.time("catch_batch.step", batch_steps, setup=lambda n=n: CatchBatch(np.arange(n)), per=TICKS * n, unit="game-ticks/s", games=n)
+
+
+# -- markup ----------------------------------------------------------------
+
+
+@suite
+def markup(run: Runner) -> None:
+    for name in ("catch", "side_scroller"):
+        run.time("build_bundle", lambda name=name: build_bundle(name), game=name)
+        bundle = build_bundle(name)
+        config = {"tickRate": 60, "hudRate": 10}
+        run.time("render_index+digest", lambda: source_digest(render_index(bundle, config)), game=name)
+        with tempfile.TemporaryDirectory() as tmp:
+            # a fresh directory per call: write_bundle keeps files it already wrote
+            fresh = lambda: Path(tempfile.mkdtemp(dir=tmp))
+            run.time("write_bundle", lambda out: write_bundle(bundle, out), setup=fresh, game=name)
+
+
+# -- codecs ----------------------------------------------------------------
+
+
+@suite
+def codec(run: Runner) -> None:
+    xs = array("f", (200 + 150 * np.sin(np.arange(ghost_codec.MAX_SAMPLES) / 20)).tolist())
+    ghost = ghost_codec.Ghost(xs, ghost_codec.INTERVAL, 1234)
+    packed = ghost_codec.encode(ghost)
+    run.time("ghost_codec.encode", lambda: ghost_codec.encode(ghost), samples=len(xs))
+    run.time("ghost_codec.decode", lambda: ghost_codec.decode(packed), samples=len(xs))
+    replay = bot_replay("catch", 1)
+    events = len(replay_codec.decode(replay).events)
+    run.time("replay_codec.decode", lambda: replay_codec.decode(replay), events=events)
+    decoded = replay_codec.decode(replay)
+    run.time("replay_codec.encode", lambda: replay_codec.encode(decoded), events=events)
+
+
+# -- leaderboard -----------------------------------------------------------
+
+LEADERBOARD_ROWS = 100_000
+LEADERBOARD_DAYS = 30
+
+
+@suite
+def leaderboard(run: Runner) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.sqlite3"
+        board = Leaderboard(path, cache_ttl=0.0, max_pending=LEADERBOARD_ROWS)
+        rng = np.random.default_rng(1)
+        start = dt.date(2026, 1, 1)
+        days = [(start + dt.timedelta(days=int(d))).isoformat() for d in rng.integers(0, LEADERBOARD_DAYS, LEADERBOARD_ROWS)]
+        scores = rng.integers(0, 5000, LEADERBOARD_ROWS)
+        started = time.perf_counter()
+        for k in range(LEADERBOARD_ROWS):
+            board.submit("catch", f"p{k % 977}", int(scores[k]), daily=days[k] if k % 3 == 0 else None)
+        enqueued = time.perf_counter() - started
+        board.flush()
+        total = time.perf_counter() - started
+        run.record("leaderboard.submit", [LEADERBOARD_ROWS / enqueued], "rows/s", rows=LEADERBOARD_ROWS)
+        run.record("leaderboard.submit+flush", [LEADERBOARD_ROWS / total], "rows/s", rows=LEADERBOARD_ROWS)
+
+        day = (start + dt.timedelta(days=7)).isoformat()
+        run.time("leaderboard.top", lambda: board.top("catch", 10), unit="queries/s", cache="off", scope="all-time")
+        run.time("leaderboard.top", lambda: board.top("catch", 10, day=day), unit="queries/s", cache="off", scope="day")
+        run.time("leaderboard.top", lambda: board.top("catch", 10, day=day, daily=True), unit="queries/s", cache="off", scope="daily")
+        board.cache_ttl = 60.0
+        run.time("leaderboard.top", lambda: board.top("catch", 10), unit="queries/s", cache="on", scope="all-time")
+        board.close()
+
+
+# -- results ---------------------------------------------------------------
+
+
+def _commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=Path(__file__).parent)
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def _key(row: dict[str, Any]) -> str:
+    return json.dumps([row["name"], row["params"]], sort_keys=True)
+
+
+def compare(results: list[dict[str, Any]], baseline: dict[str, Any]) -> str:
+    before = {_key(row): row for row in baseline["results"]}
+    lines = [f"against {baseline['meta'].get('commit') or 'baseline'} ({baseline['meta'].get('date')}):"]
+    for row in results:
+        old = before.get(_key(row))
+        if old is None:
+            continue
+        label = " ".join([row["name"], *(f"{k}={v}" for k, v in row["params"].items())])
+        lines.append(f"{label:<48} {row['value'] / old['value']:>6.2f}x")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the game engines, markup, codecs and leaderboard.")
+    parser.add_argument("--only", nargs="+", choices=sorted(SUITES), help="suites to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed rounds per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per round, at least")
+    parser.add_argument("--out", type=Path, help="write results JSON here")
+    parser.add_argument("--compare", type=Path, help="results JSON of an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    run = Runner(args.repeat, args.min_time)
+    for name in args.only or SUITES:
+        print(f"== {name}")
+        SUITES[name](run)
+    meta = {
+        "commit": _commit(),
+        "date": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "min_time": args.min_time,
+    }
+    if args.out:
+        args.out.write_text(json.dumps({"meta": meta, "results": run.results}, indent=1), encoding="utf-8")
+        print(f"wrote {args.out}")
+    if args.compare:
+        print(compare(run.results, json.loads(args.compare.read_text(encoding="utf-8"))))
+
+
+if __name__ == "__main__":
+    main()
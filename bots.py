@@ -0,0 +1,250 @@
+"""
+Autoplay bots for soak and regression runs of both games.
+- POLICIES: named input policies per game, run against the headless rules (catch_engine,
+  scroller_engine). catch "greedy" chases the lowest drop still catchable; side_scroller "jumper"
+  jumps as soon as the jump arc clears the next obstacle; "idle" never moves
+- The pages run JS ports of the same policies when GAME_CONFIG["autoplay"] names one (open the
+  Streamlit page with ?autoplay=greedy / ?autoplay=jumper), restarting after every game over
+- soak() plays back-to-back seeded runs at full speed until a frame budget is spent and reports
+  frames per second, peak entity counts and memory growth per run
+- Example: python bots.py catch --frames 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from catch_engine import KEY_SPEED, CatchGame
+from scroller_engine import GRAVITY, JUMP_VY, PLAYER_SIZE, PLAYER_X, ScrollerGame
+
+# -- policies --------------------------------------------------------------
+
+
+def catch_idle(game: CatchGame) -> float:
+    return 0.0
+
+
+def catch_greedy(game: CatchGame) -> float:
+    """Chase the lowest drop that can still be caught (policies.greedy in assets/catch/sim.js)."""
+    floor = game.player_y + game.player_h
+    best = None
+    for d in game.drops:
+        if d.y <= floor and (best is None or d.y > best.y):
+            best = d
+    if best is None:
+        return 0.0
+    centre = game.player_x + game.player_w / 2
+    tx = best.x + 6
+    return KEY_SPEED if tx > centre + 4 else -KEY_SPEED if tx < centre - 4 else 0
+
+
+def _jump_arc() -> list[float]:
+    """Height above the ground on each tick after a jump, until landing (JUMP_ARC in game.js)."""
+    arc = []
+    vy, y = JUMP_VY, 0.0
+    while True:
+        vy += GRAVITY / 60
+        y += vy
+        if y > 0:
+            return arc
+        arc.append(-y)
+
+
+JUMP_ARC = _jump_arc()
+
+
+def scroller_idle(game: ScrollerGame) -> bool:
+    return False
+
+
+def scroller_jumper(game: ScrollerGame) -> bool:
+    """Jump as soon as the arc clears the next obstacle (policies.jumper in assets/side_scroller/game.js)."""
+    if not game.on_ground:
+        return False
+    for o in game.obstacles:
+        if o.x + o.w <= PLAYER_X:
+            continue
+        t_in = (o.x - (PLAYER_X + PLAYER_SIZE)) / o.speed
+        t_out = (o.x + o.w - PLAYER_X) / o.speed
+        for n in range(max(0, math.floor(t_in)), math.ceil(t_out) + 1):
+            if n >= len(JUMP_ARC) or JUMP_ARC[n] < o.h + 2:
+                return False
+        return True
+    return False
+
+
+@dataclass(frozen=True)
+class BotGame:
+    """How the soak loop drives one game: engine factory, input and what counts as an entity."""
+
+    new: Callable[[int], Any]
+    apply: Callable[[Any, Any], None]
+    entities: Callable[[Any], int]
+    policies: dict[str, Callable[[Any], Any]]
+    default_policy: str
+
+
+def _steer(game: CatchGame, vx: Optional[float]) -> None:
+    if vx is not None:
+        game.player_vx = vx
+
+
+def _press(game: ScrollerGame, jump: bool) -> None:
+    if jump:
+        game.jump()
+
+
+GAMES: dict[str, BotGame] = {
+    "catch": BotGame(
+        new=CatchGame,
+        apply=_steer,
+        entities=lambda game: len(game.drops),
+        policies={"greedy": catch_greedy, "idle": catch_idle},
+        default_policy="greedy",
+    ),
+    "side_scroller": BotGame(
+        new=ScrollerGame,
+        apply=_press,
+        entities=lambda game: len(game.obstacles),
+        policies={"jumper": scroller_jumper, "idle": scroller_idle},
+        default_policy="jumper",
+    ),
+}
+POLICIES = {name: bot.policies for name, bot in GAMES.items()}
+
+# -- soak ------------------------------------------------------------------
+
+
+def _rss_kb() -> int:
+    """Current resident set size; falls back to the peak where /proc is missing."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        import resource  # not on Windows, where /proc is missing too
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+
+@dataclass
+class RunStats:
+    seed: int
+    frames: int
+    score: int
+    peak_entities: int
+    memory_kb: int  # traced Python heap with --trace-memory, else process RSS, at the run's end
+
+
+@dataclass
+class SoakReport:
+    game: str
+    policy: str
+    frames: int = 0
+    seconds: float = 0.0
+    memory: str = "rss"
+    runs: list[RunStats] = field(default_factory=list)
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.seconds if self.seconds else 0.0
+
+    @property
+    def memory_growth_per_run_kb(self) -> float:
+        if len(self.runs) < 2:
+            return 0.0
+        return (self.runs[-1].memory_kb - self.runs[0].memory_kb) / (len(self.runs) - 1)
+
+    def summary(self) -> dict[str, Any]:
+        scores = [r.score for r in self.runs]
+        return {
+            "game": self.game,
+            "policy": self.policy,
+            "runs": len(self.runs),
+            "frames": self.frames,
+            "seconds": round(self.seconds, 3),
+            "fps": round(self.fps),
+            "score_mean": sum(scores) / len(scores) if scores else 0,
+            "score_max": max(scores, default=0),
+            "peak_entities": max((r.peak_entities for r in self.runs), default=0),
+            "memory": self.memory,
+            "memory_first_kb": self.runs[0].memory_kb if self.runs else 0,
+            "memory_last_kb": self.runs[-1].memory_kb if self.runs else 0,
+            "memory_growth_per_run_kb": round(self.memory_growth_per_run_kb, 2),
+        }
+
+
+def soak(
+    game: str,
+    policy: Optional[str] = None,
+    frames: int = 1_000_000,
+    seed: int = 1,
+    max_time: float = 600.0,
+    trace_memory: bool = False,
+) -> SoakReport:
+    """Back-to-back runs (seed, seed + 1, ...) until ``frames`` ticks have been played."""
+    bot = GAMES[game]
+    policy = policy or bot.default_policy
+    decide = bot.policies[policy]
+    apply, entities = bot.apply, bot.entities
+    report = SoakReport(game, policy, memory="traced" if trace_memory else "rss")
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        while report.frames < frames:
+            run = bot.new(seed)
+            max_ticks = min(int(round(max_time / run.dt)), frames - report.frames)
+            peak = 0
+            step = run.step
+            while run.running and run.ticks < max_ticks:
+                apply(run, decide(run))
+                step()
+                n = entities(run)
+                if n > peak:
+                    peak = n
+            memory = tracemalloc.get_traced_memory()[0] // 1024 if trace_memory else _rss_kb()
+            report.runs.append(RunStats(seed, run.ticks, run.result().score, peak, memory))
+            report.frames += run.ticks
+            seed += 1
+    finally:
+        report.seconds = time.perf_counter() - started
+        if trace_memory:
+            tracemalloc.stop()
+    return report
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Soak-test a game's headless rules with an autoplay bot.")
+    parser.add_argument("game", choices=sorted(GAMES))
+    parser.add_argument("--policy", help="bot policy (catch: greedy, idle; side_scroller: jumper, idle)")
+    parser.add_argument("--frames", type=int, default=1_000_000, help="ticks to play in total")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the first run; each run uses the next")
+    parser.add_argument("--max-time", type=float, default=600.0, help="sim seconds before a run is cut off")
+    parser.add_argument("--trace-memory", action="store_true", help="measure the Python heap (slower) instead of RSS")
+    parser.add_argument("--json", type=Path, help="also write the summary and per-run stats here")
+    args = parser.parse_args(argv)
+    policies = GAMES[args.game].policies
+    if args.policy is not None and args.policy not in policies:
+        parser.error(f"unknown policy for {args.game}: {args.policy} (choose from {', '.join(policies)})")
+
+    report = soak(args.game, args.policy, args.frames, args.seed, args.max_time, args.trace_memory)
+    summary = report.summary()
+    for key, value in summary.items():
+        print(f"{key:>26}  {value}")
+    if args.json:
+        args.json.write_text(json.dumps({**summary, "runs": [asdict(r) for r in report.runs]}, indent=1), encoding="utf-8")
+        print(f"wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+"""
+NumPy batch version of catch_engine: many seeded catch games stepped together, one array row per game.
+- Same rules, draw order and float arithmetic as CatchGame.step(), so every row finishes exactly like
+  CatchGame(seed, tuning=...) driven by the same policy; games only differ in their seed
+- Drops live in (games x slots) arrays kept in CatchGame's list order (append, backwards
+  swap-remove); catches and misses are rare, so only slots with an event are walked one by one
+- Finished games are compacted out of the working arrays as the batch thins out
+- Policies see the batch and return one paddle velocity per live row (see POLICIES)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+from catch_engine import (
+    DEFAULT_TUNING,
+    FRAGMENT_GOAL,
+    HEIGHT,
+    KEY_SPEED,
+    MISSION_TYPES,
+    THEME_COUNT,
+    TICK_RATE,
+    WIDTH,
+    WIND_LOCKOUT,
+    Tuning,
+)
+
+# effect columns, in catch_engine.EFFECT_NAMES order
+SLOW, FEVER, RAINBOW, MAGNET, REFLECTOR, SHIELD = range(6)
+# drop kinds: 0 = normal, then catch_engine.SPECIAL_KINDS order
+K_SLOW, K_FEVER, K_MAGNET, K_REFLECTOR, K_RAINBOW = range(1, 6)
+M_RIGHT, M_LEFT, M_SPECIALS, M_NO_MISS = range(len(MISSION_TYPES))
+MISSION_TARGETS = np.array([3.0, 3.0, 2.0, 15.0])
+
+DROP_SIZE = 12
+PLAYER_W = 36
+PLAYER_H = 16
+PLAYER_Y = HEIGHT - 54
+
+_GAME_FIELDS = (
+    "ids", "rng", "running", "end_time", "first_miss", "effects", "player_x", "player_vx",
+    "score", "lives", "speed_base", "spawn_timer", "chain_stage", "fragments", "combo_count",
+    "theme_index", "wind", "wind_timer", "mission_type", "mission_target", "mission_progress",
+    "mission_timer", "last_miss_time", "catches", "misses", "missions_done",
+    "drop_count", "drop_x", "drop_y", "drop_vy", "drop_vx", "drop_kind",
+)
+_DROP_FIELDS = ("drop_x", "drop_y", "drop_vy", "drop_vx", "drop_kind")
+
+
+@dataclass
+class BatchResult:
+    """Per-game outcomes of :func:`run_batch`, row i belonging to ``seeds[i]``."""
+
+    seeds: np.ndarray
+    score: np.ndarray
+    time: np.ndarray  # sim seconds survived (max_time for games still running)
+    first_miss: np.ndarray  # sim time of the first life lost, NaN if none was
+    lives: np.ndarray
+    catches: np.ndarray
+    misses: np.ndarray
+    missions: np.ndarray
+    curve_times: np.ndarray  # sample times of ``curve``
+    curve: np.ndarray  # (games x samples) score at each sample time, final score after game over
+
+
+BatchPolicy = Callable[["CatchBatch"], Optional[np.ndarray]]
+
+
+class CatchBatch:
+    """``len(seeds)`` catch games advanced in lockstep with :meth:`step`."""
+
+    def __init__(self, seeds, tick_rate: int = TICK_RATE, tuning: Tuning = DEFAULT_TUNING, drop_slots: int = 32) -> None:
+        self.tuning = tuning
+        self.dt = 1.0 / tick_rate
+        self.time = 0.0
+        self.ticks = 0
+        seeds = np.asarray(seeds, dtype=np.int64)
+        n = len(seeds)
+        self.seeds = seeds
+        self.ids = np.arange(n)
+        self.rng = (seeds & 0xFFFFFFFF).astype(np.uint32)
+        self.running = np.ones(n, dtype=bool)
+        self.end_time = np.zeros(n)
+        self.first_miss = np.full(n, np.nan)
+        self.effects = np.zeros((n, 6))
+        self.player_x = np.full(n, WIDTH / 2 - 18)
+        self.player_vx = np.zeros(n)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.lives = np.full(n, 3, dtype=np.int64)
+        self.speed_base = np.full(n, float(tuning.speed_base))
+        self.spawn_timer = np.full(n, 0.2)
+        self.chain_stage = np.zeros(n, dtype=np.int8)
+        self.fragments = np.zeros(n, dtype=np.int64)
+        self.combo_count = np.zeros(n, dtype=np.int64)
+        self.theme_index = np.zeros(n, dtype=np.int64)
+        self.wind = np.zeros(n)
+        self.wind_timer = np.full(n, 4.0)
+        self.mission_type = np.zeros(n, dtype=np.int8)
+        self.mission_target = np.zeros(n)
+        self.mission_progress = np.zeros(n)
+        self.mission_timer = np.zeros(n)
+        self.last_miss_time = np.zeros(n)
+        self.catches = np.zeros(n, dtype=np.int64)
+        self.misses = np.zeros(n, dtype=np.int64)
+        self.missions_done = np.zeros(n, dtype=np.int64)
+        self.drop_count = np.zeros(n, dtype=np.int64)
+        self.drop_x = np.zeros((n, drop_slots))
+        self.drop_y = np.zeros((n, drop_slots))
+        self.drop_vy = np.zeros((n, drop_slots))
+        self.drop_vx = np.zeros((n, drop_slots))
+        self.drop_kind = np.zeros((n, drop_slots), dtype=np.int8)
+        self._init_mission(self.ids.copy())
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # -- helpers -----------------------------------------------------------
+
+    def random(self, rows: np.ndarray) -> np.ndarray:
+        """Next mulberry32 float for each of ``rows`` (advances only those generators)."""
+        s = self.rng[rows] + np.uint32(0x6D2B79F5)
+        self.rng[rows] = s
+        t = (s ^ (s >> 15)) * (s | 1)
+        t = (t + (t ^ (t >> 7)) * (t | 61)) ^ t
+        return (t ^ (t >> 14)) / 4294967296.0
+
+    def difficulty_factor(self) -> float:
+        # every live row has the same clock, so this is one number for the batch
+        return 1 + min(self.time / self.tuning.difficulty_ramp, self.tuning.difficulty_cap)
+
+    def speed_multiplier(self) -> np.ndarray:
+        e = self.effects
+        m = np.ones(len(self.ids))
+        m = np.where(e[:, SLOW] > 0, m * 0.55, m)
+        m = np.where(e[:, FEVER] > 0, m * 1.25, m)
+        return np.where(e[:, RAINBOW] > 0, m * 0.05, m)
+
+    def score_multiplier(self, rows: np.ndarray) -> np.ndarray:
+        e = self.effects[rows]
+        return np.where(e[:, FEVER] > 0, 2, 1) * np.where(e[:, RAINBOW] > 0, 3, 1)
+
+    def drop_width(self) -> int:
+        """Slots in use by the fullest game; columns past it are empty for every row."""
+        return int(self.drop_count.max()) if len(self.ids) else 0
+
+    def active_drops(self) -> np.ndarray:
+        """(games x drop_width()) mask of the slots holding a drop."""
+        return np.arange(self.drop_width()) < self.drop_count[:, None]
+
+    def _grow_drops(self) -> None:
+        for name in _DROP_FIELDS:
+            old = getattr(self, name)
+            new = np.zeros((old.shape[0], old.shape[1] * 2), dtype=old.dtype)
+            new[:, : old.shape[1]] = old
+            setattr(self, name, new)
+
+    def _remove_drop(self, rows: np.ndarray, slot: int) -> None:
+        last = self.drop_count[rows] - 1
+        for name in _DROP_FIELDS:
+            arr = getattr(self, name)
+            arr[rows, slot] = arr[rows, last]
+        self.drop_count[rows] = last
+
+    def compact(self) -> "CatchBatch":
+        """Drop finished games from the working arrays; returns the rows removed as a new batch view."""
+        keep = self.running
+        done = CatchBatch.__new__(CatchBatch)
+        done.__dict__.update(self.__dict__)
+        for name in _GAME_FIELDS:
+            arr = getattr(self, name)
+            setattr(done, name, arr[~keep])
+            setattr(self, name, arr[keep])
+        return done
+
+    # -- rules -------------------------------------------------------------
+
+    def _init_mission(self, rows: np.ndarray) -> None:
+        t = (self.random(rows) * len(MISSION_TYPES)).astype(np.int8)
+        self.mission_timer[rows] = self.time + 30
+        self.mission_type[rows] = t
+        self.mission_target[rows] = MISSION_TARGETS[t]
+        self.mission_progress[rows] = 0.0
+
+    def _maybe_advance_theme(self, rows: np.ndarray) -> None:
+        rows = rows[self.fragments[rows] >= FRAGMENT_GOAL]
+        self.fragments[rows] = 0
+        self.theme_index[rows] = (self.theme_index[rows] + 1) % THEME_COUNT
+
+    def _update_mission(self, rows: np.ndarray, drop_x: Optional[np.ndarray] = None, drop_kind=None) -> None:
+        mt = self.mission_type[rows]
+        if drop_x is not None:
+            hit = (
+                ((mt == M_RIGHT) & (drop_x > WIDTH / 2))
+                | ((mt == M_LEFT) & (drop_x < WIDTH / 2))
+                | ((mt == M_SPECIALS) & (drop_kind != 0))
+            )
+            self.mission_progress[rows[hit]] += 1
+        no_miss = rows[mt == M_NO_MISS]
+        if len(no_miss):
+            since_miss = self.time - self.last_miss_time[no_miss]
+            self.mission_progress[no_miss] = np.maximum(
+                self.mission_progress[no_miss], np.minimum(self.mission_target[no_miss], since_miss)
+            )
+        done = rows[self.mission_progress[rows] >= self.mission_target[rows]]
+        if len(done):
+            self.fragments[done] += 1
+            self.effects[done, SHIELD] = 5.0
+            self.missions_done[done] += 1
+            self._maybe_advance_theme(done)
+            self._init_mission(done)
+        expired = rows[self.time > self.mission_timer[rows]]
+        if len(expired):
+            self._init_mission(expired)
+
+    def _handle_combo(self, rows: np.ndarray, kind: np.ndarray) -> None:
+        e = self.effects
+        slow = rows[kind == K_SLOW]
+        self.chain_stage[slow] = 1
+        e[slow, SLOW] = 6.0
+        fever = kind == K_FEVER
+        chained = fever & (self.chain_stage[rows] == 1)
+        e[rows[chained], RAINBOW] = 3.0
+        e[rows[fever & ~chained], FEVER] = 7.0
+        self.chain_stage[rows[kind != K_SLOW]] = 0
+        e[rows[kind == K_MAGNET], MAGNET] = 6.0
+        e[rows[kind == K_REFLECTOR], REFLECTOR] = 7.0
+        e[rows[kind == K_RAINBOW], RAINBOW] = 3.0
+
+    def _spawn(self, rows: np.ndarray, df: float) -> None:
+        tuning = self.tuning
+        x = 18 + self.random(rows) * (WIDTH - 36)
+        vy = (self.speed_base[rows] * df * self.speed_multiplier()[rows]) / 70
+        kind = np.zeros(len(rows), dtype=np.int8)
+        special = self.random(rows) < tuning.special_rate
+        kind[special] = (self.random(rows[special]) * 5).astype(np.int8) + 1
+        if self.drop_count[rows].max() >= self.drop_x.shape[1]:
+            self._grow_drops()
+        slot = self.drop_count[rows]
+        self.drop_x[rows, slot] = x
+        self.drop_y[rows, slot] = -12.0
+        self.drop_vy[rows, slot] = vy
+        self.drop_vx[rows, slot] = 0.0
+        self.drop_kind[rows, slot] = kind
+        self.drop_count[rows] += 1
+
+    def step(self) -> None:
+        """Advance every game one tick; rows mirror CatchGame.step() line for line."""
+        dt = self.dt
+        tuning = self.tuning
+        alive = np.flatnonzero(self.running)
+        self.time += dt
+        self.ticks += 1
+        e = self.effects
+        np.maximum(e - dt, 0.0, out=e)
+
+        px = self.player_x + self.player_vx * dt
+        self.player_x = np.maximum(6, np.minimum(WIDTH - PLAYER_W - 6, px))
+
+        self.wind_timer -= dt
+        if self.time >= WIND_LOCKOUT:
+            gust = alive[self.wind_timer[alive] <= 0]
+            if len(gust):
+                self.wind[gust] = (self.random(gust) - 0.5) * 60
+                self.wind_timer[gust] = 6 + self.random(gust) * 6
+        else:
+            self.wind[:] = 0.0
+            self.wind_timer[:] = 1.0
+
+        self.spawn_timer -= dt
+        due = alive[self.spawn_timer[alive] <= 0]
+        if len(due):
+            df = self.difficulty_factor()
+            self._spawn(due, df)
+            slow = e[due, SLOW] > 0
+            eff = np.where(slow, 1.25, np.where(e[due, FEVER] > 0, 0.85, 1.0))
+            self.spawn_timer[due] = np.maximum(tuning.spawn_floor, (tuning.spawn_base * eff) / df)
+
+        time_scale = self.speed_multiplier()
+        active = self.active_drops()
+        w = active.shape[1]
+        x, y, vx = self.drop_x[:, :w], self.drop_y[:, :w], self.drop_vx[:, :w]
+        reflector = e[:, REFLECTOR] > 0
+        if reflector[alive].any():
+            # a new drop under the reflector takes its sideways speed in list order
+            needs = active & (vx == 0) & reflector[:, None]
+            needs[~self.running] = False
+            for slot in np.flatnonzero(needs.any(axis=0)):
+                rows = np.flatnonzero(needs[:, slot])
+                vx[rows, slot] = (self.random(rows) - 0.5) * 50
+            moving = active & reflector[:, None]
+            x[moving] += vx[moving] * dt
+            bounce = moving & ((x < 2) | (x > WIDTH - DROP_SIZE - 2))
+            vx[bounce] *= -1
+        x += (self.wind * dt * 0.25)[:, None]
+        y += self.drop_vy[:, :w] * 60 * dt * time_scale[:, None]
+        magnet = e[:, MAGNET] > 0
+        if magnet.any():
+            target = (self.player_x + PLAYER_W / 2)[magnet, None]
+            x[magnet] += (target - x[magnet]) * 0.6 * dt
+
+        live = active & self.running[:, None]
+        px = self.player_x[:, None]
+        caught = live & (x + DROP_SIZE >= px) & (x <= px + PLAYER_W) & (y + DROP_SIZE >= PLAYER_Y) & (y <= PLAYER_Y + PLAYER_H)
+        missed = live & ~caught & (y > HEIGHT + 10)
+        events = caught | missed
+        if events.any():
+            # backwards, like CatchGame: the drop swapped into a slot was already visited
+            for slot in np.flatnonzero(events.any(axis=0))[::-1]:
+                self._catch(np.flatnonzero(caught[:, slot]), slot)
+                self._miss(np.flatnonzero(missed[:, slot]), slot)
+
+        self._update_mission(alive)
+
+    def _catch(self, rows: np.ndarray, slot: int) -> None:
+        if not len(rows):
+            return
+        tuning = self.tuning
+        kind = self.drop_kind[rows, slot]
+        drop_x = self.drop_x[rows, slot]
+        self._remove_drop(rows, slot)
+        self.score[rows] += 10 * self.score_multiplier(rows)
+        self.combo_count[rows] += 1
+        self.catches[rows] += 1
+        self.speed_base[rows] = np.minimum(self.speed_base[rows] + tuning.catch_speedup, tuning.speed_cap)
+        special = kind != 0
+        if special.any():
+            srows = rows[special]
+            self._handle_combo(srows, kind[special])
+            lucky = srows[self.random(srows) < 0.35]
+            self.fragments[lucky] += 1
+            self._maybe_advance_theme(lucky)
+        self._update_mission(rows, drop_x, kind)
+
+    def _miss(self, rows: np.ndarray, slot: int) -> None:
+        if not len(rows):
+            return
+        x = self.drop_x[rows, slot]
+        self._remove_drop(rows, slot)
+        lost = rows[(x + DROP_SIZE > 0) & (x < WIDTH) & (self.effects[rows, SHIELD] <= 0)]
+        self.lives[lost] -= 1
+        self.misses[lost] += 1
+        self.last_miss_time[lost] = self.time
+        self.combo_count[lost] = 0
+        first = lost[np.isnan(self.first_miss[lost])]
+        self.first_miss[first] = self.time
+        over = lost[self.lives[lost] <= 0]
+        self.running[over] = False
+        self.end_time[over] = self.time
+
+
+# -- policies --------------------------------------------------------------
+
+
+def idle_policy(batch: CatchBatch) -> Optional[np.ndarray]:
+    """Never moves: the floor of the difficulty curve."""
+    return None
+
+
+def _chase(batch: CatchBatch, below: float, speed: float) -> np.ndarray:
+    active = batch.active_drops()
+    if not active.shape[1]:
+        return np.zeros(len(batch))
+    y = batch.drop_y[:, : active.shape[1]]
+    active &= y > below
+    y = np.where(active, y, -np.inf)
+    lowest = y.argmax(axis=1)
+    rows = np.arange(len(batch))
+    centre = batch.player_x + PLAYER_W / 2
+    tx = batch.drop_x[rows, lowest] + DROP_SIZE / 2
+    vx = np.where(tx > centre + 4, speed, np.where(tx < centre - 4, -speed, 0.0))
+    return np.where(active.any(axis=1), vx, 0.0)
+
+
+def tracker_policy(batch: CatchBatch) -> np.ndarray:
+    """Full-speed keyboard player chasing the lowest drop on screen."""
+    return _chase(batch, -np.inf, KEY_SPEED)
+
+
+def casual_policy(batch: CatchBatch) -> np.ndarray:
+    """Slower player who only reacts to drops in the lower half of the screen."""
+    return _chase(batch, HEIGHT / 2, KEY_SPEED * 0.7)
+
+
+POLICIES: dict[str, BatchPolicy] = {
+    "idle": idle_policy,
+    "tracker": tracker_policy,
+    "casual": casual_policy,
+}
+
+
+# -- driver ----------------------------------------------------------------
+
+
+def run_batch(
+    seeds,
+    policy: Optional[BatchPolicy] = None,
+    tuning: Tuning = DEFAULT_TUNING,
+    max_time: float = 600.0,
+    sample_every: float = 10.0,
+    tick_rate: int = TICK_RATE,
+) -> BatchResult:
+    """Play one game per seed until all are over (or ``max_time``); ``policy`` runs before every tick."""
+    batch = CatchBatch(seeds, tick_rate, tuning)
+    n = len(batch)
+    max_ticks = int(round(max_time * tick_rate))
+    sample_ticks = max(1, int(round(sample_every * tick_rate)))
+    curve_times = np.arange(1, max_ticks // sample_ticks + 1) * sample_ticks / tick_rate
+    curve = np.full((n, len(curve_times)), np.nan)
+    out = {
+        name: np.zeros(n, dtype=getattr(batch, name).dtype)
+        for name in ("score", "lives", "catches", "misses", "missions_done", "end_time", "first_miss")
+    }
+
+    def collect(rows: CatchBatch) -> None:
+        for name in out:
+            out[name][rows.ids] = getattr(rows, name)
+
+    while batch.ticks < max_ticks and len(batch):
+        if policy is not None:
+            vx = policy(batch)
+            if vx is not None:
+                batch.player_vx = np.asarray(vx, dtype=float)
+        batch.step()
+        if batch.ticks % sample_ticks == 0:
+            curve[batch.ids, batch.ticks // sample_ticks - 1] = batch.score
+        if batch.running.mean() < 0.75:
+            collect(batch.compact())
+    batch.end_time[batch.running] = batch.time
+    collect(batch)
+    # after game over a run keeps its final score
+    curve = np.where(np.isnan(curve), out["score"][:, None], curve)
+    return BatchResult(
+        seeds=np.asarray(seeds),
+        score=out["score"],
+        time=out["end_time"],
+        first_miss=out["first_miss"],
+        lives=out["lives"],
+        catches=out["catches"],
+        misses=out["misses"],
+        missions=out["missions_done"],
+        curve_times=curve_times,
+        curve=curve,
+    )
@@ -0,0 +1,428 @@
+"""
+Headless rules engine for the Game & Watch catch game (game_app.py).
+- Mirrors the JS step() / spawnDrop() / handleCombo() / updateMission() state machine
+- Seeded mulberry32 PRNG (bit-identical to mulberry32() in assets/common/core.js) and a fixed timestep
+- Simulation clock instead of performance.now(), so a run is a pure function of seed + inputs
+- No canvas, sparks or audio: only the state that affects score, lives and themes
+- Difficulty knobs come from a Tuning (defaults = the shipped game); tune_difficulty.py sweeps them
+- A Schedule (daily challenge, see daily_challenge.py) supplies drops, gusts and missions in order
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+WIDTH = 420
+HEIGHT = 450
+TICK_RATE = 60
+WIND_LOCKOUT = 15.0  # first 15s no wind
+FRAGMENT_GOAL = 3
+THEME_COUNT = 3
+SPECIAL_RATE = 0.18
+SPECIAL_KINDS = ("slow", "fever", "magnet", "reflector", "rainbow")
+MISSION_TYPES = ("right", "left", "specials", "no_miss")
+EFFECT_NAMES = ("slow", "fever", "rainbow", "magnet", "reflector", "shield")
+KEY_SPEED = 120
+JOY_SPEED = 140
+
+_MASK32 = 0xFFFFFFFF
+
+
+def _imul(a: int, b: int) -> int:
+    return (a * b) & _MASK32
+
+
+class Mulberry32:
+    """Seedable PRNG producing the same floats as mulberry32() in assets/common/core.js."""
+
+    __slots__ = ("state",)
+
+    def __init__(self, seed: int) -> None:
+        self.state = seed & _MASK32
+
+    def random(self) -> float:
+        self.state = (self.state + 0x6D2B79F5) & _MASK32
+        a = self.state
+        t = _imul(a ^ (a >> 15), a | 1)
+        t = ((t + _imul(t ^ (t >> 7), t | 61)) & _MASK32) ^ t
+        return (t ^ (t >> 14)) / 4294967296
+
+
+class Drop:
+    __slots__ = ("x", "y", "w", "h", "vy", "kind", "vx")
+
+    def __init__(self, x: float, vy: float, kind: str) -> None:
+        self.x = x
+        self.y = -12.0
+        self.w = 12
+        self.h = 12
+        self.vy = vy
+        self.kind = kind
+        self.vx = 0.0
+
+
+class Mission:
+    __slots__ = ("type", "target", "progress", "text")
+
+    def __init__(self, type_: str, target: int, text: str) -> None:
+        self.type = type_
+        self.target = target
+        self.progress = 0.0
+        self.text = text
+
+
+@dataclass(frozen=True)
+class Tuning:
+    """Difficulty knobs of the catch game; the defaults are the values game.js ships with."""
+
+    spawn_base: float = 3.0  # seconds between drops before difficulty and effects
+    speed_base: float = 28.0  # drops fall speed_base * difficulty / 70 px per 1/60 s
+    catch_speedup: float = 1.2  # added to speed_base on every catch
+    speed_cap: float = 150.0  # speed_base never grows past this
+    difficulty_ramp: float = 100.0  # seconds of play per +1 of difficulty factor
+    difficulty_cap: float = 1.8  # most the factor grows above 1 (2.8x after 180 s)
+    spawn_floor: float = 0.36  # shortest gap between drops, seconds
+    special_rate: float = SPECIAL_RATE  # chance that a drop is a special gem
+
+
+DEFAULT_TUNING = Tuning()
+
+
+@dataclass
+class Schedule:
+    """Pre-drawn outcomes of a daily-challenge run, taken in order instead of drawing from the rng.
+
+    When a list runs out the game falls back to its rng, like the page does.
+    """
+
+    spawns: list[tuple[float, int]] = field(default_factory=list)  # (x, kind: 0 normal, 1.. SPECIAL_KINDS)
+    gusts: list[tuple[float, float]] = field(default_factory=list)  # (wind, seconds until the next gust)
+    missions: list[int] = field(default_factory=list)  # index into MISSION_TYPES
+
+
+@dataclass
+class RunResult:
+    seed: int
+    score: int
+    time: float
+    ticks: int
+    lives: int
+    catches: int
+    misses: int
+    missions: int
+    theme_index: int
+
+
+Policy = Callable[["CatchGame"], Optional[float]]
+
+
+class CatchGame:
+    """One catch-game session, advanced with :meth:`step` at a fixed ``tick_rate``."""
+
+    def __init__(
+        self,
+        seed: int = 0,
+        tick_rate: int = TICK_RATE,
+        theme_index: int = 0,
+        tuning: Tuning = DEFAULT_TUNING,
+        schedule: Optional[Schedule] = None,
+    ) -> None:
+        self.seed = seed
+        self.tuning = tuning
+        self.schedule = schedule
+        self.rng = Mulberry32(seed)
+        self.dt = 1.0 / tick_rate
+        self.unlocked = {0, theme_index}
+        self.selected_theme = theme_index
+        self.reset()
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def reset(self) -> None:
+        if self.schedule is not None:  # a daily run restarts from the top of the day
+            self.rng = Mulberry32(self.seed)
+        self.next_spawn = self.next_gust = self.next_mission = 0
+        self.player_x = WIDTH / 2 - 18
+        self.player_y = HEIGHT - 54
+        self.player_w = 36
+        self.player_h = 16
+        self.player_vx = 0.0
+        self.drops: list[Drop] = []
+        self.score = 0
+        self.lives = 3
+        self.speed_base = self.tuning.speed_base
+        self.spawn_base = self.tuning.spawn_base
+        self.spawn_timer = 0.2
+        self.running = True
+        self.time = 0.0
+        self.ticks = 0
+        self.effects = dict.fromkeys(EFFECT_NAMES, 0.0)
+        self.chain_stage = 0
+        self.fragments = 0
+        self.combo_count = 0
+        self.theme_index = self.selected_theme
+        self.wind = 0.0
+        self.wind_timer = 4.0
+        self.floor_phase = 0.0
+        self.mission: Optional[Mission] = None
+        self.mission_timer = 0.0
+        self.last_miss_time = 0.0
+        self.catches = 0
+        self.misses = 0
+        self.missions_done = 0
+        self.init_mission()
+
+    # -- input -------------------------------------------------------------
+
+    def set_velocity(self, vx: float) -> None:
+        """Keyboard / button / joystick input: horizontal speed in px/s."""
+        self.player_vx = vx
+
+    def drag_to(self, x: float) -> None:
+        """Swipe input: move the paddle directly, clamped like ``clampPlayer``."""
+        self.player_x = max(6, min(WIDTH - self.player_w - 6, x))
+
+    # -- rules -------------------------------------------------------------
+
+    def difficulty_factor(self) -> float:
+        return 1 + min(self.time / self.tuning.difficulty_ramp, self.tuning.difficulty_cap)
+
+    def speed_multiplier(self) -> float:
+        effects = self.effects
+        m = 1.0
+        if effects["slow"] > 0:
+            m *= 0.55
+        if effects["fever"] > 0:
+            m *= 1.25
+        if effects["rainbow"] > 0:
+            m *= 0.05
+        return m
+
+    def score_multiplier(self) -> int:
+        m = 1
+        if self.effects["fever"] > 0:
+            m *= 2
+        if self.effects["rainbow"] > 0:
+            m *= 3
+        return m
+
+    def spawn_drop(self) -> None:
+        schedule = self.schedule
+        if schedule is not None and self.next_spawn < len(schedule.spawns):
+            x, k = schedule.spawns[self.next_spawn]
+            self.next_spawn += 1
+            kind = SPECIAL_KINDS[k - 1] if k else "normal"
+        else:
+            rng = self.rng
+            x = 18 + rng.random() * (WIDTH - 36)
+            special = rng.random() < self.tuning.special_rate
+            kind = SPECIAL_KINDS[int(rng.random() * len(SPECIAL_KINDS))] if special else "normal"
+        vy = (self.speed_base * self.difficulty_factor() * self.speed_multiplier()) / 70
+        self.drops.append(Drop(x, vy, kind))
+
+    def apply_effect(self, kind: str) -> None:
+        if kind == "slow":
+            self.effects["slow"] = 6.0
+        elif kind == "fever":
+            self.effects["fever"] = 7.0
+        elif kind == "rainbow":
+            self.effects["rainbow"] = 3.0
+        elif kind == "magnet":
+            self.effects["magnet"] = 6.0
+        elif kind == "reflector":
+            self.effects["reflector"] = 7.0
+
+    def handle_combo(self, kind: str) -> None:
+        if kind == "slow":
+            self.chain_stage = 1
+            self.apply_effect("slow")
+            return
+        if kind == "fever":
+            self.apply_effect("rainbow" if self.chain_stage == 1 else "fever")
+            self.chain_stage = 0
+            return
+        self.chain_stage = 0
+        self.apply_effect(kind)
+
+    def init_mission(self) -> None:
+        schedule = self.schedule
+        if schedule is not None and self.next_mission < len(schedule.missions):
+            t = MISSION_TYPES[schedule.missions[self.next_mission]]
+            self.next_mission += 1
+        else:
+            t = MISSION_TYPES[int(self.rng.random() * len(MISSION_TYPES))]
+        self.mission_timer = self.time + 30
+        if t == "right":
+            self.mission = Mission(t, 3, "Catch 3 on right (30s)")
+        elif t == "left":
+            self.mission = Mission(t, 3, "Catch 3 on left (30s)")
+        elif t == "specials":
+            self.mission = Mission(t, 2, "Catch 2 special gems (30s)")
+        else:
+            self.mission = Mission(t, 15, "15s no miss (30s)")
+
+    def complete_mission(self) -> None:
+        self.fragments += 1
+        self.effects["shield"] = 5.0
+        self.missions_done += 1
+        self.maybe_advance_theme()
+        self.init_mission()
+
+    def update_mission(self, drop: Optional[Drop]) -> None:
+        mission = self.mission
+        if mission is None:
+            return
+        if drop is not None:
+            if mission.type == "right" and drop.x > WIDTH / 2:
+                mission.progress += 1
+            elif mission.type == "left" and drop.x < WIDTH / 2:
+                mission.progress += 1
+            elif mission.type == "specials" and drop.kind != "normal":
+                mission.progress += 1
+        if mission.type == "no_miss":
+            since_miss = self.time - self.last_miss_time
+            mission.progress = max(mission.progress, min(mission.target, since_miss))
+        if mission.progress >= mission.target:
+            self.complete_mission()
+        if self.time > self.mission_timer:
+            self.init_mission()
+
+    def maybe_advance_theme(self) -> None:
+        if self.fragments >= FRAGMENT_GOAL:
+            self.fragments = 0
+            nxt = (self.theme_index + 1) % THEME_COUNT
+            self.unlocked.add(nxt)
+            self.theme_index = nxt
+            self.selected_theme = nxt
+
+    def step(self, dt: Optional[float] = None) -> None:
+        """Advance one tick; the body follows the JS ``step(dt)`` line for line."""
+        if dt is None:
+            dt = self.dt
+        rng = self.rng
+        effects = self.effects
+        self.time += dt
+        self.ticks += 1
+        for k, v in effects.items():
+            if v > 0:
+                effects[k] = max(0.0, v - dt)
+
+        self.player_x += self.player_vx * dt
+        self.player_x = max(6, min(WIDTH - self.player_w - 6, self.player_x))
+
+        self.wind_timer -= dt
+        if self.time >= WIND_LOCKOUT:
+            if self.wind_timer <= 0:
+                schedule = self.schedule
+                if schedule is not None and self.next_gust < len(schedule.gusts):
+                    self.wind, self.wind_timer = schedule.gusts[self.next_gust]
+                    self.next_gust += 1
+                else:
+                    self.wind = (rng.random() - 0.5) * 60
+                    self.wind_timer = 6 + rng.random() * 6
+        else:
+            self.wind = 0.0
+            self.wind_timer = 1.0
+        self.floor_phase += dt
+
+        self.spawn_timer -= dt
+        if self.spawn_timer <= 0:
+            self.spawn_drop()
+            df = self.difficulty_factor()
+            eff = 1.25 if effects["slow"] > 0 else 0.85 if effects["fever"] > 0 else 1.0
+            self.spawn_timer = max(self.tuning.spawn_floor, (self.spawn_base * eff) / df)
+
+        time_scale = self.speed_multiplier()
+        reflector = effects["reflector"] > 0
+        magnet = effects["magnet"] > 0
+        target = self.player_x + self.player_w / 2
+        drift = self.wind * dt * 0.25
+        for d in self.drops:
+            if reflector:
+                if d.vx == 0:
+                    d.vx = (rng.random() - 0.5) * 50
+                d.x += d.vx * dt
+                if d.x < 2 or d.x > WIDTH - d.w - 2:
+                    d.vx *= -1
+            d.x += drift
+            d.y += d.vy * 60 * dt * time_scale
+            if magnet:
+                d.x += (target - d.x) * 0.6 * dt
+
+        drops = self.drops
+        px, py = self.player_x, self.player_y
+        pw, ph = self.player_w, self.player_h
+        # backwards with swap-remove, the same visiting order as the JS drop pool
+        for i in range(len(drops) - 1, -1, -1):
+            d = drops[i]
+            if d.x + d.w >= px and d.x <= px + pw and d.y + d.h >= py and d.y <= py + ph:
+                drops[i] = drops[-1]
+                drops.pop()
+                self.score += 10 * self.score_multiplier()
+                self.combo_count += 1
+                self.catches += 1
+                self.speed_base = min(self.speed_base + self.tuning.catch_speedup, self.tuning.speed_cap)
+                if d.kind != "normal":
+                    self.handle_combo(d.kind)
+                    if rng.random() < 0.35:
+                        self.fragments += 1
+                        self.maybe_advance_theme()
+                self.update_mission(d)
+                continue
+            if d.y > HEIGHT + 10:
+                drops[i] = drops[-1]
+                drops.pop()
+                inside_x = d.x + d.w > 0 and d.x < WIDTH
+                if inside_x and effects["shield"] <= 0:
+                    self.lives -= 1
+                    self.misses += 1
+                    self.last_miss_time = self.time
+                    self.combo_count = 0
+                    if self.lives <= 0:
+                        self.running = False
+
+        self.update_mission(None)
+
+    # -- drivers -----------------------------------------------------------
+
+    def run(self, policy: Optional[Policy] = None, max_time: float = 600.0) -> RunResult:
+        """Play until game over (or ``max_time`` sim seconds) with an optional input policy.
+
+        ``policy(game)`` is called before every tick and returns a paddle velocity,
+        or ``None`` to keep the current one.
+        """
+        max_ticks = int(round(max_time / self.dt))
+        step = self.step
+        while self.running and self.ticks < max_ticks:
+            if policy is not None:
+                vx = policy(self)
+                if vx is not None:
+                    self.player_vx = vx
+            step()
+        return self.result()
+
+    def result(self) -> RunResult:
+        return RunResult(
+            seed=self.seed,
+            score=self.score,
+            time=self.time,
+            ticks=self.ticks,
+            lives=self.lives,
+            catches=self.catches,
+            misses=self.misses,
+            missions=self.missions_done,
+            theme_index=self.theme_index,
+        )
+
+
+def simulate(
+    seed: int,
+    policy: Optional[Policy] = None,
+    tick_rate: int = TICK_RATE,
+    max_time: float = 600.0,
+    tuning: Tuning = DEFAULT_TUNING,
+    schedule: Optional[Schedule] = None,
+) -> RunResult:
+    """Run one seeded game to completion and return its summary."""
+    return CatchGame(seed, tick_rate, tuning=tuning, schedule=schedule).run(policy, max_time)
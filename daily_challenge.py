@@ -0,0 +1,110 @@
+"""
+Daily challenge: one seeded run per game and UTC day, the same for every player.
+- daily_seed() hashes the game name and date into the run's seed and a separate schedule seed
+- The random outcomes that shape a run (catch: drop x / kind, wind gusts, missions; side_scroller:
+  obstacle sizes) are drawn here ahead of time and packed into GAME_CONFIG["daily"]; the games take
+  them in order and use mulberry32(seed) for the few remaining gameplay draws
+- Packed fields are base64 (layout documented next to decodeDailyCatch() in assets/catch/sim.js and
+  in assets/side_scroller/game.js); decode_catch() / decode_side_scroller() turn a config back into
+  the engine's schedule so a reported daily run can be replayed headless
+"""
+
+from __future__ import annotations
+
+import base64
+import datetime as dt
+import hashlib
+import struct
+from typing import Any, Optional
+
+from catch_engine import DEFAULT_TUNING, MISSION_TYPES, SPECIAL_KINDS, WIDTH, Mulberry32, Schedule, Tuning
+
+# schedule lengths: comfortably past a long run; a game that outlasts one falls back to its seeded rng
+CATCH_SPAWNS = 2048
+CATCH_GUSTS = 128
+CATCH_MISSIONS = 64
+SCROLLER_OBSTACLES = 1024
+
+
+def today() -> dt.date:
+    return dt.datetime.now(dt.timezone.utc).date()
+
+
+def daily_seed(game: str, day: dt.date) -> tuple[int, int]:
+    """(run seed, schedule seed) for ``game`` on ``day``."""
+    digest = hashlib.sha256(f"{game}:{day.isoformat()}".encode("utf-8")).digest()
+    return struct.unpack_from("<II", digest)
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+# -- catch -----------------------------------------------------------------
+
+
+def catch_schedule(schedule_seed: int, tuning: Tuning = DEFAULT_TUNING) -> Schedule:
+    """Draw a catch-game schedule, quantised to what the packed format can carry."""
+    rng = Mulberry32(schedule_seed)
+    spawns = []
+    for _ in range(CATCH_SPAWNS):
+        x = float(round(18 + rng.random() * (WIDTH - 36)))
+        special = rng.random() < tuning.special_rate
+        spawns.append((x, 1 + int(rng.random() * len(SPECIAL_KINDS)) if special else 0))
+    gusts = []
+    for _ in range(CATCH_GUSTS):
+        wind = float(round((rng.random() - 0.5) * 60))
+        gusts.append((wind, round((6 + rng.random() * 6) * 10) / 10))
+    missions = [int(rng.random() * len(MISSION_TYPES)) for _ in range(CATCH_MISSIONS)]
+    return Schedule(spawns, gusts, missions)
+
+
+def encode_catch(schedule: Schedule) -> dict[str, str]:
+    spawns = struct.pack(f"<{len(schedule.spawns)}H", *(int(x) * 8 + kind for x, kind in schedule.spawns))
+    gusts = b"".join(struct.pack("<bB", int(wind), round(gap * 10)) for wind, gap in schedule.gusts)
+    return {"spawns": _b64(spawns), "gusts": _b64(gusts), "missions": _b64(bytes(schedule.missions))}
+
+
+def decode_catch(daily: dict[str, Any]) -> Schedule:
+    """The Schedule packed in a catch GAME_CONFIG["daily"] (replay with CatchGame(daily["seed"], schedule=...))."""
+    spawns = base64.b64decode(daily["spawns"])
+    gusts = base64.b64decode(daily["gusts"])
+    return Schedule(
+        spawns=[(float(v >> 3), v & 7) for (v,) in struct.iter_unpack("<H", spawns)],
+        gusts=[(float(wind), gap / 10) for wind, gap in struct.iter_unpack("<bB", gusts)],
+        missions=list(base64.b64decode(daily["missions"])),
+    )
+
+
+def catch_daily(day: Optional[dt.date] = None) -> dict[str, Any]:
+    day = day or today()
+    seed, schedule_seed = daily_seed("catch", day)
+    return {"date": day.isoformat(), "seed": seed, **encode_catch(catch_schedule(schedule_seed))}
+
+
+# -- side scroller ---------------------------------------------------------
+
+
+def side_scroller_daily(day: Optional[dt.date] = None) -> dict[str, Any]:
+    day = day or today()
+    seed, schedule_seed = daily_seed("side_scroller", day)
+    rng = Mulberry32(schedule_seed)
+    sizes = bytearray()
+    for _ in range(SCROLLER_OBSTACLES):
+        sizes.append(round(rng.random() * 50))  # height - 20
+        sizes.append(round(rng.random() * 40))  # width - 20
+    return {"date": day.isoformat(), "seed": seed, "obstacles": _b64(bytes(sizes))}
+
+
+def decode_side_scroller(daily: dict[str, Any]) -> list[tuple[float, float]]:
+    """The (height, width) obstacle schedule packed in a side_scroller GAME_CONFIG["daily"]."""
+    sizes = base64.b64decode(daily["obstacles"])
+    return [(20.0 + h, 20.0 + w) for h, w in zip(sizes[::2], sizes[1::2])]
+
+
+DAILY = {"catch": catch_daily, "side_scroller": side_scroller_daily}
+
+
+def daily_config(game: str, day: Optional[dt.date] = None) -> dict[str, Any]:
+    """GAME_CONFIG["daily"] for ``game`` on ``day`` (default: today, UTC)."""
+    return DAILY[game](day)
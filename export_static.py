@@ -0,0 +1,197 @@
+"""
+Standalone static export of the Streamlit game pages, for hosting without a Streamlit server.
+- Each game becomes dist/<game>/index.html (same title, caption and controls as the page) next to
+  its minified, content-hashed JS/CSS from game_assets; dist/index.html links the games
+- Every file is written with a pre-compressed .gz sibling, and .br when the optional ``brotli``
+  package is installed, so a static host (or --serve) can send them without compressing per request
+- ``python export_static.py --serve`` exports and then serves dist/ locally to check the result;
+  the server picks br / gzip from Accept-Encoding and marks hashed files immutable
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import html
+import mimetypes
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import quote
+
+from game_assets import GAMES, Bundle, GameAssets, build_bundle, render_index, write_atomic, write_bundle
+
+try:
+    import brotli
+except ImportError:  # optional: without it only .gz siblings are written
+    brotli = None
+
+DEFAULT_OUT = Path("dist")
+COMPRESSIBLE = (".html", ".js", ".css")
+MIN_COMPRESS = 256  # bytes; smaller files are not worth a compressed sibling
+
+_PAGE_STYLE = (
+    "<style>.page-head{max-width:720px;margin:0 auto 12px;text-align:center;font-family:sans-serif}"
+    ".page-head h1{margin:12px 0 4px;font-size:1.6rem}.page-head p{margin:0;color:#666;font-size:.9rem}</style>\n"
+)
+
+
+# -- export ----------------------------------------------------------------
+
+
+def _favicon(icon: str) -> str:
+    svg = (
+        "<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'>"
+        f"<text y='.9em' font-size='{90 if len(icon) < 2 else 56}'>{html.escape(icon)}</text></svg>"
+    )
+    return f"<link rel=\"icon\" href=\"data:image/svg+xml,{quote(svg)}\">\n"
+
+
+def render_page(bundle: Bundle, spec: GameAssets) -> str:
+    """The Streamlit page as plain HTML: page title, icon, heading and caption around the game."""
+    head = (
+        "<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">\n"
+        f"<title>{html.escape(spec.page_title)}</title>\n{_favicon(spec.page_icon)}{_PAGE_STYLE}"
+    )
+    header = (
+        f"<header class=\"page-head\"><h1>{html.escape(spec.title)}</h1>"
+        f"<p>{html.escape(spec.caption)}</p></header>\n"
+    )
+    return render_index(bundle, spec.config, head=head, header=header)
+
+
+def render_listing(names: Iterable[str]) -> str:
+    items = "".join(
+        f"<li><a href=\"{name}/\">{html.escape(GAMES[name].page_title)}</a></li>\n" for name in names
+    )
+    return (
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>Games</title>\n"
+        f"</head>\n<body>\n<ul>\n{items}</ul>\n</body>\n</html>\n"
+    )
+
+
+def compress(path: Path) -> list[Path]:
+    """Write .gz (and .br when available) next to ``path``; returns the files written."""
+    data = path.read_bytes()
+    if path.suffix not in COMPRESSIBLE or len(data) < MIN_COMPRESS:
+        return []
+    written = []
+    gz = path.with_name(path.name + ".gz")
+    write_atomic(gz, gzip.compress(data, compresslevel=9, mtime=0))  # mtime=0: reproducible bytes
+    written.append(gz)
+    if brotli is not None:
+        br = path.with_name(path.name + ".br")
+        write_atomic(br, brotli.compress(data, quality=11))
+        written.append(br)
+    return written
+
+
+def export_game(name: str, out_dir: Path) -> list[Path]:
+    """Export one game into ``out_dir/name``; returns the files written (compressed siblings included)."""
+    spec = GAMES[name]
+    bundle = build_bundle(name)
+    game_dir = out_dir / name
+    for stale in game_dir.glob(f"{name}.*"):  # drop bundles from earlier digests
+        if bundle.digest not in stale.name:
+            stale.unlink()
+    write_bundle(bundle, game_dir)
+    write_atomic(game_dir / "index.html", render_page(bundle, spec))
+    files = [game_dir / bundle.js_file, game_dir / bundle.css_file, game_dir / "index.html"]
+    if bundle.worker_js:
+        files.append(game_dir / bundle.worker_file)
+    return files + [c for f in files for c in compress(f)]
+
+
+def export_all(out_dir: Path = DEFAULT_OUT, names: Optional[Iterable[str]] = None) -> list[Path]:
+    names = list(names or GAMES)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    files: list[Path] = []
+    for name in names:
+        files += export_game(name, out_dir)
+    listing = out_dir / "index.html"
+    write_atomic(listing, render_listing(names))
+    files.append(listing)
+    return files
+
+
+# -- local server ----------------------------------------------------------
+
+
+class PrecompressedHandler(SimpleHTTPRequestHandler):
+    """Serves ``file.br`` / ``file.gz`` in place of ``file`` when the client accepts it."""
+
+    encodings = (("br", ".br"), ("gzip", ".gz"))
+
+    def send_head(self):
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            if not self.path.endswith("/"):
+                return super().send_head()  # let the base class redirect to the slash form
+            path = path / "index.html"
+        if not path.is_file():
+            return super().send_head()
+        accepted = {
+            part.split(";")[0].strip() for part in self.headers.get("Accept-Encoding", "").split(",")
+        }
+        encoding = None
+        for token, suffix in self.encodings:
+            candidate = path.with_name(path.name + suffix)
+            if token in accepted and candidate.is_file():
+                encoding, served = token, candidate
+                break
+        else:
+            served = path
+        f = open(served, "rb")
+        try:
+            size = served.stat().st_size
+            self.send_response(200)
+            self.send_header("Content-Type", mimetypes.guess_type(path.name)[0] or "application/octet-stream")
+            self.send_header("Content-Length", str(size))
+            self.send_header("Vary", "Accept-Encoding")
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            if path.suffix == ".html":
+                self.send_header("Cache-Control", "no-cache")
+            else:  # content-hashed file names: safe to cache forever
+                self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+
+
+def serve(directory: Path = DEFAULT_OUT, host: str = "127.0.0.1", port: int = 8000) -> None:
+    handler = partial(PrecompressedHandler, directory=str(directory))
+    with ThreadingHTTPServer((host, port), handler) as httpd:
+        print(f"Serving {directory} on http://{host}:{port}/ (Ctrl+C to stop)")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Export the games as static, pre-compressed pages.")
+    parser.add_argument("games", nargs="*", metavar="GAME", help=f"games to export: {', '.join(GAMES)} (default: all)")
+    parser.add_argument("-o", "--out", type=Path, default=DEFAULT_OUT, help="output directory (default: dist)")
+    parser.add_argument("--serve", action="store_true", help="serve the output directory after exporting")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.games if name not in GAMES]
+    if unknown:
+        parser.error(f"unknown game(s): {', '.join(unknown)}")
+
+    files = export_all(args.out, args.games)
+    for path in files:
+        print(f"{path.stat().st_size:>9,}  {path}")
+    if brotli is None:
+        print("brotli not installed: wrote .gz only (pip install brotli for .br)")
+    if args.serve:
+        serve(args.out, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
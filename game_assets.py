@@ -0,0 +1,328 @@
+"""
+Game registry and asset pipeline for the embedded games (no Streamlit import, so the static
+export and other tools can use it too).
+- Each game is CSS + an HTML body + scripts under assets/, plus its page text and default
+  GAME_CONFIG, listed in GAMES
+- Scripts are concatenated (shared code in assets/common first), minified and content-hashed
+  into <game>.<hash>.js / <game>.<hash>.css; a game with worker scripts also gets
+  <game>.worker.<hash>.js, whose URL the page finds in window.GAME_WORKER
+- render_index() emits the small per-config page that links the hashed files, so browsers
+  can keep the bundle cached across sessions while GAME_CONFIG travels inline
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from catch_engine import TICK_RATE
+
+ASSET_ROOT = Path(__file__).resolve().parent / "assets"
+
+
+@dataclass(frozen=True)
+class GameAssets:
+    scripts: tuple[str, ...]
+    styles: tuple[str, ...]
+    body: str
+    page_title: str
+    page_icon: str
+    title: str
+    caption: str
+    height: int
+    config: dict[str, Any] = field(default_factory=dict)
+    worker: tuple[str, ...] = ()
+
+
+GAMES = {
+    "catch": GameAssets(
+        scripts=("common/bridge.js", "common/core.js", "common/kit.js", "catch/sim.js", "catch/game.js"),
+        styles=("catch/game.css",),
+        body="catch/body.html",
+        page_title="Game & Watch Catch",
+        page_icon="GW",
+        title="Game & Watch style - Evolving look",
+        caption=(
+            "Special gem combos trigger rainbow mode; fragments unlock new themes. "
+            "Wind, missions, ghost replay, and layered chiptune BGM."
+        ),
+        height=1200,
+        config={
+            "tickRate": TICK_RATE,  # simulation steps per second, independent of display refresh
+            "ghostCriterion": "score",  # replace the stored ghost when a run beats it: "score" | "duration" | "always"
+            "hudRate": 10,  # max refreshes per second for the effect countdowns in the HUD
+            "frameBudgetMs": 12,  # rolling mean work per frame (ms) above which render quality steps down
+            "renderWorker": True,  # simulate + draw in a Web Worker (OffscreenCanvas) when the browser can
+        },
+        worker=("common/core.js", "catch/sim.js", "catch/worker.js"),
+    ),
+    "side_scroller": GameAssets(
+        scripts=("common/bridge.js", "common/core.js", "common/kit.js", "side_scroller/game.js"),
+        styles=("side_scroller/game.css",),
+        body="side_scroller/body.html",
+        page_title="Side Scroller - 障害物を避けるゲーム",
+        page_icon="🏃",
+        title="横スクロール障害物ゲーム (Python + Streamlit)",
+        caption="スペース / ↑ でジャンプ。障害物を避け続けてスコアを伸ばそう。Enter でリスタート。",
+        height=520,
+        config={
+            "tickRate": 60,  # simulation steps per second, independent of display refresh
+            "hudRate": 10,  # max refreshes per second for the running score in the HUD
+        },
+    ),
+}
+
+
+@dataclass(frozen=True)
+class Bundle:
+    name: str
+    js: str
+    css: str
+    body: str
+    digest: str
+    worker_js: str = ""
+
+    @property
+    def js_file(self) -> str:
+        return f"{self.name}.{self.digest}.js"
+
+    @property
+    def worker_file(self) -> str:
+        return f"{self.name}.worker.{self.digest}.js" if self.worker_js else ""
+
+    @property
+    def css_file(self) -> str:
+        return f"{self.name}.{self.digest}.css"
+
+
+# -- minification ----------------------------------------------------------
+# Deliberately conservative: comments and redundant whitespace only, no renaming. Newlines are
+# kept wherever dropping them could change automatic semicolon insertion.
+
+_JS_TIGHT = set("{}()[];,=:?*&|<>+-/!%")
+_JS_JOIN_AFTER = set("{;,([:=?&|")
+# keywords after which "/" starts a regex literal instead of dividing
+_JS_REGEX_AFTER = {
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw",
+    "case", "do", "else", "yield", "await",
+}
+
+
+def _skip_string(src: str, i: int) -> int:
+    """Index just past the string / template literal starting at ``src[i]``."""
+    quote = src[i]
+    j = i + 1
+    n = len(src)
+    while j < n:
+        c = src[j]
+        if c == "\\":
+            j += 2
+        elif c == quote:
+            return j + 1
+        elif quote == "`" and src.startswith("${", j):
+            j = _skip_braced(src, j + 2)
+        else:
+            j += 1
+    raise ValueError(f"unterminated string literal at offset {i}")
+
+
+def _skip_braced(src: str, j: int) -> int:
+    depth = 1
+    n = len(src)
+    while j < n:
+        c = src[j]
+        if c in "\"'`":
+            j = _skip_string(src, j)
+            continue
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return j + 1
+        j += 1
+    raise ValueError("unterminated template expression")
+
+
+def _skip_regex(src: str, i: int) -> int:
+    """Index just past the body of the regex literal starting at ``src[i]`` (flags not included)."""
+    j = i + 1
+    n = len(src)
+    in_class = False
+    while j < n:
+        c = src[j]
+        if c == "\\":
+            j += 2
+            continue
+        if c == "\n":
+            break
+        if c == "[":
+            in_class = True
+        elif c == "]":
+            in_class = False
+        elif c == "/" and not in_class:
+            return j + 1
+        j += 1
+    raise ValueError(f"unterminated regex literal at offset {i}")
+
+
+def _regex_allowed(out: list[str]) -> bool:
+    """Whether a ``/`` after the tokens in ``out`` starts a regex literal rather than a division."""
+    k = len(out) - 1
+    while k >= 0 and out[k] in (" ", "\n"):
+        k -= 1
+    if k < 0:
+        return True
+    last = out[k][-1]
+    if len(out[k]) > 1 or last in ")]}\"'`":  # a string, regex or closed group: division follows
+        return last == "}"  # ...except after a block, where an expression statement may start
+    if not (last.isalnum() or last in "_$"):
+        return True  # after an operator or punctuator an expression starts
+    word: list[str] = []
+    while k >= 0 and len(out[k]) == 1 and (out[k].isalnum() or out[k] in "_$"):
+        word.append(out[k])
+        k -= 1
+    return "".join(reversed(word)) in _JS_REGEX_AFTER
+
+
+def minify_js(src: str) -> str:
+    out: list[str] = []
+
+    def space(tok: str) -> None:
+        # runs of whitespace/comments collapse to one token; a newline always wins
+        if out and out[-1] in (" ", "\n"):
+            if tok == "\n":
+                out[-1] = "\n"
+        else:
+            out.append(tok)
+
+    i = 0
+    n = len(src)
+    while i < n:
+        c = src[i]
+        if c in "\"'`":
+            j = _skip_string(src, i)
+            out.append(src[i:j])
+            i = j
+        elif src.startswith("//", i):
+            j = src.find("\n", i)
+            i = n if j < 0 else j
+        elif src.startswith("/*", i):
+            j = src.find("*/", i + 2)
+            i = n if j < 0 else j + 2
+            space(" ")
+        elif c == "/" and _regex_allowed(out):
+            j = _skip_regex(src, i)
+            out.append(src[i:j])
+            i = j
+        elif c.isspace():
+            j = i
+            while j < n and src[j].isspace():
+                j += 1
+            space("\n" if "\n" in src[i:j] else " ")
+            i = j
+        else:
+            out.append(c)
+            i += 1
+    # second pass: drop the whitespace tokens that cannot matter
+    result: list[str] = []
+    count = len(out)
+    for k, tok in enumerate(out):
+        if tok not in (" ", "\n"):
+            result.append(tok)
+            continue
+        prev = result[-1][-1] if result else ""
+        j = k + 1  # space() collapsed whitespace runs, so this scan is almost always one step
+        while j < count and out[j] in (" ", "\n"):
+            j += 1
+        nxt = out[j][0] if j < count else ""
+        if not prev or not nxt:
+            continue
+        if tok == "\n":
+            if prev in _JS_JOIN_AFTER:
+                continue
+            result.append("\n")
+        elif (prev in _JS_TIGHT or nxt in _JS_TIGHT) and not (
+            (prev in "+-" and nxt in "+-") or (prev == "/" and nxt == "/") or (prev == "<" and nxt == "!")
+        ):
+            continue
+        else:
+            result.append(" ")
+    return "".join(result) + "\n"
+
+
+def minify_css(src: str) -> str:
+    src = re.sub(r"/\*.*?\*/", "", src, flags=re.S)
+    src = re.sub(r"\s+", " ", src)
+    src = re.sub(r"\s*([{};,>])\s*", r"\1", src)
+    src = re.sub(r":\s+", ":", src)
+    return src.replace(";}", "}").strip() + "\n"
+
+
+# -- bundles ---------------------------------------------------------------
+
+
+def _read(rel: str) -> str:
+    return (ASSET_ROOT / rel).read_text(encoding="utf-8")
+
+
+def build_bundle(name: str, minify: bool = True) -> Bundle:
+    """Load, (optionally) minify and hash one game's assets."""
+    spec = GAMES[name]
+    js = "\n".join(_read(rel) for rel in spec.scripts)
+    css = "\n".join(_read(rel) for rel in spec.styles)
+    worker_js = "\n".join(_read(rel) for rel in spec.worker)
+    if minify:
+        js = minify_js(js)
+        css = minify_css(css)
+        worker_js = minify_js(worker_js) if worker_js else ""
+    digest = hashlib.sha256(f"{js}\0{css}\0{worker_js}".encode("utf-8")).hexdigest()[:12]
+    return Bundle(name=name, js=js, css=css, body=_read(spec.body), digest=digest, worker_js=worker_js)
+
+
+def config_script(config: dict[str, Any], worker_file: str = "") -> str:
+    script = "window.GAME_CONFIG = " + json.dumps(config, sort_keys=True).replace("</", "<\\/") + ";"
+    if worker_file:
+        script += f" window.GAME_WORKER = {json.dumps(worker_file)};"
+    return script
+
+
+def render_index(bundle: Bundle, config: dict[str, Any], head: str = "", header: str = "") -> str:
+    """The page that boots a bundle: inline config, linked hashed CSS/JS.
+
+    ``head`` and ``header`` are extra markup for <head> and the top of <body> (used by the
+    static export for the page title and caption).
+    """
+    return (
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+        f"{head}<link rel=\"stylesheet\" href=\"{bundle.css_file}\">\n"
+        f"<script>{config_script(config, bundle.worker_file)}</script>\n"
+        f"</head>\n<body>\n{header}{bundle.body}<script src=\"{bundle.js_file}\"></script>\n</body>\n</html>\n"
+    )
+
+
+def write_atomic(path: Path, data: str | bytes) -> None:
+    """Write-then-rename so a concurrent reader never sees a half-written file."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if isinstance(data, str):
+        tmp.write_text(data, encoding="utf-8")
+    else:
+        tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def write_bundle(bundle: Bundle, out_dir: Path) -> None:
+    """Materialise the hashed JS/CSS in ``out_dir`` (content-addressed, so existing files are kept)."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    files = [(bundle.js_file, bundle.js), (bundle.css_file, bundle.css)]
+    if bundle.worker_js:
+        files.append((bundle.worker_file, bundle.worker_js))
+    for filename, text in files:
+        path = out_dir / filename
+        if not path.exists():
+            write_atomic(path, text)
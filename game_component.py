@@ -0,0 +1,49 @@
+"""
+Bidirectional Streamlit component for the embedded games.
+- Bundles come from game_assets (minified, content-hashed) once per process via st.cache_resource
+- Each page (bundle + config) gets its own component, <game>/<page digest>/, holding the hashed
+  JS/CSS and worker (served with Cache-Control: public) and an index.html (no-cache) that links
+  them and carries GAME_CONFIG inline; sessions on different configs never share an index.html
+- The element key carries the page digest: reruns reuse the live iframe (game, AudioContext,
+  localStorage state) and it only re-mounts when the bundle or its config changes
+- Inside the iframe, window.GameBridge (assets/common/bridge.js) speaks the component protocol and
+  GameBridge.report(state) sends {score, running, theme, ...} back as the component value
+"""
+
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from game_assets import Bundle, build_bundle, render_index, write_atomic, write_bundle
+
+BUILD_ROOT = Path(tempfile.gettempdir()) / "gw-game-components"
+
+_load_bundle = st.cache_resource(show_spinner=False)(build_bundle)
+
+
+def source_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+@st.cache_resource(show_spinner=False)
+def _declare(name: str, digest: str, _bundle: Bundle, _page: str) -> Any:
+    # the registry is keyed by component name, so the digest goes in the name as well as the path
+    build_dir = BUILD_ROOT / name / digest
+    write_bundle(_bundle, build_dir)
+    write_atomic(build_dir / "index.html", _page)
+    return components.declare_component(f"{name}-{digest}", path=str(build_dir))
+
+
+def game_component(name: str, config: dict[str, Any], *, height: int, key: Optional[str] = None) -> Optional[dict]:
+    """Mount (or keep) the game iframe and return the last state it reported, if any."""
+    bundle = _load_bundle(name)
+    page = render_index(bundle, config)
+    digest = source_digest(page)
+    component = _declare(name, digest, bundle, page)
+    return component(height=height, key=f"{key or name}-{digest}", default=None)
@@ -0,0 +1,60 @@
+"""
+Profiler reports from the games (GAME_CONFIG["profile"], the pages' sidebar toggle).
+- With profiling on, the JS createProfiler() (assets/common/core.js) times each game phase and
+  sends an aggregate every 2 s as "profile" in the component value: frame-interval percentiles,
+  and per phase a call count, mean / max ms and a histogram over bucketsMs (plus an overflow bucket)
+- log_profile() writes each new report once as a JSON line on the "game.profile" logger, which
+  logs at INFO to stderr, or appends to the file named by $GAME_PROFILE_LOG; phase_table() turns one into rows for st.dataframe, slowest phase first
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from typing import Any, Optional
+
+log = logging.getLogger("game.profile")
+if not log.handlers:  # Streamlit re-imports pages, not this module; one handler per process
+    _path = os.environ.get("GAME_PROFILE_LOG")
+    _handler = logging.FileHandler(_path, encoding="utf-8") if _path else logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+    log.addHandler(_handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False  # no second copy through handlers on the root logger
+
+
+def histogram_percentile(hist: list[int], buckets_ms: list[float], q: float) -> Optional[float]:
+    """Upper bound of the bucket holding the ``q`` quantile (None: it is in the overflow bucket)."""
+    total = sum(hist)
+    if not total:
+        return 0.0
+    seen = 0
+    for count, bound in zip(hist, buckets_ms + [None]):
+        seen += count
+        if seen >= q * total:
+            return bound
+    return None
+
+
+def phase_table(profile: dict[str, Any]) -> list[dict[str, Any]]:
+    buckets = profile["bucketsMs"]
+    rows = [
+        {
+            "phase": name,
+            "calls": phase["count"],
+            "mean ms": phase["meanMs"],
+            "p95 ms ≤": histogram_percentile(phase["hist"], buckets, 0.95),
+            "max ms": phase["maxMs"],
+        }
+        for name, phase in profile["phases"].items()
+    ]
+    return sorted(rows, key=lambda row: row["mean ms"], reverse=True)
+
+
+def log_profile(game: str, profile: dict[str, Any], last_seq: Optional[int]) -> int:
+    """Log ``profile`` unless it is the one already logged (reruns repeat the component value)."""
+    if profile["seq"] != last_seq:
+        log.info(json.dumps({"game": game, **profile}, separators=(",", ":")))
+    return profile["seq"]
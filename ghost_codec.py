@@ -0,0 +1,104 @@
+"""
+Binary ghost-replay codec, byte-compatible with encodeGhost() / decodeGhost() in assets/catch/sim.js.
+- Header (little-endian): u8 version, u8 scale, u16 count, f32 interval seconds, u32 score
+- Body: count Int16 deltas of round(x * scale); sample i is the paddle x at t = i * interval
+- Long runs are capped at MAX_SAMPLES by keeping every other sample at twice the interval
+- Stored base64-encoded in the browser's localStorage under "gwGhostBin"
+"""
+
+from __future__ import annotations
+
+import base64
+import math
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+
+VERSION = 1
+SCALE = 16
+INTERVAL = 0.1
+MAX_SAMPLES = 2048
+STORAGE_KEY = "gwGhostBin"
+
+_HEADER = struct.Struct("<BBHfI")
+
+
+class GhostFormatError(ValueError):
+    """Raised when a stored ghost cannot be decoded."""
+
+
+@dataclass
+class Ghost:
+    xs: array = field(default_factory=lambda: array("f"))
+    interval: float = INTERVAL
+    score: int = 0
+
+    @property
+    def duration(self) -> float:
+        return len(self.xs) * self.interval
+
+    def x_at(self, t: float) -> float:
+        """Paddle x at ``t`` seconds, linearly interpolated like ``ghostX``."""
+        xs = self.xs
+        f = t / self.interval
+        i = math.floor(f)
+        if i >= len(xs) - 1:
+            return xs[-1]
+        return xs[i] + (xs[i + 1] - xs[i]) * (f - i)
+
+
+def downsample(xs: array, interval: float, max_samples: int = MAX_SAMPLES) -> tuple[array, float]:
+    """Halve the sample rate until ``xs`` fits in ``max_samples``."""
+    while len(xs) > max_samples:
+        xs = xs[::2]
+        interval *= 2
+    return xs, interval
+
+
+def encode_bytes(ghost: Ghost) -> bytes:
+    xs, interval = downsample(ghost.xs, ghost.interval)
+    deltas = array("h", bytes(2 * len(xs)))
+    prev = 0
+    for i, x in enumerate(xs):
+        q = math.floor(x * SCALE + 0.5)  # Math.round, not banker's rounding
+        deltas[i] = q - prev
+        prev = q
+    if sys.byteorder == "big":
+        deltas.byteswap()
+    return _HEADER.pack(VERSION, SCALE, len(xs), interval, ghost.score) + deltas.tobytes()
+
+
+def decode_bytes(data: bytes) -> Ghost:
+    if len(data) < _HEADER.size:
+        raise GhostFormatError("ghost shorter than its header")
+    version, scale, count, interval, score = _HEADER.unpack_from(data)
+    if version != VERSION:
+        raise GhostFormatError(f"unsupported ghost version {version}")
+    if scale == 0:
+        raise GhostFormatError("ghost scale is 0")
+    body = data[_HEADER.size:_HEADER.size + count * 2]
+    if count == 0 or len(body) < count * 2:
+        raise GhostFormatError("ghost body truncated")
+    deltas = array("h", body)
+    if sys.byteorder == "big":
+        deltas.byteswap()
+    xs = array("f", bytes(4 * count))
+    q = 0
+    for i, d in enumerate(deltas):
+        q += d
+        xs[i] = q / scale
+    return Ghost(xs, interval, score)
+
+
+def encode(ghost: Ghost) -> str:
+    """Pack ``ghost`` into the base64 string the game keeps in localStorage."""
+    return base64.b64encode(encode_bytes(ghost)).decode("ascii")
+
+
+def decode(packed: str) -> Ghost:
+    try:
+        data = base64.b64decode(packed, validate=True)
+    except ValueError as exc:
+        raise GhostFormatError("ghost is not valid base64") from exc
+    return decode_bytes(data)
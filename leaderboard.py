@@ -0,0 +1,240 @@
+"""
+Server-side leaderboard for both games, in a local SQLite database.
+- submit() only enqueues: a single writer thread drains the queue in batches (one transaction per
+  batch_size entries or flush_interval seconds), so script threads never wait on the database lock
+- Reads go through a small pool of connections (WAL mode, so they never block the writer) and are
+  cached in memory for cache_ttl seconds per query; a new score can take that long to show up
+- Indexed queries: all-time top N per game, and top N for one UTC day; daily-challenge runs are kept
+  apart and filed under the challenge's date
+- One Leaderboard per process (the pages hold it in st.cache_resource); close() flushes the queue
+- Example: python leaderboard.py catch --daily 2026-10-18
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import datetime as dt
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+DB_PATH = Path(__file__).with_name("leaderboard.sqlite3")
+NAME_LIMIT = 24
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    day TEXT NOT NULL,          -- UTC date played, or the daily challenge's date
+    daily INTEGER NOT NULL,     -- 1 for daily-challenge runs
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_top ON scores (game, daily, score DESC);
+CREATE INDEX IF NOT EXISTS scores_day ON scores (game, daily, day, score DESC);
+"""
+
+
+@dataclass(frozen=True)
+class Entry:
+    game: str
+    player: str
+    score: int
+    day: str
+    daily: bool
+    created: float
+
+
+@dataclass(frozen=True)
+class Ranked:
+    rank: int
+    player: str
+    score: int
+    day: str
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=10.0, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class Leaderboard:
+    """Write-behind score store with pooled, TTL-cached reads."""
+
+    def __init__(
+        self,
+        path: Path | str = DB_PATH,
+        *,
+        readers: int = 4,
+        batch_size: int = 256,
+        flush_interval: float = 0.25,
+        max_pending: int = 10_000,
+        cache_ttl: float = 5.0,
+    ) -> None:
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.cache_ttl = cache_ttl
+        self.written = 0
+        self.dropped = 0  # queue full, or the batch failed to write
+        self.last_error: Optional[BaseException] = None
+        self._stats_lock = threading.Lock()  # written / dropped change on page threads and the writer
+
+        writer = _connect(self.path)
+        writer.executescript(SCHEMA)
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        for _ in range(readers):
+            self._readers.put(_connect(self.path))
+        self._pending: queue.Queue[Optional[Entry]] = queue.Queue(maxsize=max_pending)
+        self._cache: dict[tuple, tuple[float, list[Ranked]]] = {}
+        self._cache_lock = threading.Lock()
+        self._closed = False
+        self._close_lock = threading.Lock()  # no submit() may enqueue behind close()'s sentinel
+        self._writer = threading.Thread(target=self._write_loop, args=(writer,), name="leaderboard-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    # -- writes ------------------------------------------------------------
+
+    def submit(
+        self,
+        game: str,
+        player: str,
+        score: int,
+        *,
+        daily: Optional[str] = None,
+        day: Optional[dt.date] = None,
+    ) -> bool:
+        """Queue one finished run; ``daily`` is the challenge date the game reported, if any.
+
+        Never blocks: returns False (and counts the run as dropped) when the queue is full or closed.
+        """
+        played = daily or (day or dt.datetime.now(dt.timezone.utc).date()).isoformat()
+        entry = Entry(game, player.strip()[:NAME_LIMIT] or "anonymous", int(score), played, daily is not None, time.time())
+        with self._close_lock:
+            if self._closed:
+                self._count(dropped=1)
+                return False
+            try:
+                self._pending.put_nowait(entry)
+            except queue.Full:
+                self._count(dropped=1)
+                return False
+        return True
+
+    def _count(self, written: int = 0, dropped: int = 0) -> None:
+        with self._stats_lock:
+            self.written += written
+            self.dropped += dropped
+
+    def _write_loop(self, conn: sqlite3.Connection) -> None:
+        pending = self._pending
+        stop = False
+        while not stop:
+            first = pending.get()
+            if first is None:
+                pending.task_done()
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    entry = pending.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stop = True
+                    break
+                batch.append(entry)
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO scores (game, player, score, day, daily, created) VALUES (?, ?, ?, ?, ?, ?)",
+                        [(e.game, e.player, e.score, e.day, int(e.daily), e.created) for e in batch],
+                    )
+                self._count(written=len(batch))
+            except sqlite3.Error as exc:
+                self._count(dropped=len(batch))
+                self.last_error = exc
+            finally:
+                for _ in range(len(batch) + stop):
+                    pending.task_done()
+        conn.close()
+
+    def flush(self) -> None:
+        """Block until every queued run is written (CLI / shutdown; the pages never wait)."""
+        self._pending.join()
+
+    def close(self) -> None:
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending.put(None)  # may wait for the writer to make room; it never takes this lock
+        self._writer.join()
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+
+    # -- reads -------------------------------------------------------------
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def top(self, game: str, limit: int = 10, *, day: Optional[str] = None, daily: bool = False) -> list[Ranked]:
+        """Best ``limit`` runs of ``game``, all time or on one ISO ``day``; ``daily`` selects challenge runs."""
+        key = (game, limit, day, daily)
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        sql = "SELECT player, score, day FROM scores WHERE game = ? AND daily = ?"
+        args: list = [game, int(daily)]
+        if day is not None:
+            sql += " AND day = ?"
+            args.append(day)
+        sql += " ORDER BY score DESC, id LIMIT ?"
+        args.append(limit)
+        with self._reader() as conn:
+            rows = conn.execute(sql, args).fetchall()
+        ranked = [Ranked(rank, player, score, played) for rank, (player, score, played) in enumerate(rows, 1)]
+        with self._cache_lock:
+            self._cache[key] = (now + self.cache_ttl, ranked)
+        return ranked
+
+    def stats(self) -> dict[str, int]:
+        with self._stats_lock:
+            return {"pending": self._pending.qsize(), "written": self.written, "dropped": self.dropped}
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Print a game's leaderboard.")
+    parser.add_argument("game", choices=["catch", "side_scroller"])
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--day", help="only runs played on this UTC date (YYYY-MM-DD)")
+    parser.add_argument("--daily", metavar="DATE", help="the daily challenge of this date")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    board = Leaderboard(args.db, readers=1)
+    rows = board.top(args.game, args.limit, day=args.daily or args.day, daily=args.daily is not None)
+    for row in rows:
+        print(f"{row.rank:>4}  {row.score:>8}  {row.day}  {row.player}")
+    board.close()
+
+
+if __name__ == "__main__":
+    main()
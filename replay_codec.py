@@ -0,0 +1,107 @@
+"""
+Binary replay codec, byte-compatible with createInputLog() in assets/common/core.js.
+- Header (little-endian): u8 version, u8 game, u16 tick rate, u32 seed, u32 ticks, u32 score,
+  u16 daily-challenge day (days since 1970-01-01, 0 = not a daily run), u32 event count
+- Body: per event a LEB128 varint of (ticks since the previous event << 2 | kind), then an f32
+  value for VELOCITY (px/s) and POSITION (paddle x after a drag); JUMP has no value
+- An event stamped t is applied before the run's (t + 1)-th tick
+- Sent base64-encoded as "replay" in the game-over component value; replay_verifier.py re-simulates it
+"""
+
+from __future__ import annotations
+
+import base64
+import datetime as dt
+import struct
+from dataclasses import dataclass, field
+from typing import Optional
+
+VERSION = 1
+GAMES = ("catch", "side_scroller")
+VELOCITY, POSITION, JUMP = 0, 1, 2
+EPOCH = dt.date(1970, 1, 1)
+
+_HEADER = struct.Struct("<BBHIIIHI")
+_VALUE = struct.Struct("<f")
+
+
+class ReplayFormatError(ValueError):
+    """Raised when a submitted replay cannot be decoded."""
+
+
+@dataclass
+class Replay:
+    game: str
+    seed: int
+    ticks: int  # length of the run
+    score: int  # as claimed by the page
+    tick_rate: int = 60
+    daily: Optional[dt.date] = None
+    events: list[tuple[int, int, float]] = field(default_factory=list)  # (tick, kind, value), tick order
+
+
+def encode_bytes(replay: Replay) -> bytes:
+    day = (replay.daily - EPOCH).days if replay.daily else 0
+    out = bytearray(
+        _HEADER.pack(
+            VERSION, GAMES.index(replay.game), replay.tick_rate, replay.seed,
+            replay.ticks, replay.score, day, len(replay.events),
+        )
+    )
+    prev = 0
+    for tick, kind, value in replay.events:
+        v = (tick - prev) << 2 | kind
+        prev = tick
+        while v >= 0x80:
+            out.append(v & 0x7F | 0x80)
+            v >>= 7
+        out.append(v)
+        if kind != JUMP:
+            out += _VALUE.pack(value)
+    return bytes(out)
+
+
+def decode_bytes(data: bytes) -> Replay:
+    if len(data) < _HEADER.size:
+        raise ReplayFormatError("replay shorter than its header")
+    version, game, tick_rate, seed, ticks, score, day, count = _HEADER.unpack_from(data)
+    if version != VERSION:
+        raise ReplayFormatError(f"unsupported replay version {version}")
+    if game >= len(GAMES) or not tick_rate:
+        raise ReplayFormatError("bad replay header")
+    events = []
+    at, end, tick = _HEADER.size, len(data), 0
+    for _ in range(count):
+        v = shift = 0
+        while True:
+            if at >= end:
+                raise ReplayFormatError("replay body truncated")
+            b = data[at]
+            at += 1
+            v |= (b & 0x7F) << shift
+            shift += 7
+            if b < 0x80:
+                break
+        tick += v >> 2
+        kind = v & 3
+        if kind == JUMP:
+            events.append((tick, kind, 0.0))
+            continue
+        if kind > JUMP or at + 4 > end:
+            raise ReplayFormatError("bad replay event")
+        events.append((tick, kind, _VALUE.unpack_from(data, at)[0]))
+        at += 4
+    daily = EPOCH + dt.timedelta(days=day) if day else None
+    return Replay(GAMES[game], seed, ticks, score, tick_rate, daily, events)
+
+
+def encode(replay: Replay) -> str:
+    return base64.b64encode(encode_bytes(replay)).decode("ascii")
+
+
+def decode(packed: str) -> Replay:
+    try:
+        data = base64.b64decode(packed, validate=True)
+    except ValueError as exc:
+        raise ReplayFormatError("replay is not valid base64") from exc
+    return decode_bytes(data)
@@ -0,0 +1,287 @@
+"""
+Server-side verification of submitted runs: re-simulate the replay headless, accept only matching scores.
+- verify() decodes a replay (replay_codec.py), rebuilds the day's schedule for a daily-challenge run
+  (today's, UTC, or yesterday's for a run that could have started before midnight, and only on that
+  day's seed; the Verdict carries the checked date), feeds the logged inputs to catch_engine / scroller_engine tick by tick and checks that the run
+  ends on the claimed tick with the claimed score (within ``tolerance`` points)
+- This proves the score follows from the inputs under the game's rules, not that a person produced
+  them; paddle velocities above the fastest control are rejected outright
+- ReplayVerifier runs verify() in a process pool behind a bounded queue: submit() never blocks (it
+  returns None when max_pending runs are already waiting) and hands the Verdict to a callback;
+  stats() reports recent throughput in runs verified per second
+- Example: python replay_verifier.py --runs 1000 (verifies bot replays, see bots.py)
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import multiprocessing
+import struct
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional
+
+from bots import GAMES as BOTS
+from catch_engine import JOY_SPEED, KEY_SPEED, CatchGame, Schedule
+from daily_challenge import catch_daily, daily_seed, decode_catch, decode_side_scroller, side_scroller_daily
+from replay_codec import JUMP, POSITION, VELOCITY, Replay, ReplayFormatError, decode, encode
+from scroller_engine import ScrollerGame
+
+MAX_SPEED = max(KEY_SPEED, JOY_SPEED)
+MAX_RUN_SECONDS = 3600.0  # longer claims are rejected before simulating anything
+VERIFY_GRACE = 600.0  # seconds a finished daily run may take to reach the verifier (page, queue)
+
+
+@dataclass(frozen=True)
+class Verdict:
+    ok: bool
+    game: str
+    claimed: int  # score the page reported
+    score: Optional[int]  # score of the re-simulated run (None if it could not be replayed)
+    ticks: int
+    reason: str = ""
+    daily: Optional[dt.date] = None  # challenge date of a verified daily run (file it on that board)
+
+
+class _Rejected(Exception):
+    pass
+
+
+@lru_cache(maxsize=8)
+def _catch_schedule(day: dt.date) -> Schedule:
+    return decode_catch(catch_daily(day))
+
+
+@lru_cache(maxsize=8)
+def _scroller_schedule(day: dt.date) -> list[tuple[float, float]]:
+    return decode_side_scroller(side_scroller_daily(day))
+
+
+def _apply_catch(game: CatchGame, kind: int, value: float) -> None:
+    if kind == VELOCITY:
+        if abs(value) > MAX_SPEED:
+            raise _Rejected(f"paddle velocity {value:g} px/s above {MAX_SPEED}")
+        game.set_velocity(value)
+    elif kind == POSITION:
+        game.drag_to(value)
+    else:
+        raise _Rejected("jump in a catch replay")
+
+
+def _apply_scroller(game: ScrollerGame, kind: int, value: float) -> None:
+    if kind != JUMP:
+        raise _Rejected("paddle input in a side_scroller replay")
+    game.jump()
+
+
+def daily_open(day: dt.date, run_seconds: float, now: dt.datetime) -> bool:
+    """Whether a ``run_seconds`` run of ``day``'s challenge can still be arriving at ``now`` (UTC).
+
+    Yesterday's challenge stays open after midnight for runs begun before it: as long as the run
+    lasted, plus VERIFY_GRACE.
+    """
+    if day == now.date():
+        return True
+    if day != now.date() - dt.timedelta(days=1):
+        return False
+    midnight = dt.datetime.combine(now.date(), dt.time.min, tzinfo=dt.timezone.utc)
+    return (now - midnight).total_seconds() <= run_seconds + VERIFY_GRACE
+
+
+def replay_run(replay: Replay) -> CatchGame | ScrollerGame:
+    """Play ``replay``'s inputs for (at most) its claimed number of ticks; returns the engine."""
+    if replay.game == "catch":
+        schedule = _catch_schedule(replay.daily) if replay.daily else None
+        game, apply = CatchGame(replay.seed, replay.tick_rate, schedule=schedule), _apply_catch
+    else:
+        schedule = _scroller_schedule(replay.daily) if replay.daily else None
+        game, apply = ScrollerGame(replay.seed, replay.tick_rate, schedule), _apply_scroller
+    events, i, n = replay.events, 0, len(replay.events)
+    step = game.step
+    while game.running and game.ticks < replay.ticks:
+        tick = game.ticks
+        while i < n and events[i][0] <= tick:
+            _, kind, value = events[i]
+            apply(game, kind, value)
+            i += 1
+        step()
+    return game
+
+
+def verify(
+    packed: str,
+    tolerance: int = 0,
+    game: Optional[str] = None,
+    tick_rate: Optional[int] = None,
+    now: Optional[dt.datetime] = None,
+) -> Verdict:
+    """Re-simulate a base64 replay and judge its claimed score; ``game`` / ``tick_rate`` pin what the page runs.
+
+    ``now`` (UTC, default: the clock) decides which daily challenges are still open.
+    """
+    try:
+        replay = decode(packed)
+    except ReplayFormatError as exc:
+        return Verdict(False, game or "", 0, None, 0, str(exc))
+
+    def verdict(ok: bool, score: Optional[int], ticks: int, reason: str = "") -> Verdict:
+        return Verdict(ok, replay.game, replay.score, score, ticks, reason, replay.daily if ok else None)
+
+    if game is not None and replay.game != game:
+        return verdict(False, None, 0, f"replay is for {replay.game}")
+    if tick_rate is not None and replay.tick_rate != tick_rate:
+        return verdict(False, None, 0, f"tick rate {replay.tick_rate}, expected {tick_rate}")
+    if replay.ticks > MAX_RUN_SECONDS * replay.tick_rate:
+        return verdict(False, None, 0, "run too long")
+    if replay.daily is not None:
+        now = now or dt.datetime.now(dt.timezone.utc)
+        if not daily_open(replay.daily, replay.ticks / replay.tick_rate, now):
+            return verdict(False, None, 0, f"daily challenge of {replay.daily} closed at {now:%Y-%m-%d %H:%M} UTC")
+        if replay.seed != daily_seed(replay.game, replay.daily)[0]:
+            return verdict(False, None, 0, f"seed {replay.seed} is not the {replay.daily} daily challenge's")
+    try:
+        run = replay_run(replay)
+    except _Rejected as exc:
+        return verdict(False, None, 0, str(exc))
+    score = run.result().score
+    if run.running:
+        return verdict(False, score, run.ticks, f"run still going at tick {run.ticks}")
+    if run.ticks != replay.ticks:
+        return verdict(False, score, run.ticks, f"run ended at tick {run.ticks}, claimed {replay.ticks}")
+    if abs(score - replay.score) > tolerance:
+        return verdict(False, score, run.ticks, f"score {score}, claimed {replay.score}")
+    return verdict(True, score, run.ticks)
+
+
+class ReplayVerifier:
+    """verify() on a process pool behind a bounded queue, for the Streamlit pages (one per process)."""
+
+    def __init__(self, workers: int = 2, max_pending: int = 256, tolerance: int = 0) -> None:
+        # spawn: forking a threaded server process is unsafe, and the workers only need the engines
+        self._pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._finished: deque[float] = deque(maxlen=512)  # completion times, for runs_per_sec
+        self.tolerance = tolerance
+        self.pending = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.dropped = 0  # queue full
+
+    def submit(
+        self,
+        packed: str,
+        callback: Optional[Callable[[Verdict], None]] = None,
+        *,
+        game: Optional[str] = None,
+        tick_rate: Optional[int] = None,
+    ) -> Optional[Future]:
+        """Queue one replay; ``callback(verdict)`` runs on a pool thread when it is judged."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.dropped += 1
+            return None
+        with self._lock:
+            self.pending += 1
+        future = self._pool.submit(verify, packed, self.tolerance, game, tick_rate)
+        future.add_done_callback(lambda f: self._done(f, callback))
+        return future
+
+    def _done(self, future: Future, callback: Optional[Callable[[Verdict], None]]) -> None:
+        self._slots.release()
+        exc = future.exception()
+        verdict = future.result() if exc is None else Verdict(False, "", 0, None, 0, f"verifier failed: {exc!r}")
+        with self._lock:
+            self.pending -= 1
+            if verdict.ok:
+                self.accepted += 1
+            else:
+                self.rejected += 1
+            self._finished.append(time.monotonic())
+        if callback is not None:
+            callback(verdict)
+
+    def runs_per_sec(self) -> float:
+        """Throughput over the last (up to 512) verified runs."""
+        with self._lock:
+            finished = list(self._finished)
+        if len(finished) < 2 or finished[-1] == finished[0]:
+            return 0.0
+        return (len(finished) - 1) / (finished[-1] - finished[0])
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "pending": self.pending,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "dropped": self.dropped,
+            "runs_per_sec": round(self.runs_per_sec(), 1),
+        }
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+# -- bot replays (CLI throughput check) ------------------------------------
+
+
+def _f32(value: float) -> float:
+    return struct.unpack("<f", struct.pack("<f", value))[0]
+
+
+def bot_replay(game: str, seed: int, policy: Optional[str] = None) -> str:
+    """Play one seeded run with a bots.py policy, logging its inputs like the page does."""
+    bot = BOTS[game]
+    decide = bot.policies[policy or bot.default_policy]
+    run = bot.new(seed)
+    events: list[tuple[int, int, float]] = []
+    while run.running:
+        action = decide(run)
+        if game == "catch":
+            if action is not None and _f32(action) != run.player_vx:
+                run.set_velocity(_f32(action))
+                events.append((run.ticks, VELOCITY, run.player_vx))
+        elif action and run.on_ground:
+            run.jump()
+            events.append((run.ticks, JUMP, 0.0))
+        run.step()
+    return encode(Replay(game, seed, run.ticks, run.result().score, round(1 / run.dt), None, events))
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure replay verification throughput on bot replays.")
+    parser.add_argument("--game", choices=sorted(BOTS), default="catch")
+    parser.add_argument("--policy", help="bots.py policy playing the runs (default: the game's default)")
+    parser.add_argument("--runs", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None, help="verifier processes (default: CPU count)")
+    parser.add_argument("--max-pending", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    seeds = range(args.seed, args.seed + args.runs)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        replays = list(pool.map(bot_replay, [args.game] * args.runs, seeds, [args.policy] * args.runs, chunksize=16))
+    size = sum(len(r) for r in replays) / len(replays)
+    print(f"{args.runs} {args.game} replays, {size:.0f} base64 chars on average")
+
+    verifier = ReplayVerifier(args.workers or multiprocessing.cpu_count(), args.max_pending)
+    done = threading.Semaphore(0)
+    started = time.perf_counter()
+    for packed in replays:
+        while verifier.submit(packed, lambda verdict: done.release()) is None:
+            time.sleep(0.001)  # queue full: back off until a slot frees up
+    for _ in replays:
+        done.acquire()
+    seconds = time.perf_counter() - started
+    verifier.close()
+    stats = verifier.stats()
+    print(f"accepted {stats['accepted']}, rejected {stats['rejected']} in {seconds:.2f} s: {args.runs / seconds:.1f} runs/s")
+
+
+if __name__ == "__main__":
+    main()
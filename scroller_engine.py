@@ -0,0 +1,196 @@
+"""
+Headless rules engine for the side-scroller (side_scroller.py / assets/side_scroller/game.js).
+- Mirrors the JS update() / spawnObstacle() / sweptHit() tick: gravity jump, obstacle queue,
+  distance score and the swept collision test
+- Seeded mulberry32 in place of Math.random; a daily schedule (obstacle sizes, see
+  daily_challenge.py) is taken in order first, exactly as the page does
+- No canvas, HUD or best-score storage: only the state that decides when a run ends
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+from catch_engine import Mulberry32
+
+WIDTH = 820
+HEIGHT = 420
+GROUND_Y = HEIGHT - 60
+TICK_RATE = 60
+PLAYER_X = 100
+PLAYER_SIZE = 30
+GRAVITY = 28  # px per 60 Hz frame, per second
+JUMP_VY = -11
+OBSTACLE_CAPACITY = 32  # the page's ring buffer drops the oldest obstacle when full
+
+
+class Obstacle:
+    __slots__ = ("x", "px", "y", "w", "h", "speed")
+
+    def __init__(self, x: float, y: float, w: float, h: float, speed: float) -> None:
+        self.x = x
+        self.px = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.speed = speed
+
+
+@dataclass
+class RunResult:
+    seed: int
+    score: int
+    time: float
+    ticks: int
+    jumps: int
+    obstacles: int  # spawned during the run
+
+
+Policy = Callable[["ScrollerGame"], bool]
+
+
+class ScrollerGame:
+    """One side-scroller run, advanced with :meth:`step` at a fixed ``tick_rate``."""
+
+    def __init__(
+        self,
+        seed: int = 0,
+        tick_rate: int = TICK_RATE,
+        schedule: Optional[Sequence[tuple[float, float]]] = None,
+    ) -> None:
+        self.seed = seed
+        self.rng = Mulberry32(seed)
+        self.dt = 1.0 / tick_rate
+        self.schedule = schedule  # (height, width) per obstacle, daily challenge
+        self.reset()
+
+    def reset(self) -> None:
+        if self.schedule is not None:  # a daily run restarts from the top of the day
+            self.rng = Mulberry32(self.seed)
+        self.next_obstacle = 0
+        self.player_y = float(GROUND_Y)
+        self.player_py = float(GROUND_Y)
+        self.player_vy = 0.0
+        self.on_ground = True
+        self.obstacles: deque[Obstacle] = deque(maxlen=OBSTACLE_CAPACITY)
+        self.running = True
+        self.spawn_timer = 0.0
+        self.score = 0.0
+        self.speed_base = 4
+        self.time = 0.0
+        self.ticks = 0
+        self.jumps = 0
+        self.spawned = 0
+
+    # -- input -------------------------------------------------------------
+
+    def jump(self) -> None:
+        if self.running and self.on_ground:
+            self.player_vy = JUMP_VY
+            self.on_ground = False
+            self.jumps += 1
+
+    # -- rules -------------------------------------------------------------
+
+    def spawn_obstacle(self) -> None:
+        schedule = self.schedule
+        if schedule is not None and self.next_obstacle < len(schedule):
+            h, w = schedule[self.next_obstacle]
+            self.next_obstacle += 1
+        else:
+            h = 20 + self.rng.random() * 50
+            w = 20 + self.rng.random() * 40
+        speed = self.speed_base + min(self.score / 300, 6)
+        self.obstacles.append(Obstacle(WIDTH + 10, GROUND_Y + (30 - h), w, h, speed))
+        self.spawned += 1
+
+    def swept_hit(self, o: Obstacle) -> bool:
+        """The JS sweptHit(): does the player's move this tick meet the obstacle's?"""
+        sx, sy = PLAYER_X - o.px, self.player_py - o.y
+        dx, dy = o.px - o.x, self.player_y - self.player_py
+        enter, exit_ = 0.0, 1.0
+        for s, d, size, extent in ((sx, dx, PLAYER_SIZE, o.w), (sy, dy, PLAYER_SIZE, o.h)):
+            if d == 0:
+                if s <= -size or s >= extent:
+                    return False
+                continue
+            t0, t1 = (-size - s) / d, (extent - s) / d
+            if t0 > t1:
+                t0, t1 = t1, t0
+            enter = max(enter, t0)
+            exit_ = min(exit_, t1)
+        return enter < exit_
+
+    def step(self, dt: Optional[float] = None) -> None:
+        """Advance one tick: the page's snapshot() followed by update(dt)."""
+        if dt is None:
+            dt = self.dt
+        self.time += dt
+        self.ticks += 1
+        self.player_py = self.player_y
+        obstacles = self.obstacles
+        for o in obstacles:
+            o.px = o.x
+
+        self.player_vy += GRAVITY * dt
+        self.player_y += self.player_vy * 60 * dt
+        if self.player_y > GROUND_Y:
+            self.player_y = GROUND_Y
+            self.player_vy = 0
+            self.on_ground = True
+
+        self.spawn_timer -= dt
+        if self.spawn_timer <= 0:
+            self.spawn_obstacle()
+            self.spawn_timer = 1.1 - min(self.score / 500, 0.7)
+        for o in obstacles:
+            o.x -= o.speed * 60 * dt
+        while obstacles and obstacles[0].x + obstacles[0].w <= -20:
+            obstacles.popleft()
+        self.score += dt * 100
+
+        left, right = PLAYER_X, PLAYER_X + PLAYER_SIZE
+        for o in obstacles:
+            if o.px + o.w <= left:
+                continue
+            if o.x >= right:
+                break
+            if self.swept_hit(o):
+                self.running = False
+                break
+
+    # -- drivers -----------------------------------------------------------
+
+    def run(self, policy: Optional[Policy] = None, max_time: float = 600.0) -> RunResult:
+        """Play until a collision (or ``max_time`` sim seconds); ``policy(game)`` returns True to jump."""
+        max_ticks = int(round(max_time / self.dt))
+        step = self.step
+        while self.running and self.ticks < max_ticks:
+            if policy is not None and policy(self):
+                self.jump()
+            step()
+        return self.result()
+
+    def result(self) -> RunResult:
+        return RunResult(
+            seed=self.seed,
+            score=math.floor(self.score + 0.5),  # Math.round, like the reported score
+            time=self.time,
+            ticks=self.ticks,
+            jumps=self.jumps,
+            obstacles=self.spawned,
+        )
+
+
+def simulate(
+    seed: int,
+    policy: Optional[Policy] = None,
+    tick_rate: int = TICK_RATE,
+    max_time: float = 600.0,
+    schedule: Optional[Sequence[tuple[float, float]]] = None,
+) -> RunResult:
+    """Run one seeded game to completion and return its summary."""
+    return ScrollerGame(seed, tick_rate, schedule).run(policy, max_time)
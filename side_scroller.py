@@ -1,159 +1,79 @@
 import streamlit as st
-from streamlit.components.v1 import html
 
-
-st.set_page_config(page_title="Side Scroller - 障害物を避けるゲーム", page_icon="🏃", layout="centered")
-
-st.title("横スクロール障害物ゲーム (Python + Streamlit)")
-st.caption("スペース / ↑ でジャンプ。障害物を避け続けてスコアを伸ばそう。Enter でリスタート。")
-
-game_html = """
-<style>
-  body { margin: 0; background: #0d1117; color: #e6edf3; font-family: 'Segoe UI', sans-serif; }
-  #wrap { display: flex; flex-direction: column; align-items: center; gap: 8px; padding: 8px; }
-  canvas { background: linear-gradient(180deg, #0f172a 0%, #111827 70%, #0f172a 100%); border: 1px solid #1f2937; border-radius: 10px; box-shadow: 0 8px 24px rgba(0,0,0,0.35); }
-  .hud { display: flex; gap: 12px; font-size: 14px; }
-  .btn { background: #2563eb; color: white; border: none; border-radius: 6px; padding: 6px 12px; cursor: pointer; }
-  .btn:active { transform: translateY(1px); }
-</style>
-<div id="wrap">
-  <div class="hud">
-    <div>Score: <span id="score">0</span></div>
-    <div>Best: <span id="best">0</span></div>
-    <button class="btn" id="restart">Restart</button>
-  </div>
-  <canvas id="game" width="820" height="420"></canvas>
-  <div style="font-size:13px; color:#9ca3af;">Space/ArrowUp: Jump ・ Enter/Restart: 再開 ・ 徐々に速くなるのでタイミング勝負</div>
-</div>
-<script>
-(() => {
-  const canvas = document.getElementById("game");
-  const ctx = canvas.getContext("2d");
-  const scoreEl = document.getElementById("score");
-  const bestEl = document.getElementById("best");
-  const restartBtn = document.getElementById("restart");
-  const groundY = canvas.height - 60;
-  let player, obstacles, running, last, spawnTimer, score, best, speedBase;
-
-  function reset() {
-    player = { x: 100, y: groundY, w: 30, h: 30, vy: 0, onGround: true };
-    obstacles = [];
-    running = true;
-    last = performance.now();
-    spawnTimer = 0;
-    score = 0;
-    speedBase = 4;
-    renderHUD();
-  }
-
-  function loadBest() {
-    const stored = localStorage.getItem("sideScrollerBest");
-    best = stored ? Number(stored) : 0;
-    bestEl.textContent = best.toFixed(0);
-  }
-
-  function saveBest() {
-    localStorage.setItem("sideScrollerBest", String(best));
-  }
-
-  function jump() {
-    if (!running) return;
-    if (player.onGround) {
-      player.vy = -11;
-      player.onGround = false;
-    }
-  }
-
-  function spawnObstacle() {
-    const h = 20 + Math.random() * 50;
-    const w = 20 + Math.random() * 40;
-    const gap = 120 + Math.random() * 120;
-    const speed = speedBase + Math.min(score / 300, 6);
-    obstacles.push({ x: canvas.width + 10, y: groundY + (30 - h), w, h, speed, gap });
-  }
-
-  function update(dt) {
-    // gravity
-    player.vy += 28 * dt;
-    player.y += player.vy;
-    if (player.y > groundY) {
-      player.y = groundY;
-      player.vy = 0;
-      player.onGround = true;
-    }
-    // obstacles
-    spawnTimer -= dt;
-    if (spawnTimer <= 0) {
-      spawnObstacle();
-      spawnTimer = 1.1 - Math.min(score / 500, 0.7);
-    }
-    obstacles.forEach(o => { o.x -= o.speed * 60 * dt; });
-    obstacles = obstacles.filter(o => o.x + o.w > -20);
-    // scoring
-    score += dt * 100;
-    if (score > best) { best = score; saveBest(); }
-    renderHUD();
-    // collisions
-    for (const o of obstacles) {
-      if (player.x < o.x + o.w && player.x + player.w > o.x && player.y < o.y + o.h && player.y + player.h > o.y) {
-        running = false;
-      }
-    }
-  }
-
-  function renderHUD() {
-    scoreEl.textContent = score.toFixed(0);
-    bestEl.textContent = best.toFixed(0);
-  }
-
-  function draw() {
-    ctx.clearRect(0, 0, canvas.width, canvas.height);
-    // ground
-    ctx.fillStyle = "#1f2937";
-    ctx.fillRect(0, groundY + 30, canvas.width, 60);
-    ctx.fillStyle = "#374151";
-    ctx.fillRect(0, groundY + 25, canvas.width, 5);
-    // player
-    ctx.fillStyle = running ? "#22d3ee" : "#ef4444";
-    ctx.fillRect(player.x, player.y - player.h, player.w, player.h);
-    // obstacles
-    ctx.fillStyle = "#f97316";
-    obstacles.forEach(o => {
-      ctx.fillRect(o.x, o.y - o.h, o.w, o.h);
-    });
-    // text on game over
-    if (!running) {
-      ctx.fillStyle = "rgba(0,0,0,0.45)";
-      ctx.fillRect(0, 0, canvas.width, canvas.height);
-      ctx.fillStyle = "#e5e7eb";
-      ctx.font = "bold 28px 'Segoe UI'";
-      ctx.textAlign = "center";
-      ctx.fillText("Game Over - Enter で再開", canvas.width / 2, canvas.height / 2);
-    }
-  }
-
-  function loop(timestamp) {
-    const dt = Math.min((timestamp - last) / 1000, 0.05);
-    if (running) {
-      update(dt);
-    }
-    draw();
-    last = timestamp;
-    requestAnimationFrame(loop);
-  }
-
-  document.addEventListener("keydown", (e) => {
-    if (e.code === "Space" || e.code === "ArrowUp") jump();
-    if (e.code === "Enter" && !running) reset();
-  });
-  restartBtn.addEventListener("click", reset);
-  canvas.addEventListener("pointerdown", () => jump());
-
-  loadBest();
-  reset();
-  requestAnimationFrame(loop);
-})();
-</script>
-"""
-
-html(game_html, height=520, scrolling=False)
+from daily_challenge import daily_config, today
+from game_assets import GAMES
+from game_component import game_component
+from game_profile import log_profile, phase_table
+from leaderboard import Leaderboard
+from replay_verifier import ReplayVerifier
+
+GAME = GAMES["side_scroller"]
+GAME_CONFIG = GAME.config  # tick rate, HUD rate: see game_assets.GAMES
+_daily_config = st.cache_data(show_spinner=False)(daily_config)  # one build per game and day
+_leaderboard = st.cache_resource(show_spinner=False)(Leaderboard)  # one writer thread per process
+_verifier = st.cache_resource(show_spinner=False)(ReplayVerifier)  # one process pool per process
+
+st.set_page_config(page_title=GAME.page_title, page_icon=GAME.page_icon, layout="centered")
+
+st.title(GAME.title)
+st.caption(GAME.caption)
+
+player = st.text_input("名前", max_chars=24, placeholder="anonymous", help="ランキングに表示されます")
+daily = st.toggle("デイリーチャレンジ", help="今日 (UTC) は全員が同じ障害物の並びで遊びます")
+config = GAME_CONFIG
+if daily:
+    config = {**GAME_CONFIG, "daily": _daily_config("side_scroller", today())}
+    st.caption(f"デイリーチャレンジ {config['daily']['date']}")
+profiling = st.sidebar.toggle("プロファイラ", help="処理ごとの時間・フレームグラフ・パーセンタイルをキャンバスに表示し、2 秒ごとに集計を送ります")
+if profiling:
+    config = {**config, "profile": True}
+autoplay = st.query_params.get("autoplay")  # soak runs: ?autoplay=jumper (or idle), see bots.py
+if autoplay:
+    config = {**config, "autoplay": autoplay}
+
+game_state = game_component("side_scroller", config, height=GAME.height, key="side-scroller")
+if game_state and not game_state["running"]:
+    st.caption(f"前回のスコア: {game_state['score']} (ベスト {game_state['best']})")
+board = _leaderboard()
+if game_state and not autoplay:
+    # submit on the running -> game-over transition only; reruns keep reporting the finished run
+    if st.session_state.get("side-scroller-running") and not game_state["running"] and game_state.get("replay"):
+        # only a score the server re-simulates from the run's input log reaches the board
+        def _record(verdict, player=player):
+            if verdict.ok:  # the daily board comes from the checked replay, not from the page's report
+                daily = verdict.daily.isoformat() if verdict.daily else None
+                board.submit("side_scroller", player, verdict.score, daily=daily)
+
+        _verifier().submit(game_state["replay"], _record, game="side_scroller", tick_rate=GAME_CONFIG["tickRate"])
+        st.caption("スコアを検証中")
+    st.session_state["side-scroller-running"] = game_state["running"]
+if game_state and game_state.get("soak"):
+    soak = game_state["soak"]
+    heap = "ヒープ n/a" if soak["heapMB"] is None else f"ヒープ {soak['heapMB']} MB"
+    if soak["heapGrowthPerRunMB"] is not None:
+        heap += f" (1 回あたり {soak['heapGrowthPerRunMB']:+} MB)"
+    st.caption(f"ソーク ({autoplay}): {soak['runs']} 回, {soak['fps']} fps, 最大 {soak['peak']}, {heap}")
+
+st.subheader("ランキング")
+left, right = st.columns(2)
+if daily:
+    left.caption(f"デイリーチャレンジ {config['daily']['date']}")
+    left.dataframe(board.top("side_scroller", 10, day=config["daily"]["date"], daily=True), hide_index=True)
+else:
+    left.caption("歴代")
+    left.dataframe(board.top("side_scroller", 10), hide_index=True)
+right.caption("今日 (UTC)")
+right.dataframe(board.top("side_scroller", 10, day=today().isoformat()), hide_index=True)
+verifier = _verifier().stats()
+st.caption(
+    f"検証済み: 承認 {verifier['accepted']} / 却下 {verifier['rejected']} / 待ち {verifier['pending']} "
+    f"({verifier['runs_per_sec']} 回/秒)"
+)
+if profiling and game_state and game_state.get("profile"):
+    profile = game_state["profile"]
+    st.session_state["side-scroller-profile-seq"] = log_profile("side_scroller", profile, st.session_state.get("side-scroller-profile-seq"))
+    frames = profile["frames"]
+    st.sidebar.caption(
+        f"フレーム: p50 {frames['p50']} / p95 {frames['p95']} / p99 {frames['p99']} ms ({profile['seconds']} 秒間)"
+    )
+    st.sidebar.dataframe(phase_table(profile), hide_index=True)
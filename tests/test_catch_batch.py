@@ -0,0 +1,52 @@
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from catch_batch import POLICIES, run_batch
+from catch_engine import KEY_SPEED, CatchGame, Tuning, simulate
+
+SEEDS = [1, 2, 3, 42, 2026]
+
+
+def tracker(game: CatchGame) -> Optional[float]:
+    """Scalar twin of catch_batch.tracker_policy: chase the lowest drop on screen."""
+    if not game.drops:
+        return 0.0
+    lowest = max(game.drops, key=lambda drop: drop.y)  # first of equals, like argmax
+    centre = game.player_x + 18
+    target = lowest.x + 6
+    if target > centre + 4:
+        return KEY_SPEED
+    if target < centre - 4:
+        return -KEY_SPEED
+    return 0.0
+
+
+SCALAR = {"idle": None, "tracker": tracker}
+
+
+@pytest.mark.parametrize("policy", sorted(SCALAR))
+def test_batch_rows_match_scalar_games(policy):
+    batch = run_batch(SEEDS, POLICIES[policy], max_time=60.0)
+    for row, seed in enumerate(SEEDS):
+        game = simulate(seed, SCALAR[policy], max_time=60.0)
+        assert batch.score[row] == game.score, seed
+        assert batch.lives[row] == game.lives, seed
+        assert batch.catches[row] == game.catches, seed
+        assert batch.misses[row] == game.misses, seed
+        assert batch.missions[row] == game.missions, seed
+        assert batch.time[row] == pytest.approx(game.time), seed
+
+
+def test_tuning_reaches_both_engines():
+    tuning = Tuning(spawn_base=1.5)
+    batch = run_batch(SEEDS[:2], POLICIES["tracker"], tuning, max_time=30.0)
+    for row, seed in enumerate(SEEDS[:2]):
+        assert batch.score[row] == simulate(seed, tracker, max_time=30.0, tuning=tuning).score
+
+
+def test_curve_keeps_the_final_score_after_game_over():
+    batch = run_batch(SEEDS, POLICIES["idle"], max_time=60.0, sample_every=10.0)
+    assert batch.curve.shape == (len(SEEDS), 6)
+    assert np.array_equal(batch.curve[:, -1], batch.score)
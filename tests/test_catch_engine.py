@@ -0,0 +1,58 @@
+from typing import Optional
+
+import pytest
+
+from catch_engine import KEY_SPEED, CatchGame, Mulberry32, simulate
+
+
+def chase(game: CatchGame) -> Optional[float]:
+    """Steer towards the lowest drop on screen (None: keep the current velocity)."""
+    if not game.drops:
+        return 0.0
+    lowest = max(game.drops, key=lambda drop: drop.y)
+    centre = game.player_x + 18
+    target = lowest.x + 6
+    if target > centre + 4:
+        return KEY_SPEED
+    if target < centre - 4:
+        return -KEY_SPEED
+    return 0.0
+
+
+@pytest.mark.parametrize(
+    "seed, expected",
+    [
+        (0, [0.26642920868471265, 0.0003297457005828619, 0.2232720274478197]),
+        (1, [0.6270739405881613, 0.002735721180215478, 0.5274470399599522]),
+        (123456789, [0.2577907438389957, 0.9707721115555614, 0.7853280142880976]),
+    ],
+)
+def test_mulberry32_reference_values(seed, expected):
+    rng = Mulberry32(seed)
+    assert [rng.random() for _ in range(3)] == expected
+
+
+def test_same_seed_and_inputs_give_the_same_run():
+    assert simulate(7, chase) == simulate(7, chase)
+
+
+def test_seed_changes_the_run():
+    assert simulate(7, chase) != simulate(8, chase)
+
+
+def test_idle_run_loses_every_life():
+    result = simulate(1)
+    assert result.lives == 0
+    assert result.catches == 0
+    assert result.ticks > 0
+
+
+def test_max_time_stops_a_running_game():
+    game = CatchGame(3)
+    result = game.run(chase, max_time=5.0)
+    assert game.running
+    assert result.ticks == 300
+
+
+def test_chasing_scores_points():
+    assert simulate(3, chase).score > 0
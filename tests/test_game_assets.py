@@ -0,0 +1,104 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from game_assets import GAMES, build_bundle, minify_css, minify_js, render_index, write_bundle
+
+NODE = shutil.which("node")
+needs_node = pytest.mark.skipif(NODE is None, reason="node not installed")
+
+
+def run_js(src: str) -> str:
+    """stdout of ``src`` under node (the snippets print their result)."""
+    return subprocess.run([NODE, "-e", src], capture_output=True, text=True, check=True).stdout
+
+
+@pytest.mark.parametrize(
+    "src, expected",
+    [
+        ("const a = 1 ;  // note\nlet b = [ a , 2 ];", "const a=1;let b=[a,2];\n"),
+        ("/* block */ f( x )", "f(x)\n"),
+        ("a + +b; c - -d; e = f / /g/.source.length", "a+ +b;c- -d;e=f/ /g/.source.length\n"),
+        ("let s = 'it\\'s // not a comment /* nor this */'", "let s='it\\'s // not a comment /* nor this */'\n"),
+        ("t = `${ {a: 1}.a } // ${ \"}\" }`", "t=`${ {a: 1}.a } // ${ \"}\" }`\n"),
+        ("const r = /ab\"c/g; f();", "const r=/ab\"c/g;f();\n"),
+        ("x = s.replace(/\\/\\/|\\/\\*/g, '')", "x=s.replace(/\\/\\/|\\/\\*/g,'')\n"),
+        ("ok = /[/'\"]/.test(s)", "ok=/[/'\"]/.test(s)\n"),
+        ("return /x/i.test(y)", "return/x/i.test(y)\n"),
+        ("y = (a) / 2 / b[1] / c", "y=(a)/2/b[1]/c\n"),
+    ],
+    ids=["whitespace", "block-comment", "unary", "string", "template", "regex-quote", "regex-comment",
+         "regex-class", "regex-keyword", "division"],
+)
+def test_minify_js(src, expected):
+    assert minify_js(src) == expected
+
+
+@pytest.mark.parametrize(
+    "src",
+    ["let a = b\n(c)", "x = 1\n[1, 2].forEach(f)", "function f() {\n  return\n  42\n}", "i\n++\nj", "a = b\n+c"],
+    ids=["call", "index", "return", "increment", "plus"],
+)
+def test_minify_js_keeps_newlines_that_asi_depends_on(src):
+    assert "\n" in minify_js(src).rstrip("\n")
+
+
+@pytest.mark.parametrize("src", ["let s = 'open", "r = /open\n", "t = `${ open"])
+def test_minify_js_rejects_unterminated_literals(src):
+    with pytest.raises(ValueError):
+        minify_js(src)
+
+
+@needs_node
+def test_minified_js_behaves_the_same():
+    src = """
+    const re = /"(\\d+)"\\/\\/[/*]/g; // a regex full of comment and quote characters
+    function f(a, b) {
+      return a / b / 2
+    }
+    let i = 1
+    let j = i
+    ++j
+    const out = [f(8, 2), i, j, `${ {k: "}"}.k }`, '/*x*/', "a//b".split(/\\//).length]
+    out.push('"12"//*'.replace(re, "$1"))
+    console.log(JSON.stringify(out))
+    """
+    assert run_js(minify_js(src)) == run_js(src)
+
+
+def test_minify_css():
+    src = "/* theme */\n.a  >  .b ,\n.c {\n  color: red ;\n  margin: 0 auto;\n}\n"
+    assert minify_css(src) == ".a>.b,.c{color:red;margin:0 auto}\n"
+
+
+@pytest.mark.parametrize("name", sorted(GAMES))
+def test_build_bundle(name, tmp_path):
+    bundle = build_bundle(name)
+    assert bundle == build_bundle(name)  # deterministic, so the digest is a cache key
+    raw = build_bundle(name, minify=False)
+    assert len(bundle.js) < len(raw.js)
+    assert raw.digest != bundle.digest
+    assert bundle.js_file == f"{name}.{bundle.digest}.js"
+    assert bool(bundle.worker_js) == bool(GAMES[name].worker)
+
+    page = render_index(bundle, {"tickRate": 60, "note": "</script>"})
+    assert f'href="{bundle.css_file}"' in page and f'src="{bundle.js_file}"' in page
+    assert "</script>\"" not in page
+    config = page.split("window.GAME_CONFIG = ", 1)[1].split(";", 1)[0]
+    assert json.loads(config.replace("<\\/", "</")) == {"note": "</script>", "tickRate": 60}
+
+    write_bundle(bundle, tmp_path)
+    assert (tmp_path / bundle.js_file).read_text(encoding="utf-8") == bundle.js
+    assert (tmp_path / bundle.css_file).read_text(encoding="utf-8") == bundle.css
+
+
+@needs_node
+@pytest.mark.parametrize("name", sorted(GAMES))
+def test_minified_bundles_parse(name, tmp_path):
+    bundle = build_bundle(name)
+    for text in filter(None, (bundle.js, bundle.worker_js)):
+        path = tmp_path / "bundle.js"
+        path.write_text(text, encoding="utf-8")
+        subprocess.run([NODE, "--check", str(path)], check=True, capture_output=True)
@@ -0,0 +1,58 @@
+import base64
+import struct
+from array import array
+
+import pytest
+
+import ghost_codec
+from ghost_codec import INTERVAL, MAX_SAMPLES, SCALE, Ghost, GhostFormatError, decode, encode
+
+
+def ghost(n: int, score: int = 1234) -> Ghost:
+    return Ghost(array("f", (30 + (k * 7.3) % 350 for k in range(n))), INTERVAL, score)
+
+
+def test_round_trip_within_quantisation():
+    original = ghost(500)
+    restored = decode(encode(original))
+    assert restored.score == original.score
+    assert restored.interval == pytest.approx(original.interval)
+    assert len(restored.xs) == len(original.xs)
+    for a, b in zip(original.xs, restored.xs):
+        assert abs(a - b) <= 0.5 / SCALE
+
+
+def test_encoding_is_stable():
+    packed = encode(ghost(500))
+    assert encode(decode(packed)) == packed
+
+
+def test_long_runs_are_downsampled():
+    original = ghost(MAX_SAMPLES * 2 + 10)
+    restored = decode(encode(original))
+    assert len(restored.xs) <= MAX_SAMPLES
+    assert restored.interval == pytest.approx(INTERVAL * 4)
+    assert restored.duration == pytest.approx(original.duration, abs=4 * INTERVAL)
+    assert restored.xs[1] == pytest.approx(original.xs[4], abs=0.5 / SCALE)
+
+
+def test_x_at_interpolates_and_clamps():
+    g = Ghost(array("f", [0.0, 10.0, 20.0]), 0.5, 0)
+    assert g.x_at(0.25) == pytest.approx(5.0)
+    assert g.x_at(10.0) == 20.0
+
+
+@pytest.mark.parametrize(
+    "packed",
+    [
+        "not base64!",
+        base64.b64encode(b"\x01\x10").decode(),
+        base64.b64encode(struct.pack("<BBHfI", 9, SCALE, 1, INTERVAL, 0) + b"\0\0").decode(),
+        base64.b64encode(struct.pack("<BBHfI", ghost_codec.VERSION, SCALE, 4, INTERVAL, 0) + b"\0\0").decode(),
+        base64.b64encode(struct.pack("<BBHfI", ghost_codec.VERSION, 0, 1, INTERVAL, 0) + b"\0\0").decode(),
+    ],
+    ids=["base64", "header", "version", "truncated", "scale"],
+)
+def test_bad_ghosts_raise(packed):
+    with pytest.raises(GhostFormatError):
+        decode(packed)
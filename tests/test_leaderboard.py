@@ -0,0 +1,84 @@
+import datetime as dt
+import threading
+
+import pytest
+
+from leaderboard import NAME_LIMIT, Leaderboard
+
+
+@pytest.fixture
+def board(tmp_path):
+    board = Leaderboard(tmp_path / "scores.sqlite3", readers=2, cache_ttl=0.0)
+    yield board
+    board.close()
+
+
+def test_flush_then_top_ranks_by_score(board):
+    for player, score in [("ann", 30), ("bob", 50), ("cy", 10), ("dee", 40)]:
+        assert board.submit("catch", player, score, day=dt.date(2026, 10, 1))
+    board.flush()
+    top = board.top("catch", 3)
+    assert [(r.rank, r.player, r.score) for r in top] == [(1, "bob", 50), (2, "dee", 40), (3, "ann", 30)]
+    assert top[0].day == "2026-10-01"
+    assert board.stats() == {"pending": 0, "written": 4, "dropped": 0}
+
+
+def test_games_days_and_daily_runs_are_kept_apart(board):
+    board.submit("catch", "ann", 10, day=dt.date(2026, 10, 1))
+    board.submit("catch", "bob", 20, day=dt.date(2026, 10, 2))
+    board.submit("catch", "cy", 30, daily="2026-10-02")
+    board.submit("side_scroller", "dee", 40, day=dt.date(2026, 10, 2))
+    board.flush()
+    assert [r.player for r in board.top("catch")] == ["bob", "ann"]
+    assert [r.player for r in board.top("catch", day="2026-10-02")] == ["bob"]
+    assert [r.player for r in board.top("catch", day="2026-10-02", daily=True)] == ["cy"]
+    assert [r.player for r in board.top("side_scroller")] == ["dee"]
+
+
+def test_names_are_trimmed(board):
+    board.submit("catch", "  ", 1)
+    board.submit("catch", "x" * 100, 2)
+    board.flush()
+    assert [r.player for r in board.top("catch")] == ["x" * NAME_LIMIT, "anonymous"]
+
+
+def test_reads_are_cached_for_cache_ttl(board):
+    board.cache_ttl = 60.0
+    assert board.top("catch") == []
+    board.submit("catch", "ann", 10)
+    board.flush()
+    assert board.top("catch") == []
+    assert [r.player for r in board.top("catch", 5)] == ["ann"]  # another query, another cache entry
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    board = Leaderboard(tmp_path / "scores.sqlite3", readers=1, max_pending=50)
+    threads = [threading.Thread(target=lambda: [board.submit("catch", "p", k) for k in range(500)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    board.flush()
+    stats = board.stats()
+    assert stats["written"] + stats["dropped"] == 2000
+    assert stats["written"] >= 50
+    board.close()
+    assert not board.submit("catch", "late", 1)
+    assert board.stats()["dropped"] == stats["dropped"] + 1
+
+
+
+def test_close_waits_for_a_submit_in_flight(tmp_path):
+    board = Leaderboard(tmp_path / "scores.sqlite3", readers=1)
+    put = board._pending.put_nowait
+    closer = threading.Thread(target=board.close)
+
+    def put_during_close(entry):
+        closer.start()
+        closer.join(timeout=0.3)  # close() finishes here unless it waits for this submit
+        put(entry)
+
+    board._pending.put_nowait = put_during_close
+    assert board.submit("catch", "late", 1)
+    closer.join(timeout=10)
+    assert board.stats() == {"pending": 0, "written": 1, "dropped": 0}
@@ -0,0 +1,154 @@
+import datetime as dt
+import threading
+
+import pytest
+
+from bots import GAMES as BOTS
+from catch_engine import CatchGame
+from daily_challenge import catch_daily, daily_seed, decode_catch, today
+from replay_codec import JUMP, POSITION, VELOCITY, Replay, ReplayFormatError, decode, encode
+from replay_verifier import MAX_SPEED, VERIFY_GRACE, ReplayVerifier, _f32, bot_replay, daily_open, verify
+
+
+def daily_replay(day: dt.date) -> Replay:
+    """A greedy bot's run of ``day``'s catch challenge, logged like the page does."""
+    seed = daily_seed("catch", day)[0]
+    run = CatchGame(seed, schedule=decode_catch(catch_daily(day)))
+    decide = BOTS["catch"].policies["greedy"]
+    events = []
+    while run.running:
+        action = decide(run)
+        if action is not None and _f32(action) != run.player_vx:
+            run.set_velocity(_f32(action))
+            events.append((run.ticks, VELOCITY, run.player_vx))
+        run.step()
+    return Replay("catch", seed, run.ticks, run.result().score, 60, day, events)
+
+
+def test_codec_round_trip():
+    replay = Replay(
+        "catch", 2**32 - 1, 12345, 678, 120, dt.date(2026, 10, 18),
+        [(0, VELOCITY, 250.0), (0, POSITION, 12.5), (300, VELOCITY, -250.0), (100_000, POSITION, 380.0)],
+    )
+    assert decode(encode(replay)) == replay
+    jumps = Replay("side_scroller", 1, 50, 2, 60, None, [(3, JUMP, 0.0), (40, JUMP, 0.0)])
+    assert decode(encode(jumps)) == jumps
+
+
+@pytest.mark.parametrize("packed", ["%%%", encode(Replay("catch", 1, 1, 0))[:8], "AgA8AAEAAAA="])
+def test_codec_rejects_malformed_replays(packed):
+    with pytest.raises(ReplayFormatError):
+        decode(packed)
+
+
+@pytest.mark.parametrize("game", sorted(BOTS))
+@pytest.mark.parametrize("seed", [1, 7, 99])
+def test_bot_replays_verify(game, seed):
+    verdict = verify(bot_replay(game, seed), game=game, tick_rate=60)
+    assert verdict.ok, verdict.reason
+    assert verdict.score == verdict.claimed
+    assert verdict.daily is None
+
+
+def tampered(packed: str, **changes) -> str:
+    replay = decode(packed)
+    for name, value in changes.items():
+        setattr(replay, name, value(replay) if callable(value) else value)
+    return encode(replay)
+
+
+@pytest.mark.parametrize(
+    "changes, reason",
+    [
+        ({"score": lambda r: r.score + 10}, "claimed"),
+        ({"seed": lambda r: r.seed + 1}, ""),
+        ({"ticks": lambda r: r.ticks - 30}, "still going"),
+        ({"ticks": lambda r: r.ticks + 30}, "ended at tick"),
+        ({"events": [(0, VELOCITY, MAX_SPEED * 2)]}, "above"),
+        ({"events": [(0, JUMP, 0.0)]}, "jump"),
+    ],
+    ids=["score", "seed", "short", "long", "speed", "jump"],
+)
+def test_tampered_replays_are_rejected(changes, reason):
+    verdict = verify(tampered(bot_replay("catch", 3), **changes))
+    assert not verdict.ok
+    assert reason in verdict.reason
+
+
+def test_page_pins_game_and_tick_rate():
+    assert "replay is for" in verify(bot_replay("catch", 1), game="side_scroller").reason
+    assert "tick rate" in verify(bot_replay("catch", 1), tick_rate=120).reason
+    assert not verify("not a replay").ok
+
+
+def test_todays_daily_run_is_verified_with_its_date():
+    verdict = verify(encode(daily_replay(today())))
+    assert verdict.ok, verdict.reason
+    assert verdict.daily == today()
+
+
+def test_daily_run_on_another_seed_is_rejected():
+    replay = daily_replay(today())
+    replay.seed += 1
+    verdict = verify(encode(replay))
+    assert not verdict.ok
+    assert "seed" in verdict.reason
+    assert verdict.daily is None
+
+
+def at(day: dt.date, seconds: float) -> dt.datetime:
+    return dt.datetime.combine(day, dt.time.min, tzinfo=dt.timezone.utc) + dt.timedelta(seconds=seconds)
+
+
+def test_yesterdays_daily_run_is_accepted_just_after_midnight():
+    day = dt.date(2026, 10, 17)
+    replay = daily_replay(day)
+    run_seconds = replay.ticks / replay.tick_rate
+    verdict = verify(encode(replay), now=at(day + dt.timedelta(days=1), run_seconds + VERIFY_GRACE - 1))
+    assert verdict.ok, verdict.reason
+    assert verdict.daily == day
+
+
+@pytest.mark.parametrize("days_later, seconds", [(1, 3 * 3600), (2, 60)], ids=["grace-over", "two-days"])
+def test_older_daily_runs_are_rejected(days_later, seconds):
+    day = dt.date(2026, 10, 17)
+    verdict = verify(encode(daily_replay(day)), now=at(day + dt.timedelta(days=days_later), seconds))
+    assert not verdict.ok
+    assert "closed" in verdict.reason
+
+
+def test_daily_grace_keeps_the_seed_check():
+    day = dt.date(2026, 10, 17)
+    replay = daily_replay(day)
+    replay.seed = daily_seed("catch", day + dt.timedelta(days=1))[0]
+    verdict = verify(encode(replay), now=at(day + dt.timedelta(days=1), 60))
+    assert not verdict.ok
+    assert "seed" in verdict.reason
+
+
+def test_verifier_pool_reports_verdicts():
+    verifier = ReplayVerifier(workers=1, max_pending=4)
+    verdicts, done = [], threading.Semaphore(0)
+
+    def record(verdict):
+        verdicts.append(verdict)
+        done.release()
+
+    try:
+        verifier.submit(bot_replay("catch", 5), record)
+        verifier.submit(tampered(bot_replay("catch", 5), score=lambda r: r.score + 1), record)
+        for _ in range(2):
+            assert done.acquire(timeout=60)
+    finally:
+        verifier.close()
+    assert sorted(v.ok for v in verdicts) == [False, True]
+    stats = verifier.stats()
+    assert (stats["accepted"], stats["rejected"], stats["pending"]) == (1, 1, 0)
+
+
+def test_daily_open_window():
+    day = dt.date(2026, 10, 17)
+    assert daily_open(day, 100.0, at(day, 86_399))
+    assert daily_open(day, 100.0, at(day + dt.timedelta(days=1), 100 + VERIFY_GRACE))
+    assert not daily_open(day, 100.0, at(day + dt.timedelta(days=1), 101 + VERIFY_GRACE))
+    assert not daily_open(day, 100.0, at(day - dt.timedelta(days=1), 0))
@@ -0,0 +1,155 @@
+"""
+Monte Carlo tuner for the catch game's difficulty curve (catch_engine.Tuning).
+- Plays many seeded games per grid point with scripted player policies (catch_batch.POLICIES),
+  NumPy-vectorised per chunk of seeds, with the chunks spread over a process pool
+- Every grid point replays the same seeds, so differences between points are not seed noise;
+  the shipped tuning is always included as the baseline row
+- Reports survival-time percentiles, time to first life lost and the median score curve;
+  --json writes the full summaries (survival curve, score percentiles per sample time)
+- Example: python tune_difficulty.py --spawn-base 2.5 3.0 3.5 --spawn-floor 0.3 0.36 --games 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, fields, replace
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from catch_batch import POLICIES, BatchResult, run_batch
+from catch_engine import DEFAULT_TUNING, Tuning
+
+PERCENTILES = (10, 25, 50, 75, 90)
+CURVE_COLUMNS = (60, 120, 180, 300)  # sim seconds shown as median-score columns in the table
+
+
+def grid(axes: dict[str, Sequence[float]]) -> list[Tuning]:
+    """Every combination of the given Tuning field values, the shipped tuning first."""
+    names = list(axes)
+    tunings = [replace(DEFAULT_TUNING, **dict(zip(names, values))) for values in itertools.product(*axes.values())]
+    return [DEFAULT_TUNING] + [t for t in tunings if t != DEFAULT_TUNING]
+
+
+def _run_chunk(tuning: Tuning, policy: str, seeds: np.ndarray, max_time: float, sample_every: float) -> BatchResult:
+    return run_batch(seeds, POLICIES[policy], tuning, max_time, sample_every)
+
+
+def _merge(parts: list[BatchResult]) -> BatchResult:
+    if len(parts) == 1:
+        return parts[0]
+    merged = {f.name: np.concatenate([getattr(p, f.name) for p in parts]) for f in fields(BatchResult)}
+    merged["curve_times"] = parts[0].curve_times
+    return BatchResult(**merged)
+
+
+def _percentiles(values: np.ndarray) -> dict[str, float]:
+    if not len(values):
+        return {f"p{q}": float("nan") for q in PERCENTILES}
+    return {f"p{q}": float(v) for q, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+
+
+def summarize(result: BatchResult, max_time: float) -> dict[str, Any]:
+    """Distribution summary of one grid point x policy."""
+    missed = result.first_miss[~np.isnan(result.first_miss)]
+    over = result.time < max_time
+    times = result.curve_times
+    return {
+        "games": int(len(result.score)),
+        "survival": _percentiles(result.time),
+        "full_run": float(np.mean(~over)),
+        "first_miss": _percentiles(missed),
+        "never_missed": float(1 - len(missed) / len(result.score)),
+        "score_mean": float(result.score.mean()),
+        "score": _percentiles(result.score),
+        "curve": {
+            "time": times.tolist(),
+            "alive": [float(np.mean(~over | (result.time > t))) for t in times],
+            **{f"score_p{q}": np.percentile(result.curve, q, axis=0).tolist() for q in (10, 50, 90)},
+        },
+    }
+
+
+def tune(
+    tunings: Sequence[Tuning],
+    policies: Sequence[str],
+    games: int = 2000,
+    seed: int = 1,
+    max_time: float = 600.0,
+    sample_every: float = 10.0,
+    workers: Optional[int] = None,
+    chunk: int = 500,
+) -> list[dict[str, Any]]:
+    """Run ``games`` seeds for every tuning x policy; returns one summary row per pair, in order."""
+    seeds = np.arange(seed, seed + games)
+    chunks = [seeds[i : i + chunk] for i in range(0, games, chunk)]
+    jobs = [(t, p) for t in tunings for p in policies]
+    if workers == 1:
+        parts = [[_run_chunk(t, p, c, max_time, sample_every) for c in chunks] for t, p in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [[pool.submit(_run_chunk, t, p, c, max_time, sample_every) for c in chunks] for t, p in jobs]
+            parts = [[f.result() for f in row] for row in futures]
+    return [
+        {"tuning": asdict(t), "policy": p, **summarize(_merge(part), max_time)}
+        for (t, p), part in zip(jobs, parts)
+    ]
+
+
+def format_table(rows: list[dict[str, Any]], varied: Sequence[str], max_time: float) -> str:
+    curve_cols = [t for t in CURVE_COLUMNS if t <= max_time]
+    header = (
+        ["policy", *varied, "surv p10", "p50", "p90", "full", "1st miss p50", "score mean", "p50", "p90"]
+        + [f"@{t}s" for t in curve_cols]
+    )
+    lines = []
+    for row in rows:
+        curve = row["curve"]
+        at = {round(t): s for t, s in zip(curve["time"], curve["score_p50"])}
+        baseline = row["tuning"] == asdict(DEFAULT_TUNING)
+        cells = (
+            [row["policy"] + (" *" if baseline else "")]
+            + [f"{row['tuning'][name]:g}" for name in varied]
+            + [f"{row['survival'][q]:.0f}s" for q in ("p10", "p50", "p90")]
+            + [f"{row['full_run']:.0%}", f"{row['first_miss']['p50']:.1f}s", f"{row['score_mean']:.0f}"]
+            + [f"{row['score'][q]:.0f}" for q in ("p50", "p90")]
+            + [f"{at.get(t, float('nan')):.0f}" for t in curve_cols]
+        )
+        lines.append(cells)
+    widths = [max(len(str(c)) for c in col) for col in zip(header, *lines)]
+    fmt = "  ".join(f"{{:>{w}}}" for w in widths)
+    return "\n".join([fmt.format(*header)] + [fmt.format(*cells) for cells in lines] + ["* shipped tuning"])
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Sweep catch-game difficulty knobs over seeded headless games.")
+    for f in fields(Tuning):
+        flag = "--" + f.name.replace("_", "-")
+        parser.add_argument(flag, type=float, nargs="+", metavar="V", help=f"values to try (shipped: {f.default:g})")
+    parser.add_argument("--policy", nargs="+", choices=sorted(POLICIES), default=["tracker", "casual"])
+    parser.add_argument("--games", type=int, default=2000, help="seeded games per grid point and policy")
+    parser.add_argument("--seed", type=int, default=1, help="first seed (games use seed .. seed+games-1)")
+    parser.add_argument("--max-time", type=float, default=600.0, help="sim seconds before a run is cut off")
+    parser.add_argument("--sample-every", type=float, default=10.0, help="score curve resolution, sim seconds")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk", type=int, default=500, help="games per vectorised batch / pool task")
+    parser.add_argument("--json", type=Path, help="also write the full summaries here")
+    args = parser.parse_args(argv)
+
+    axes = {f.name: getattr(args, f.name) for f in fields(Tuning) if getattr(args, f.name)}
+    tunings = grid(axes)
+    print(f"{len(tunings)} tunings x {len(args.policy)} policies x {args.games} games on {args.workers or os.cpu_count()} workers")
+    rows = tune(tunings, args.policy, args.games, args.seed, args.max_time, args.sample_every, args.workers, args.chunk)
+    print(format_table(rows, list(axes), args.max_time))
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=1), encoding="utf-8")
+        print(f"wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()